@@ -52,7 +52,7 @@ class ModelKernelRegistry:
         self._providers[key] = provider
 
     def resolve(self, scheme: str, backend: Any, operation: str) -> Any:
-        backend_name = str(backend.backend_name()).lower()
+        backend_name = backend.backend_name().lower()
         provider = self._providers.get((scheme.lower(), backend_name))
         if provider is None or operation not in provider.operations:
             raise LookupError(
@@ -15,36 +15,55 @@ Public API
 ``CuPyBackend`` : GPU-only backend using CuPy for CUDA acceleration
 """
 
+from typing import TYPE_CHECKING
+
 from .base import BackendBase
 from .numpy_backend import NumpyBackend
 
+if TYPE_CHECKING:
+    from .cupy_backend import CuPyBackend
+    from .numba_backend import NumbaBackend
+    from .torch_backend import TorchBackend
+
 __all__ = [
     # Base protocols
     "BackendBase",
     # Implementations
     "NumpyBackend",
+    "NumbaBackend",
+    "TorchBackend",
+    "CuPyBackend",
 ]
 
-# Optional backends are exposed lazily so that ``import qphase.backend`` works on
-# a minimal numpy + CLI install. The entry-point registry still discovers all
-# backends declared in pyproject.toml regardless of these imports.
-try:
-    from .numba_backend import NumbaBackend  # noqa: F401
-except ImportError:  # pragma: no cover - numba not installed
-    pass
-else:
-    __all__.append("NumbaBackend")
-
-try:
-    from .torch_backend import TorchBackend  # noqa: F401
-except ImportError:  # pragma: no cover - torch not installed
-    pass
-else:
-    __all__.append("TorchBackend")
-
-try:
-    from .cupy_backend import CuPyBackend  # noqa: F401
-except ImportError:  # pragma: no cover - cupy not installed
-    pass
-else:
-    __all__.append("CuPyBackend")
+# Optional backends are exposed lazily (PEP 562) so that ``import qphase.backend``
+# never pulls in numba, torch or cupy; each is imported on first attribute
+# access. Their modules import without the library (it is only required once
+# a backend is used), so all of them stay in ``__all__`` as before. The
+# entry-point registry still discovers all backends declared in pyproject.toml
+# regardless of these imports.
+_LAZY_BACKENDS = {
+    # name: (module, library it runs on)
+    "NumbaBackend": (".numba_backend", "numba"),
+    "TorchBackend": (".torch_backend", "torch"),
+    "CuPyBackend": (".cupy_backend", "cupy"),
+}
+
+
+def __getattr__(name: str):
+    entry = _LAZY_BACKENDS.get(name)
+    if entry is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(entry[0], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    # Advertise only the optional backends whose library is installed; the
+    # check locates the package without importing it.
+    from importlib.util import find_spec
+
+    usable = {name for name, (_, lib) in _LAZY_BACKENDS.items() if find_spec(lib)}
+    return sorted(set(globals()) | usable)
@@ -36,7 +36,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayBase:
     """Backend-agnostic array container.
 
@@ -50,6 +50,10 @@ class ArrayBase:
     """
 
     data: Any
+    # Each container owns a plain mutable dict: callers annotate results in
+    # place (labels, params), so a shared read-only empty mapping cannot be
+    # used as the default. Derived containers copy only non-empty metadata
+    # (see ``_copy_meta``).
     meta: dict = field(default_factory=dict)
 
     @property
@@ -57,6 +61,15 @@ class ArrayBase:
         """Get the array namespace (numpy/cupy/torch-shim) for this state."""
         return get_xp(self.data)
 
+    def _copy_meta(self) -> dict:
+        """Return an independent metadata dict for a derived container.
+
+        Most containers carry no metadata, so the common case allocates a bare
+        ``{}`` instead of going through ``dict.copy``.
+        """
+        meta = self.meta
+        return meta.copy() if meta else {}
+
     def to_numpy(self) -> np.ndarray:
         """Convert data to a NumPy array."""
         return convert_to_numpy(self.data)
@@ -75,7 +88,7 @@ class ArrayBase:
             new_data = copy.deepcopy(self.data)
 
         # Use replace to handle subclasses with extra fields automatically
-        return replace(self, data=new_data, meta=self.meta.copy())
+        return replace(self, data=new_data, meta=self._copy_meta())
 
     def to_backend(self, target_backend: Any) -> "ArrayBase":
         """Convert data to the target backend.
@@ -88,7 +101,8 @@ class ArrayBase:
         Returns
         -------
         ArrayBase
-            A new instance with data on the target backend.
+            A new instance with data on the target backend, or ``self`` when
+            the data already lives there (e.g. numpy -> numpy).
 
         """
         try:
@@ -100,8 +114,12 @@ class ArrayBase:
                 np_data = self.to_numpy()
                 new_data = target_backend.asarray(np_data)
 
+            # No-op conversion: skip the wrapper and metadata copies.
+            if new_data is self.data:
+                return self
+
             # Use replace to preserve other fields (like t, t0, dt in subclasses)
-            return replace(self, data=new_data, meta=self.meta.copy())
+            return replace(self, data=new_data, meta=self._copy_meta())
         except Exception as e:
             raise QPhaseRuntimeError(
                 f"Failed to convert to backend '{target_backend}': {e}"
@@ -163,6 +181,8 @@ class BackendBase(PluginBase, Protocol):
         Standard normal sampling.
     spawn_rngs(master_seed, n) -> list[Any]
         Spawn independent RNG streams deterministically.
+    randn_into(rng, out) -> Any
+        Optional helper to fill ``out`` with standard normals in place.
     fft(x, axis=-1, norm=None) -> Any
         Compute the 1D FFT along the specified axis.
     fftfreq(n, d=1.0) -> Any
@@ -227,6 +247,7 @@ class BackendBase(PluginBase, Protocol):
     # Implementers may raise AttributeError if not supported; callers must guard.
     def stack(self, arrays: tuple[Any, ...], axis: int = 0) -> Any: ...
     def to_device(self, x: Any, device: str | None) -> Any: ...  # optional
+    def randn_into(self, rng: Any, out: Any) -> Any: ...  # optional
     def expand_dims(self, x: Any, axis: int) -> Any: ...
     def repeat(self, x: Any, repeats: int, axis: int | None = None) -> Any: ...
     def isnan(self, x: Any) -> Any: ...
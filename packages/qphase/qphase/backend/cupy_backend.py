@@ -39,6 +39,7 @@ import numpy as np
 
 from qphase.backend.base import BackendBase as Backend
 from qphase.backend.base import BackendConfigBase
+from qphase.backend.xputil import is_cuda_dlpack
 
 __all__ = [
     "CuPyBackend",
@@ -204,6 +205,13 @@ class CuPyBackend(Backend):
 
     # Array creation / conversion
     def asarray(self, x: Any, dtype: Any | None = None) -> Any:
+        if dtype is None and not isinstance(x, cp.ndarray) and is_cuda_dlpack(x):
+            # CUDA tensors from other libraries (e.g. torch) are wrapped
+            # through DLPack, sharing the device buffer instead of copying it.
+            try:
+                return cp.from_dlpack(x)
+            except Exception:
+                pass
         return cp.asarray(x, dtype=dtype) if dtype is not None else cp.asarray(x)
 
     def array(self, x: Any, dtype: Any | None = None) -> Any:
@@ -255,13 +263,23 @@ class CuPyBackend(Backend):
 
     def normal(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
         rr = cast(_CuPyRNG, rng)
-        out = rr._gen.standard_normal(size=shape)
+        dt = cp.dtype(dtype) if dtype is not None else cp.dtype(cp.float64)
+        if dt in (cp.dtype(cp.float32), cp.dtype(cp.float64)):
+            # Sample in the target precision; no fp64 draw + device cast.
+            return rr._gen.standard_normal(size=shape, dtype=dt)
         # Cast on device if needed
-        return out.astype(dtype if dtype is not None else cp.float64, copy=False)
+        return rr._gen.standard_normal(size=shape).astype(dt, copy=False)
 
     def randn(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
         return self.normal(rng, shape, dtype)
 
+    def randn_into(self, rng: Any, out: Any) -> Any:
+        g = cast(_CuPyRNG, rng)._gen
+        if out.flags.c_contiguous:
+            return g.standard_normal(dtype=out.dtype, out=out)
+        out[...] = g.standard_normal(size=out.shape, dtype=out.dtype)
+        return out
+
     def real(self, x: Any) -> Any:
         return cp.real(x)
 
@@ -14,7 +14,7 @@ Public API
 ``_einsum_tm_mk_to_tk`` : JIT kernel for (tm, mk) -> (tk) contractions
 """
 
-from typing import Any, ClassVar, Literal, cast
+from typing import Any, ClassVar, cast
 
 import numpy as np
 from pydantic import Field
@@ -27,16 +27,23 @@ except Exception as e:  # pragma: no cover - environments without numba
     ) from e
 
 
-from qphase.backend.base import BackendBase as Backend
-from qphase.backend.base import BackendConfigBase
+from qphase.backend.numpy_backend import (
+    _NATIVE_NORMAL_DTYPES,
+    NumpyBackend,
+    NumpyConfig,
+)
 
 __all__ = [
     "NumbaBackend",
 ]
 
 
-class NumbaConfig(BackendConfigBase):
-    """Configuration for Numba backend."""
+class NumbaConfig(NumpyConfig):
+    """Configuration for Numba backend.
+
+    Extends :class:`NumpyConfig`, whose options apply to the operations
+    inherited from :class:`NumpyBackend`.
+    """
 
     enable_cache: bool = Field(default=True, description="Enable JIT cache")
     fast_math: bool = Field(default=True, description="Enable fast math")
@@ -139,12 +146,12 @@ class _NumbaRNG:
 # ------------------------------ Backend API ------------------------------
 
 
-class NumbaBackend(Backend):
+class NumbaBackend(NumpyBackend):
     """Numba implementation of the Backend protocol (CPU, optional accel).
 
-    Mirrors the NumPy backend API while routing common hot-path contractions
-    through Numba-compiled kernels when available, falling back to NumPy for
-    general cases.
+    Extends the NumPy backend, routing common hot-path contractions through
+    Numba-compiled kernels and drawing from ``_NumbaRNG`` handles. Every other
+    operation is inherited unchanged from :class:`NumpyBackend`.
     """
 
     name: ClassVar[str] = "numba"
@@ -162,28 +169,10 @@ class NumbaBackend(Backend):
     def backend_name(self) -> str:
         return "numba"
 
-    def device(self) -> str | None:
-        return None
-
     # Array creation / conversion
     def asarray(self, x: Any, dtype: Any | None = None) -> Any:
         return np.asarray(x, dtype=dtype) if dtype is not None else np.asarray(x)
 
-    def array(self, x: Any, dtype: Any | None = None) -> Any:
-        return self.asarray(x, dtype=dtype)
-
-    def zeros(self, shape: tuple[int, ...], dtype: Any) -> Any:
-        return np.zeros(shape, dtype=dtype)
-
-    def empty(self, shape: tuple[int, ...], dtype: Any) -> Any:
-        return np.empty(shape, dtype=dtype)
-
-    def empty_like(self, x: Any) -> Any:
-        return np.empty_like(x)
-
-    def copy(self, x: Any) -> Any:
-        return np.copy(x)
-
     # Ops / linalg
     def einsum(self, subscripts: str, *operands: Any) -> Any:
         # Hot paths: match exact patterns to use Numba kernels
@@ -203,14 +192,9 @@ class NumbaBackend(Backend):
             cholT_arr = np.asarray(chol_T, dtype=np.float64)
             return _einsum_tm_mk_to_tk(z_arr, cholT_arr)
         # Fallback to NumPy for general cases
-        return np.einsum(subscripts, *operands, optimize=True)
-
-    def cholesky(self, a: Any) -> Any:
-        return np.linalg.cholesky(a)
-
-    def solve(self, a: Any, b: Any) -> Any:
-        return np.linalg.solve(a, b)
+        return np.einsum(subscripts, *operands, optimize=self.config.optimize_einsum)
 
+    # RNG
     def rng(self, seed: int | None) -> Any:
         return _NumbaRNG(seed)
 
@@ -222,109 +206,18 @@ class NumbaBackend(Backend):
     def normal(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
         nrng = cast(_NumbaRNG, rng)
         g = nrng._gen
-        out = g.normal(size=shape)
-        return out.astype(dtype if dtype is not None else np.float64, copy=False)
-
-    def randn(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
-        return self.normal(rng, shape, dtype)
-
-    def real(self, x: Any) -> Any:
-        return np.real(x)
-
-    def imag(self, x: Any) -> Any:
-        return np.imag(x)
-
-    def abs(self, x: Any) -> Any:
-        return np.abs(x)
-
-    def mean(self, x: Any, axis: int | tuple[int, ...] | None = None) -> Any:
-        return np.mean(x, axis=axis)
-
-    def fft(
-        self,
-        x: Any,
-        axis: int = -1,
-        norm: Literal["backward", "ortho", "forward"] | None = None,
-    ) -> Any:
-        return np.fft.fft(x, axis=axis, norm=norm)
-
-    def fftfreq(self, n: int, d: float = 1.0) -> Any:
-        return np.fft.fftfreq(n, d=d)
-
-    def concatenate(self, arrays: tuple[Any, ...], axis: int = -1) -> Any:
-        return np.concatenate(arrays, axis=axis)
-
-    # Optional helpers
-    def stack(self, arrays: tuple[Any, ...], axis: int = 0) -> Any:
-        return np.stack(arrays, axis=axis)
-
-    def to_device(self, x: Any, device: str | None) -> Any:
-        return x
-
-    def expand_dims(self, x: Any, axis: int) -> Any:
-        return np.expand_dims(x, axis=axis)
-
-    def repeat(self, x: Any, repeats: int, axis: int | None = None) -> Any:
-        return np.repeat(x, repeats, axis=axis)
-
-    def isnan(self, x: Any) -> Any:
-        return np.isnan(x)
-
-    def arange(
-        self,
-        start: int,
-        stop: int | None = None,
-        step: int = 1,
-        dtype: Any | None = None,
-    ) -> Any:
-        return np.arange(start, stop, step, dtype=dtype)
-
-    # Additional math / stats helpers (numba backend falls back to numpy)
-    def matmul(self, a: Any, b: Any) -> Any:
-        return np.matmul(a, b)
-
-    def tensordot(
-        self, a: Any, b: Any, axes: int | tuple[Any, ...] | None = None
-    ) -> Any:
-        return np.tensordot(a, b, axes=axes if axes is not None else 2)
-
-    def std(self, x: Any, axis: int | tuple[int, ...] | None = None) -> Any:
-        return np.std(x, axis=axis)
-
-    def clip(self, x: Any, a_min: Any | None, a_max: Any | None) -> Any:
-        return np.clip(x, a_min, a_max)
-
-    def where(self, condition: Any, x: Any, y: Any) -> Any:
-        return np.where(condition, x, y)
-
-    def sqrt(self, x: Any) -> Any:
-        return np.sqrt(x)
-
-    def histogram(
-        self,
-        x: Any,
-        bins: int,
-        range: tuple[float, float] | None = None,
-        density: bool = False,
-    ) -> tuple[Any, Any]:
-        return np.histogram(x, bins=bins, range=range, density=density)
-
-    def histogram2d(
-        self,
-        x: Any,
-        y: Any,
-        bins: int,
-        range: Any | None = None,
-        density: bool = False,
-    ) -> tuple[Any, Any, Any]:
-        return np.histogram2d(x, y, bins=bins, range=range, density=density)
-
-    def fftshift(self, x: Any, axes: int | tuple[int, ...] | None = None) -> Any:
-        return np.fft.fftshift(x, axes=axes)
-
-    @property
-    def pi(self) -> float:
-        return np.pi
+        # Sample float32/float64 natively instead of drawing fp64 and casting.
+        dt = np.dtype(dtype) if dtype is not None else np.dtype(np.float64)
+        if dt in _NATIVE_NORMAL_DTYPES:
+            return g.standard_normal(size=shape, dtype=dt)
+        return g.standard_normal(size=shape).astype(dt, copy=False)
+
+    def randn_into(self, rng: Any, out: Any) -> Any:
+        g = cast(_NumbaRNG, rng)._gen
+        if out.flags.c_contiguous and out.dtype in _NATIVE_NORMAL_DTYPES:
+            return g.standard_normal(dtype=out.dtype, out=out)
+        out[...] = self.normal(rng, out.shape, out.dtype)
+        return out
 
     # Capabilities
     def capabilities(self) -> dict:
@@ -24,6 +24,9 @@ __all__ = [
     "NumpyBackend",
 ]
 
+# Dtypes ``Generator.standard_normal`` can sample without a cast.
+_NATIVE_NORMAL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
 
 class NumpyConfig(BackendConfigBase):
     """Configuration for NumPy backend."""
@@ -103,13 +106,24 @@ class NumpyBackend(Backend):
         return [np.random.default_rng(child) for child in children]
 
     def normal(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
-        # rng is expected to be a numpy.random.Generator
-        out = rng.normal(size=shape)
-        return out.astype(dtype if dtype is not None else np.float64, copy=False)
+        # rng is expected to be a numpy.random.Generator. It draws float32 and
+        # float64 natively, so fp32 runs never materialize an fp64 buffer.
+        dt = np.dtype(dtype) if dtype is not None else np.dtype(np.float64)
+        if dt in _NATIVE_NORMAL_DTYPES:
+            return rng.standard_normal(size=shape, dtype=dt)
+        return rng.standard_normal(size=shape).astype(dt, copy=False)
 
     def randn(self, rng: Any, shape: tuple[int, ...], dtype: Any) -> Any:
         return self.normal(rng, shape, dtype)
 
+    def randn_into(self, rng: Any, out: Any) -> Any:
+        # Generator only writes into contiguous buffers; strided views (e.g. a
+        # trajectory column of a chunk) fall back to a draw + copy.
+        if out.flags.c_contiguous and out.dtype in _NATIVE_NORMAL_DTYPES:
+            return rng.standard_normal(dtype=out.dtype, out=out)
+        out[...] = self.normal(rng, out.shape, out.dtype)
+        return out
+
     # -------------------------------------------------------------------------
     # Math & FFT
     # -------------------------------------------------------------------------
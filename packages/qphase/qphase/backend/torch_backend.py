@@ -20,6 +20,7 @@ from pydantic import Field
 
 from qphase.backend.base import BackendBase as Backend
 from qphase.backend.base import BackendConfigBase
+from qphase.backend.xputil import is_cuda_dlpack
 
 __all__ = [
     "TorchBackend",
@@ -201,6 +202,18 @@ class TorchBackend(Backend):
 
         td = _to_torch_dtype(dtype)
         dev = self.device() or "cpu"
+        if (
+            td is None
+            and str(dev).startswith("cuda")
+            and not isinstance(obj, torch.Tensor)
+            and is_cuda_dlpack(obj)
+        ):
+            # Device arrays from other libraries (e.g. CuPy) are wrapped
+            # through DLPack, sharing the buffer instead of copying it.
+            try:
+                return torch.from_dlpack(obj).to(dev)
+            except Exception:
+                pass
         t = torch.as_tensor(obj, dtype=cast(Any, td), device=dev)
         return t
 
@@ -259,10 +272,17 @@ class TorchBackend(Backend):
 
         g = cast(_TorchRNG, rng).generator
         dev = self.device() or "cpu"
-        t = torch.randn(*shape, generator=g, device=dev)
         td = _to_torch_dtype(dtype)
+        if getattr(td, "is_floating_point", False):
+            # Sample directly in the target precision (no fp32 draw + cast).
+            return torch.randn(*shape, generator=g, device=dev, dtype=td)
+        t = torch.randn(*shape, generator=g, device=dev)
         return t.to(dtype=cast(Any, td)) if td is not None else t
 
+    def randn_into(self, rng: Any, out: Any) -> Any:
+        g = cast(_TorchRNG, rng).generator
+        return out.normal_(generator=g)
+
     def spawn_rngs(self, master_seed: int, n: int) -> list[Any]:
         ss = _np.random.SeedSequence(master_seed)
         children = ss.spawn(n)
@@ -13,6 +13,7 @@ Public API
 ----------
 ``get_xp`` : Select a NumPy-like array namespace for a given array.
 ``convert_to_numpy`` : Convert an array to a NumPy array.
+``is_cuda_dlpack`` : Check whether an array exports CUDA memory via DLPack.
 
 Notes
 -----
@@ -20,6 +21,7 @@ Notes
 
 """
 
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Any
 
@@ -28,6 +30,7 @@ import numpy as np
 __all__ = [
     "get_xp",
     "convert_to_numpy",
+    "is_cuda_dlpack",
 ]
 
 
@@ -70,6 +73,24 @@ def get_xp(arr: Any):
     tensor([0.])
 
     """
+    cls = type(arr)
+    xp = _XP_BY_TYPE.get(cls)
+    if xp is None:
+        xp = _XP_BY_TYPE[cls] = _resolve_xp(arr)
+    if xp is _TORCH:
+        return _torch_shim(arr.device)
+    return xp
+
+
+# Namespace per concrete array type. Resolving it imports and probes cupy and
+# torch, so it is done once per type instead of on every ``get_xp`` call.
+_XP_BY_TYPE: dict[type, Any] = {}
+# Marker for torch tensors, whose shim additionally depends on the device.
+_TORCH = object()
+
+
+def _resolve_xp(arr: Any) -> Any:
+    """Classify ``arr`` as cupy, torch (``_TORCH``) or numpy."""
     # CuPy detection
     try:
         import cupy as cp
@@ -78,46 +99,47 @@ def get_xp(arr: Any):
             return cp
     except Exception:
         pass
-    # PyTorch detection with a tiny shim for clip
+    # PyTorch detection
     try:
         import torch as th
 
         if hasattr(th, "Tensor") and isinstance(arr, th.Tensor):
-
-            def _clip(x, a_min=None, a_max=None):
-                # torch.clamp doesn't accept None the same way as numpy; handle cases
-                if a_min is None and a_max is None:
-                    return x
-                if a_min is None:
-                    return th.clamp(x, max=a_max)
-                if a_max is None:
-                    return th.clamp(x, min=a_min)
-                return th.clamp(x, min=a_min, max=a_max)
-
-            return SimpleNamespace(
-                abs=th.abs,
-                sqrt=th.sqrt,
-                clip=_clip,
-                zeros=lambda shape, dtype=None: th.zeros(
-                    shape, dtype=dtype, device=x_device(arr)
-                ),
-                full=lambda shape, fill_value, dtype=None: th.full(
-                    shape, fill_value, dtype=dtype, device=x_device(arr)
-                ),
-                empty_like=th.empty_like,
-                empty=lambda shape, dtype=None: th.empty(
-                    shape, dtype=dtype, device=x_device(arr)
-                ),
-                asarray=th.as_tensor,
-                concatenate=lambda arrays, axis=-1: th.cat(arrays, dim=axis),
-            )
+            return _TORCH
     except Exception:
         pass
-    import numpy as np  # fallback
-
     return np
 
 
+@lru_cache(maxsize=8)
+def _torch_shim(device: Any) -> SimpleNamespace:
+    """Build the NumPy-like torch shim allocating on ``device``."""
+    import torch as th
+
+    def _clip(x, a_min=None, a_max=None):
+        # torch.clamp doesn't accept None the same way as numpy; handle cases
+        if a_min is None and a_max is None:
+            return x
+        if a_min is None:
+            return th.clamp(x, max=a_max)
+        if a_max is None:
+            return th.clamp(x, min=a_min)
+        return th.clamp(x, min=a_min, max=a_max)
+
+    return SimpleNamespace(
+        abs=th.abs,
+        sqrt=th.sqrt,
+        clip=_clip,
+        zeros=lambda shape, dtype=None: th.zeros(shape, dtype=dtype, device=device),
+        full=lambda shape, fill_value, dtype=None: th.full(
+            shape, fill_value, dtype=dtype, device=device
+        ),
+        empty_like=th.empty_like,
+        empty=lambda shape, dtype=None: th.empty(shape, dtype=dtype, device=device),
+        asarray=th.as_tensor,
+        concatenate=lambda arrays, axis=-1: th.cat(arrays, dim=axis),
+    )
+
+
 def x_device(arr: Any) -> Any:
     """Return device for a torch tensor; otherwise 'cpu'."""
     try:
@@ -130,6 +152,25 @@ def x_device(arr: Any) -> Any:
     return "cpu"
 
 
+# DLPack device type code for CUDA memory (``kDLCUDA``).
+_DLPACK_CUDA = 2
+
+
+def is_cuda_dlpack(x: Any) -> bool:
+    """Return True if ``x`` exports CUDA memory through the DLPack protocol.
+
+    Such arrays (CuPy arrays, CUDA torch tensors) can be handed between
+    libraries with ``from_dlpack`` without a copy.
+    """
+    probe = getattr(x, "__dlpack_device__", None)
+    if probe is None or not hasattr(x, "__dlpack__"):
+        return False
+    try:
+        return int(probe()[0]) == _DLPACK_CUDA
+    except Exception:
+        return False
+
+
 def convert_to_numpy(x: Any) -> np.ndarray:
     """Convert a torch/cupy/numpy array to a NumPy ``ndarray``.
 
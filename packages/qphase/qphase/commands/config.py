@@ -18,7 +18,6 @@ from typing import Any
 
 import typer
 from rich.console import Console
-from rich.syntax import Syntax
 
 from qphase.core import (
     SystemConfig,
@@ -94,6 +93,7 @@ def show_config(
     # Use rich Syntax to print YAML
     from io import StringIO
 
+    from rich.syntax import Syntax
     from ruamel.yaml import YAML
 
     yaml = YAML()
@@ -18,7 +18,6 @@ from typing import Any
 
 import typer
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.table import Table
 
 from qphase.core.config_loader import load_global_config
@@ -609,6 +608,9 @@ def _display_config(config: Any, fmt: str, output: str) -> None:
         syntax = "yaml"
 
     if output == "-":
+        # pygments is only needed to highlight terminal output.
+        from rich.syntax import Syntax
+
         console.print(Syntax(content, syntax, theme="monokai", line_numbers=True))
     else:
         with open(output, "w", encoding="utf-8") as f:
@@ -14,11 +14,10 @@ Public API
 import json
 import sys
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import typer
 
-from qphase.core import JobProgressUpdate
 from qphase.core.config_loader import (
     _find_job_config,
     load_jobs_from_files,
@@ -30,8 +29,11 @@ from qphase.core.errors import (
 )
 from qphase.core.registry import discovery, registry
 from qphase.core.system_config import load_system_config
-from qphase.service import SchedulerService
-from qphase.service.models import ExecutionPlan
+from qphase.core.utils import json_dumps
+
+if TYPE_CHECKING:
+    from qphase.core.scheduler import JobProgressUpdate, JobResult
+    from qphase.service.models import ExecutionPlan
 
 app = typer.Typer()
 log = get_logger()
@@ -89,6 +91,11 @@ def jobs(
     json_output: bool = typer.Option(
         False, "--json", help="Print machine-readable JSON output"
     ),
+    ndjson_output: bool = typer.Option(
+        False,
+        "--ndjson",
+        help="Stream one JSON line per job result as each job finishes",
+    ),
 ):
     """Run SDE simulation jobs by name from configs/jobs/ directory.
 
@@ -129,6 +136,7 @@ def jobs(
         qphase run --verbose my_job
         qphase run my_job --plan
         qphase run my_job --plan --json
+        qphase run my_job --ndjson
         qphase run my_job --dry-run
 
     """
@@ -156,6 +164,10 @@ def jobs(
 
         # Load system configuration to get config directories
         system_cfg = load_system_config()
+        # Imported here: the execution stack is only needed once a job runs
+        # or is listed, not for ``--help`` or argument errors.
+        from qphase.service import SchedulerService
+
         scheduler_service = SchedulerService(system_cfg)
 
         # Handle --list option
@@ -204,13 +216,20 @@ def jobs(
 
         if show_plan or dry_run:
             plan_obj = scheduler_service.build_plan(job_list)
-            if json_output:
-                typer.echo(json.dumps(plan_obj.model_dump(mode="json"), indent=2))
+            plan_doc = plan_obj.model_dump(mode="json")
+            if ndjson_output:
+                # One line, like every other NDJSON record.
+                typer.echo(json_dumps(plan_doc).decode("utf-8"))
+            elif json_output:
+                typer.echo(json.dumps(plan_doc, indent=2))
             else:
                 typer.echo(_format_execution_plan(plan_obj))
             return
 
-        progress_callback = None if json_output else _make_progress_callback()
+        machine_output = json_output or ndjson_output
+        progress_callback = None if machine_output else _make_progress_callback()
+        # NDJSON lines are written as jobs finish, not buffered until the end.
+        result_callback = _echo_result_line if ndjson_output else None
 
         # Execute jobs
         log.info("Starting job execution")
@@ -218,6 +237,7 @@ def jobs(
             job_list,
             progress_callback=progress_callback,
             resume_from=resume_from,
+            result_callback=result_callback,
         )
 
         # Report results
@@ -232,23 +252,15 @@ def jobs(
                 f"{success_count}/{total_count} jobs succeeded ({failed} failed)"
             )
 
+        if ndjson_output:
+            return
         if json_output:
             typer.echo(
                 json.dumps(
                     {
                         "success_count": success_count,
                         "total_count": total_count,
-                        "results": [
-                            {
-                                "job_index": result.job_index,
-                                "job_name": result.job_name,
-                                "run_dir": str(result.run_dir),
-                                "run_id": result.run_id,
-                                "success": result.success,
-                                "error": result.error,
-                            }
-                            for result in results
-                        ],
+                        "results": [_result_record(result) for result in results],
                     },
                     indent=2,
                 )
@@ -271,10 +283,27 @@ def jobs(
         raise typer.Exit(code=1) from e
 
 
+def _result_record(result: "JobResult") -> dict:
+    """Return the machine-readable form of a job result."""
+    return {
+        "job_index": result.job_index,
+        "job_name": result.job_name,
+        "run_dir": str(result.run_dir),
+        "run_id": result.run_id,
+        "success": result.success,
+        "error": result.error,
+    }
+
+
+def _echo_result_line(result: "JobResult") -> None:
+    """Print one job result as a single NDJSON line."""
+    typer.echo(json_dumps(_result_record(result)).decode("utf-8"))
+
+
 def _make_progress_callback():
     """Create a progress callback for the scheduler."""
 
-    def _on_progress(update: JobProgressUpdate):
+    def _on_progress(update: "JobProgressUpdate"):
         # Format total duration estimate (total estimated time including elapsed)
         total_est = update.global_eta
         est_ok = total_est is not None and total_est == total_est and total_est >= 0.0
@@ -318,7 +347,7 @@ def _make_progress_callback():
     return _on_progress
 
 
-def _format_execution_plan(plan: ExecutionPlan) -> str:
+def _format_execution_plan(plan: "ExecutionPlan") -> str:
     """Format an execution plan for terminal output."""
     lines = [
         "Execution plan:",
@@ -22,6 +22,8 @@ Public API
     Logging utilities.
 """
 
+from typing import TYPE_CHECKING
+
 from .config import JobConfig, JobList
 from .config_loader import (
     get_config_for_job,
@@ -44,9 +46,11 @@ from .errors import (
     get_logger,
 )
 from .registry import RegistryCenter, registry
-from .scheduler import JobProgressUpdate, JobResult, Scheduler
 from .system_config import SystemConfig, load_system_config, save_user_config
 
+if TYPE_CHECKING:
+    from .scheduler import JobProgressUpdate, JobResult, Scheduler
+
 __all__ = [
     # Errors & Logging
     "QPhaseError",
@@ -81,3 +85,27 @@ __all__ = [
     "get_config_for_job",
     "list_available_jobs",
 ]
+
+# The scheduler (and the execution stack it imports) is exposed lazily
+# (PEP 562): CLI commands that only read or print configuration, and
+# ``--help``, never load it.
+_LAZY_ATTRS = {
+    "Scheduler": ".scheduler",
+    "JobResult": ".scheduler",
+    "JobProgressUpdate": ".scheduler",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -24,15 +24,18 @@ write_pkl_bundle
 from __future__ import annotations
 
 import csv
+import os
 import pickle
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
 from qphase.core.errors import QPhaseError
 
 from .protocols import ResultProtocol
+from .utils import write_into_dir
 
 QPHASE_BUNDLE_SCHEMA_VERSION = "1.0"
 
@@ -168,14 +171,44 @@ def iter_directory_results(run_dir: str | Path, pattern: str = "*.npz") -> list[
     if not root.exists():
         raise QPhaseError(f"Run directory does not exist: {root}")
 
-    files = sorted(path for path in root.glob(f"*/{pattern}") if path.is_file())
-    if not files:
-        files = sorted(path for path in root.glob(pattern) if path.is_file())
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        files = sorted(path for path in root.glob(f"*/{pattern}") if path.is_file())
+        if not files:
+            files = sorted(path for path in root.glob(pattern) if path.is_file())
+    else:
+        files = sorted(
+            path
+            for subdir in _scan(root, "*", want_dirs=True)
+            for path in _scan(subdir, pattern)
+        )
+        if not files:
+            files = sorted(_scan(root, pattern))
     if not files:
         raise QPhaseError(f"No result files matching {pattern!r} found under {root}")
     return files
 
 
+def _scan(directory: Path, pattern: str, *, want_dirs: bool = False) -> list[Path]:
+    """Return the files (or subdirectories) of ``directory`` matching ``pattern``.
+
+    Equivalent to ``Path.glob`` for a single-component pattern followed by an
+    ``is_file``/``is_dir`` check, but ``os.scandir`` takes the entry type from
+    the directory listing: names are filtered before any ``Path`` is built and
+    no per-entry ``stat`` is needed on most filesystems, which adds up for
+    sweeps with hundreds of result files, especially on network storage.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if fnmatch(entry.name, pattern)
+                and (entry.is_dir() if want_dirs else entry.is_file())
+            ]
+    except OSError:
+        return []
+
+
 def load_directory_results(
     run_dir: str | Path,
     loader: Callable[[Path], ResultProtocol] | None = None,
@@ -232,15 +265,18 @@ def write_table_csv(
 
     """
     out = Path(path)
-    out.parent.mkdir(parents=True, exist_ok=True)
     if not rows and fieldnames is None:
         raise QPhaseError("Cannot write empty CSV without explicit fieldnames")
 
     header = fieldnames if fieldnames is not None else list(rows[0].keys())
-    with out.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=header, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(rows)
+
+    def _write() -> None:
+        with out.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=header, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+
+    write_into_dir(out, _write)
     return out
 
 
@@ -269,7 +305,6 @@ def write_columns_csv(
     import numpy as np
 
     out = Path(path)
-    out.parent.mkdir(parents=True, exist_ok=True)
 
     labels = list(columns.keys())
     axis_arr = np.asarray(axis)
@@ -284,11 +319,14 @@ def write_columns_csv(
                 f"axis length {axis_arr.shape[0]}"
             )
 
-    with out.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow(["axis", *labels])
-        for i, value in enumerate(axis_arr):
-            writer.writerow([value, *(col_arrays[label][i] for label in labels)])
+    def _write() -> None:
+        with out.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["axis", *labels])
+            for i, value in enumerate(axis_arr):
+                writer.writerow([value, *(col_arrays[label][i] for label in labels)])
+
+    write_into_dir(out, _write)
     return out
 
 
@@ -324,7 +362,6 @@ def write_npz_bundle(path: str | Path, **arrays_and_meta: Any) -> Path:
     import numpy as np
 
     out = Path(path)
-    out.parent.mkdir(parents=True, exist_ok=True)
 
     kwargs = dict(arrays_and_meta)
     for key, value in _bundle_meta().items():
@@ -335,7 +372,7 @@ def write_npz_bundle(path: str | Path, **arrays_and_meta: Any) -> Path:
         if isinstance(value, dict | list):
             kwargs[key] = np.array(value, dtype=object)
 
-    np.savez_compressed(out, **kwargs)
+    write_into_dir(out, lambda: np.savez_compressed(out, **kwargs))
     return out
 
 
@@ -356,13 +393,15 @@ def write_pkl_bundle(path: str | Path, rows: list[Any]) -> Path:
 
     """
     out = Path(path)
-    out.parent.mkdir(parents=True, exist_ok=True)
 
     bundle: dict[str, Any] = {"rows": rows}
     bundle.update(_bundle_meta())
 
-    with out.open("wb") as handle:
-        pickle.dump(bundle, handle)
+    def _write() -> None:
+        with out.open("wb") as handle:
+            pickle.dump(bundle, handle)
+
+    write_into_dir(out, _write)
     return out
 
 
@@ -113,7 +113,7 @@ def load_jobs_from_files(file_paths: list[Path]) -> JobList:
 
 def _load_single_job_file(path: Path) -> JobConfig | list[JobConfig]:
     """Load a single job file (can contain one job or a list)."""
-    data = load_yaml(path)
+    data = load_yaml(path, cache=True)
 
     # Case 1: List of jobs
     if isinstance(data, list):
@@ -240,7 +240,7 @@ def load_global_config(global_path: Path) -> dict[str, Any]:
             return {}
 
     try:
-        return load_yaml(global_path)
+        return load_yaml(global_path, cache=True)
     except (QPhaseIOError, QPhaseConfigError):
         return {}
 
@@ -278,7 +278,7 @@ def get_config_for_job(
                 f"Job configuration not found for '{job_name}'. "
                 f"Searched in: {system_config.paths.config_dirs}"
             )
-        job_config = load_yaml(job_config_path)
+        job_config = load_yaml(job_config_path, cache=True)
     else:
         job_config = {}
 
@@ -17,14 +17,18 @@ registry
 import importlib.metadata
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
 from importlib import import_module
 from typing import Any
 
+from pydantic import BaseModel
+
 from .errors import (
     QPhaseConfigError,
     QPhasePluginError,
+    get_logger,
 )
 from .system_config import load_system_config
 from .utils import load_yaml
@@ -46,8 +50,13 @@ class _Entry:
     kind: str  # "callable" | "dotted"
     builder: Builder | None = None
     target: str | None = None  # dotted path like "pkg.mod:Class"
+    # ``target`` split into (module, attr), filled at registration or first use
+    target_parts: tuple[str, str | None] | None = None
     config_schema: type[Any] | None = None
     meta: dict[str, Any] | None = None
+    # Imported object for a dotted entry, memoized on first use. Only the
+    # class/callable is kept: ``create`` still builds a fresh instance.
+    resolved: Any | None = field(default=None, repr=False)
 
     def __post_init__(self):
         if self.meta is None:
@@ -153,6 +162,7 @@ class RegistryCenter:
         target: str,
         *,
         overwrite: bool = False,
+        target_parts: tuple[str, str | None] | None = None,
         **meta: Any,
     ) -> None:
         """Register by dotted path without importing until ``create()``.
@@ -167,6 +177,9 @@ class RegistryCenter:
             Dotted import path (e.g., "pkg.mod:ClassName")
         overwrite : bool, optional
             If True, overwrite existing registration
+        target_parts : tuple[str, str | None], optional
+            ``target`` already split into ``(module, attr)`` (e.g. from an
+            entry point), so it is not parsed again on import
         **meta : Any
             Additional metadata to store with the registration
 
@@ -186,6 +199,7 @@ class RegistryCenter:
             kind="dotted",
             builder=None,
             target=str(target),
+            target_parts=target_parts,
             config_schema=None,
             meta=full_meta,
         )
@@ -235,8 +249,7 @@ class RegistryCenter:
         if entry.kind == "callable":
             assert entry.builder is not None
             return entry.builder
-        assert entry.target is not None
-        return self._import_target(entry.target)
+        return self._import_entry(entry)
 
     def get_plugin_class(self, namespace: str, name: str) -> Any:
         """Retrieve the plugin class (or callable) without instantiation."""
@@ -252,9 +265,8 @@ class RegistryCenter:
             return entry.builder
 
         # dotted path import
-        assert entry.target is not None
         try:
-            obj = self._import_target(entry.target)
+            obj = self._import_entry(entry)
             return obj
         except Exception as e:
             raise QPhasePluginError(
@@ -284,6 +296,10 @@ class RegistryCenter:
 
         """
         ns, nm = self._split(full_name)
+        return self._create(ns, nm, kwargs)
+
+    def _create(self, ns: Namespace, nm: Name, kwargs: dict[str, Any]) -> Any:
+        """Construct plugin ``ns:nm`` from an already normalized key."""
         table = self._tables.get(ns, {})
         entry = table.get(nm)
         if entry is None:
@@ -297,9 +313,8 @@ class RegistryCenter:
             return entry.builder(**kwargs)
 
         # dotted path import
-        assert entry.target is not None
         try:
-            obj = self._import_target(entry.target)
+            obj = self._import_entry(entry)
         except Exception as e:
             raise QPhasePluginError(
                 f"Failed to import plugin '{nm}' from '{entry.target}': {e}"
@@ -314,20 +329,37 @@ class RegistryCenter:
             return obj
         return obj(**kwargs) if callable(obj) else obj
 
-    def _import_target(self, target: str) -> Any:
-        """Import a dotted target supporting ``module:attr`` or ``module.attr``."""
-        module_name: str
-        attr_name: str | None = None
+    @staticmethod
+    def _split_target(target: str) -> tuple[str, str | None]:
+        """Split ``module:attr`` or ``module.attr`` into ``(module, attr)``."""
         if ":" in target:
             module_name, attr_name = target.split(":", 1)
-        else:
-            if "." in target:
-                parts = target.rsplit(".", 1)
-                module_name = parts[0]
-                attr_name = parts[1]
-            else:
-                module_name = target
-                attr_name = None
+            return module_name, attr_name
+        if "." in target:
+            module_name, attr_name = target.rsplit(".", 1)
+            return module_name, attr_name
+        return target, None
+
+    def _import_entry(self, entry: _Entry) -> Any:
+        """Import a dotted entry once and reuse the resolved object.
+
+        Batch runs create the same plugins for every job; after the first
+        import the lookup is a single attribute read instead of another
+        ``import_module`` and ``getattr`` round trip.
+        """
+        if entry.resolved is not None:
+            return entry.resolved
+        assert entry.target is not None
+        if entry.target_parts is None:
+            entry.target_parts = self._split_target(entry.target)
+        entry.resolved = self._import_target(entry.target, entry.target_parts)
+        return entry.resolved
+
+    def _import_target(
+        self, target: str, parts: tuple[str, str | None] | None = None
+    ) -> Any:
+        """Import a dotted target supporting ``module:attr`` or ``module.attr``."""
+        module_name, attr_name = parts or self._split_target(target)
 
         try:
             mod = import_module(module_name)
@@ -381,7 +413,9 @@ class RegistryCenter:
                 params = {}
 
         merged_kwargs = {**(params or {}), **extra_kwargs}
-        full_name = f"{plugin_type}:{plugin_name}"
+        # Normalize the key once here instead of formatting a full name that
+        # ``create`` would split and normalize again.
+        ns, nm = plugin_type.strip().lower(), str(plugin_name).strip().lower()
 
         schema = self.get_plugin_schema(plugin_type, plugin_name)
         if schema:
@@ -393,7 +427,7 @@ class RegistryCenter:
                 else:
                     config_obj = schema(**merged_kwargs)
 
-                return self.create(full_name, config=config_obj, **extra_kwargs)
+                return self._create(ns, nm, dict(config=config_obj, **extra_kwargs))
             except Exception as e:
                 raise QPhaseConfigError(
                     f"Invalid configuration for plugin "
@@ -401,7 +435,7 @@ class RegistryCenter:
                 ) from e
 
         # Fallback for plugins without schema (should be avoided in strict mode)
-        return self.create(full_name, **merged_kwargs)
+        return self._create(ns, nm, merged_kwargs)
 
     def get_plugin_schema(self, namespace: str, name: str) -> type[Any] | None:
         """Get the configuration schema class for a specific plugin."""
@@ -417,8 +451,7 @@ class RegistryCenter:
         # Load plugin to inspect
         try:
             # Import the target class without instantiating
-            assert entry.target is not None
-            obj = self._import_target(entry.target)
+            obj = self._import_entry(entry)
 
             # Check for config_schema on the class/object
             if hasattr(obj, "config_schema"):
@@ -447,42 +480,11 @@ class RegistryCenter:
 
         """
         schema = self.get_plugin_schema(namespace, name)
-        if not schema:
+        if not (isinstance(schema, type) and issubclass(schema, BaseModel)):
             return {}
-
-        scanable_params = {}
-
-        try:
-            # For Pydantic models, inspect the field metadata
-            if hasattr(schema, "model_fields"):
-                for field_name, field_info in schema.model_fields.items():
-                    # Check if field has 'scanable' in metadata
-                    is_scanable = False
-                    if hasattr(field_info, "json_schema_extra"):
-                        # Check json_schema_extra for scanable flag
-                        extra = field_info.json_schema_extra
-                        if callable(extra):
-                            # If it's a function, call it to get the extra info
-                            extra = extra()
-                        if isinstance(extra, dict) and extra.get("scanable", False):
-                            is_scanable = True
-
-                    # Also check Field metadata for scanable
-                    if hasattr(field_info, "field_info"):
-                        field_info_obj = field_info.field_info
-                        if hasattr(field_info_obj, "metadata"):
-                            for meta in field_info_obj.metadata:
-                                if hasattr(meta, "scanable") and meta.scanable:
-                                    is_scanable = True
-
-                    scanable_params[field_name] = is_scanable
-        except Exception as e:
-            print(f"DEBUG: get_scanable_params failed for {namespace}:{name}: {e}")
-            # If we can't inspect the schema, return empty dict
-            # The scheduler will fall back to heuristic detection
-            pass
-
-        return scanable_params
+        # Field metadata is fixed per schema class; job expansion and config
+        # validation ask for the same plugins over and over.
+        return dict(_scanable_fields(schema))
 
     def validate_plugin_config(
         self, plugin_type: str, config_data: dict[str, Any]
@@ -548,6 +550,56 @@ class RegistryCenter:
         return type(obj).__name__.lower()
 
 
+@cache
+def _scanable_fields(schema: type[BaseModel]) -> tuple[tuple[str, bool], ...]:
+    """Return ``(field, is_scanable)`` pairs read from a schema's field metadata."""
+    scanable_params = {}
+
+    try:
+        # For Pydantic models, inspect the field metadata
+        if hasattr(schema, "model_fields"):
+            for field_name, field_info in schema.model_fields.items():
+                # Check if field has 'scanable' in metadata
+                is_scanable = False
+                if hasattr(field_info, "json_schema_extra"):
+                    # Check json_schema_extra for scanable flag
+                    extra = field_info.json_schema_extra
+                    if callable(extra):
+                        # A callable updates the field's JSON schema in place
+                        generated: dict[str, Any] = {}
+                        extra(generated)
+                        extra = generated
+                    if isinstance(extra, dict) and extra.get("scanable", False):
+                        is_scanable = True
+
+                # Also check Field metadata for scanable
+                if hasattr(field_info, "field_info"):
+                    field_info_obj = field_info.field_info
+                    if hasattr(field_info_obj, "metadata"):
+                        for meta in field_info_obj.metadata:
+                            if hasattr(meta, "scanable") and meta.scanable:
+                                is_scanable = True
+
+                scanable_params[field_name] = is_scanable
+    except Exception as e:
+        get_logger().debug(f"Scanable field inspection failed for {schema!r}: {e}")
+        # If we can't inspect the schema, return empty dict
+        # The scheduler will fall back to heuristic detection
+        pass
+
+    return tuple(scanable_params.items())
+
+
+@cache
+def _entry_points(group: str) -> tuple[importlib.metadata.EntryPoint, ...]:
+    """Return the entry points of ``group``, scanning installed metadata once.
+
+    ``importlib.metadata.entry_points`` rescans every distribution on each
+    call; :meth:`DiscoveryService.reset` clears this cache.
+    """
+    return tuple(importlib.metadata.entry_points(group=group))
+
+
 class DiscoveryService:
     """Service for discovering plugins from entry points and local files."""
 
@@ -558,6 +610,7 @@ class DiscoveryService:
     def reset(self) -> None:
         """Reset discovery state."""
         self._discovered_entry_points.clear()
+        _entry_points.cache_clear()
 
     def discover_plugins(self, group: str = "qphase") -> None:
         """Automatically discover and register plugins from entry points.
@@ -565,9 +618,7 @@ class DiscoveryService:
         Expects entry points in the group 'qphase' with names in the format
         'category.name'.
         """
-        eps = importlib.metadata.entry_points(group=group)
-
-        for ep in eps:
+        for ep in _entry_points(group):
             if ep.name in self._discovered_entry_points:
                 continue
 
@@ -602,6 +653,7 @@ class DiscoveryService:
                 namespace=namespace,
                 name=name,
                 target=ep.value,
+                target_parts=(ep.module, ep.attr),
                 auto_discovered=True,
                 package_name=package_name,
                 package_version=package_version,
@@ -6,16 +6,25 @@ Public API
 ----------
 load_result
     Load a result from a file.
+mmap_npz_member
+    Memory-map one array stored uncompressed in an ``.npz`` archive.
+load_npz_data
+    Read the ``data`` array of an ``.npz`` result, wherever it is stored.
 GenericResult
     Generic container for loaded results.
 """
 
+import os
+import struct
+import zipfile
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from .errors import QPhaseError
 from .protocols import ResultProtocol
+from .utils import json_loads
 
 
 @dataclass
@@ -71,7 +80,7 @@ class GenericResult:
         raise NotImplementedError("GenericResult is read-only")
 
 
-def load_result(job_name: str, job_dir: Path) -> ResultProtocol:
+def load_result(job_name: str, job_dir: Path, *, mmap: bool = False) -> ResultProtocol:
     """Attempt to load a result from a job directory.
 
     Parameters
@@ -80,6 +89,10 @@ def load_result(job_name: str, job_dir: Path) -> ResultProtocol:
         Name of the job (used to guess filename).
     job_dir : Path
         Directory containing the job output.
+    mmap : bool, default False
+        Memory-map the ``data`` array of an uncompressed ``.npz`` result
+        instead of reading it. The mapped array is read-only, and the file
+        must not be overwritten while it is in use.
 
     Returns
     -------
@@ -95,72 +108,210 @@ def load_result(job_name: str, job_dir: Path) -> ResultProtocol:
     if not job_dir.exists():
         raise QPhaseError(f"Job directory not found: {job_dir}")
 
-    # Potential filenames to check
-    # 1. {job_name}.npz (Default for SDE)
-    # 2. {job_name}.json
-    # 3. result.npz (Generic fallback)
-    # 4. result.json
-    candidates = [
-        job_dir / f"{job_name}.npz",
-        job_dir / f"{job_name}.json",
-        job_dir / "result.npz",
-        job_dir / "result.json",
-    ]
-
-    for path in candidates:
-        if path.exists():
-            return _load_file(path)
-
-    # Scan directory for any .npz or .json if exact match failed
-    for ext in [".npz", ".json"]:
-        matches = list(job_dir.glob(f"*{ext}"))
-        if len(matches) == 1:
-            return _load_file(matches[0])
+    # Exact names first, by extension in reader order: {job_name}.npz (the
+    # SDE default), {job_name}.json, then the generic result.npz/.json.
+    for stem in (job_name, "result"):
+        for ext in _READERS:
+            path = job_dir / f"{stem}{ext}"
+            if path.exists():
+                return _load_file(path, mmap)
+
+    # Otherwise accept the only file of a supported type, from one listing.
+    matches: dict[str, list[str]] = {ext: [] for ext in _READERS}
+    with os.scandir(job_dir) as entries:
+        for entry in entries:
+            found = matches.get(os.path.splitext(entry.name)[1])
+            if found is not None and entry.is_file():
+                found.append(entry.path)
+    for found in matches.values():
+        if len(found) == 1:
+            return _load_file(Path(found[0]), mmap)
 
     raise QPhaseError(f"No supported result file found in {job_dir}")
 
 
-def _load_file(path: Path) -> ResultProtocol:
+def _load_file(path: Path, mmap: bool = False) -> ResultProtocol:
     """Load a specific file into a GenericResult."""
+    reader = _READERS.get(path.suffix)
     try:
-        if path.suffix == ".npz":
-            import numpy as np
-
-            with np.load(path, allow_pickle=True) as npz:
-                # Heuristic to extract data
-                if "data" in npz:
-                    data = npz["data"]
-                else:
-                    # If no 'data' key, return the whole dict-like object
-                    data = dict(npz)
-
-                # Heuristic to extract metadata
-                metadata = {}
-                if "meta" in npz:
-                    meta_item = npz["meta"]
-                    # Handle 0-d array wrapping dict
-                    if meta_item.ndim == 0:
-                        metadata = meta_item.item()
-                    else:
-                        metadata = {str(k): v for k, v in enumerate(meta_item)}
-
-                # Special handling for SDE results:
-                # If data is a numpy array, it might be the trajectory.
-                # We return it as is.
-                return GenericResult(data, metadata)
-
-        elif path.suffix == ".json":
-            import json
-
-            with open(path, encoding="utf-8") as f:
-                content = json.load(f)
-                # Assume standard structure if possible
-                if isinstance(content, dict) and "data" in content:
-                    return GenericResult(content["data"], content.get("metadata", {}))
-                return GenericResult(content, {})
-
-        else:
+        if reader is None:
             raise QPhaseError(f"Unsupported file extension: {path.suffix}")
-
+        return reader(path, mmap)
     except Exception as e:
         raise QPhaseError(f"Failed to load result from {path}: {e}") from e
+
+
+def _load_npz(path: Path, mmap: bool = False) -> GenericResult:
+    """Read an ``.npz`` result: the ``data`` array plus its ``meta`` dict."""
+    import numpy as np
+
+    with np.load(path, allow_pickle=True) as npz:
+        data = load_npz_data(path, npz, mmap=mmap)
+        # Heuristic to extract data
+        if data is None:
+            # If no 'data' key, return the whole dict-like object
+            data = dict(npz)
+
+        # Heuristic to extract metadata
+        metadata = {}
+        if "meta" in npz:
+            meta_item = npz["meta"]
+            # Handle 0-d array wrapping dict
+            if meta_item.ndim == 0:
+                metadata = meta_item.item()
+            else:
+                metadata = {str(k): v for k, v in enumerate(meta_item)}
+
+    # Special handling for SDE results:
+    # If data is a numpy array, it might be the trajectory.
+    # We return it as is.
+    return GenericResult(data, metadata)
+
+
+def _load_json(path: Path, mmap: bool = False) -> GenericResult:
+    """Read a ``.json`` result, unwrapping ``{"data", "metadata"}`` documents.
+
+    ``mmap`` is accepted for a uniform reader signature; JSON is always read.
+    """
+    content = json_loads(path.read_bytes())
+    # Assume standard structure if possible
+    if isinstance(content, dict) and "data" in content:
+        return GenericResult(content["data"], content.get("metadata", {}))
+    return GenericResult(content, {})
+
+
+# Result readers by file extension; ``load_result`` tries them in this order.
+# Each takes the path and the ``mmap`` flag.
+_READERS: dict[str, Callable[[Path, bool], GenericResult]] = {
+    ".npz": _load_npz,
+    ".json": _load_json,
+}
+
+
+# Fixed part of a zip local file header; the file name and extra field follow.
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+
+def load_npz_data(
+    path: str | os.PathLike[str], archive: Any, *, mmap: bool = False
+) -> Any | None:
+    """Read the ``data`` array of an ``.npz`` result.
+
+    The array is either a member of the archive or, for results saved with
+    the raw ``npy`` trajectory layout, a ``.npy`` file beside it named by the
+    archive's ``data_file`` entry. The latter is opened with ``open_memmap``
+    when mapping is requested, skipping the zip archive altogether.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path to the ``.npz`` archive.
+    archive : numpy.lib.npyio.NpzFile
+        The archive at ``path``, opened with ``np.load``.
+    mmap : bool, default False
+        Memory-map the array instead of reading it, where its storage allows.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The array (a read-only ``numpy.memmap`` when mapped), or None when the
+        result stores no ``data``.
+
+    """
+    import numpy as np
+    from numpy.lib.format import open_memmap
+
+    if "data" in archive:
+        # On request, uncompressed members are mapped rather than read.
+        data = mmap_npz_member(path, "data", archive) if mmap else None
+        return archive["data"] if data is None else data
+    if "data_file" not in archive:
+        return None
+    # Only the file name is stored, so a moved run directory still resolves.
+    raw = Path(path).with_name(Path(str(archive["data_file"])).name)
+    if mmap:
+        try:
+            return open_memmap(raw, mode="r")
+        except ValueError:
+            # Object and empty arrays cannot be mapped.
+            pass
+    return np.load(raw)
+
+
+def mmap_npz_member(
+    path: str | os.PathLike[str], name: str, archive: Any | None = None
+) -> Any | None:
+    """Memory-map the array ``name`` of an ``.npz`` archive.
+
+    ``np.load`` ignores ``mmap_mode`` for archives and reads every member
+    into memory. Members written by ``np.savez`` are stored uncompressed,
+    so their ``.npy`` payload can be mapped read-only in place: only the
+    pages a consumer touches (e.g. a plotted time window) are read.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path to the ``.npz`` archive.
+    name : str
+        Member name, without the ``.npy`` suffix.
+    archive : numpy.lib.npyio.NpzFile, optional
+        The archive at ``path`` already opened with ``np.load``. Its file
+        handle and parsed zip directory are reused when it exposes them, so
+        the file is not opened or its directory read a second time;
+        otherwise ``path`` is opened.
+
+    Returns
+    -------
+    numpy.memmap or None
+        The mapped array, or None when the member is missing, compressed,
+        empty or holds Python objects; callers then fall back to ``np.load``.
+
+    """
+    # ``fid`` and ``zip`` are NpzFile internals, not public API.
+    lent_fh = getattr(archive, "fid", None)
+    lent_zf = getattr(archive, "zip", None)
+    if lent_fh is not None and isinstance(lent_zf, zipfile.ZipFile):
+        return _mmap_member(lent_fh, lent_zf, name)
+    with open(path, "rb") as fh, zipfile.ZipFile(fh) as zf:
+        return _mmap_member(fh, zf, name)
+
+
+def _mmap_member(fh: Any, zf: zipfile.ZipFile, name: str) -> Any | None:
+    """Map member ``name`` of the archive ``zf`` read through ``fh``."""
+    import numpy as np
+    from numpy.lib import format as npy_format
+
+    try:
+        info = zf.getinfo(f"{name}.npy")
+    except KeyError:
+        return None
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    fh.seek(info.header_offset)
+    magic, name_len, extra_len = _ZIP_LOCAL_HEADER.unpack(
+        fh.read(_ZIP_LOCAL_HEADER.size)
+    )
+    if magic != b"PK\x03\x04":
+        return None
+    fh.seek(name_len + extra_len, 1)
+    version = npy_format.read_magic(fh)
+    if version == (1, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_1_0(fh)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = npy_format.read_array_header_2_0(fh)
+    else:
+        return None
+    offset = fh.tell()
+
+    if dtype.hasobject or 0 in shape:
+        return None
+    # The map holds its own reference to the file; ``fh`` may be closed.
+    return np.memmap(
+        fh,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
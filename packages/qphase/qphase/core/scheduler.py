@@ -16,8 +16,7 @@ Public API
 from __future__ import annotations
 
 import copy
-import json
-import uuid
+import secrets
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -38,6 +37,7 @@ from .job_expansion import JobExpander
 from .protocols import ResultProtocol
 from .registry import registry
 from .system_config import SystemConfig, load_system_config
+from .utils import ensure_dir, json_dumps, json_loads, path_getter
 
 log = get_logger()
 
@@ -93,6 +93,9 @@ class Scheduler:
         Callback for progress updates during job execution.
     on_run_dir : Callable[[Path], None] | None, optional
         Callback invoked with run directory after each job completes.
+    on_result : Callable[[JobResult], None] | None, optional
+        Callback invoked with each job's result, in order, as soon as its
+        execution unit finishes, so callers can stream results.
 
     """
 
@@ -108,6 +111,7 @@ class Scheduler:
         default_output_dir: str | None = None,
         on_progress: Callable[[JobProgressUpdate], None] | None = None,
         on_run_dir: Callable[[Path], None] | None = None,
+        on_result: Callable[[JobResult], None] | None = None,
     ):
         if system_config is None:
             self.system_config = load_system_config()
@@ -121,6 +125,7 @@ class Scheduler:
 
         self.on_progress = on_progress
         self.on_run_dir = on_run_dir
+        self.on_result = on_result
         from .registry import registry
 
         self._registry = registry
@@ -132,13 +137,12 @@ class Scheduler:
         """Initialize a new execution session."""
         # Generate session ID
         ts = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        short_uuid = uuid.uuid4().hex[:6]
-        self.session_id = f"{ts}_{short_uuid}"
+        self.session_id = f"{ts}_{secrets.token_hex(3)}"
 
         # Create session directory
         output_root = Path(self.default_output_dir).resolve()
         self.session_dir = output_root / self.session_id
-        self.session_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.session_dir, force=True)
 
         # Initialize manifest
         self.manifest = {
@@ -155,8 +159,7 @@ class Scheduler:
         if self.session_dir and self.manifest:
             manifest_path = self.session_dir / "session_manifest.json"
             try:
-                with open(manifest_path, "w", encoding="utf-8") as f:
-                    json.dump(self.manifest, f, indent=2)
+                manifest_path.write_bytes(json_dumps(self.manifest, indent=True))
             except Exception as e:
                 log.warning(f"Failed to save session manifest: {e}")
 
@@ -222,6 +225,8 @@ class Scheduler:
 
         # Map original job name to its group index for stable ordering.
         group_count = len(job_groups)
+        reported = 0
+        on_result = self.on_result
 
         for group_idx, group in enumerate(job_groups):
             if isinstance(group, SingleJob):
@@ -245,6 +250,21 @@ class Scheduler:
                     dry_run=dry_run,
                 )
 
+            # Hand over the results this unit appended. A failing consumer
+            # (e.g. a closed output pipe) must not abort the run before the
+            # manifest is finalized; it is no longer called after an error.
+            if on_result is not None:
+                try:
+                    for result in results[reported:]:
+                        on_result(result)
+                except Exception as e:
+                    log.warning(
+                        f"Result callback failed; no further results are "
+                        f"reported to it: {e}"
+                    )
+                    on_result = None
+                reported = len(results)
+
         # Finalize session
         if self.manifest and not dry_run:
             self.manifest["status"] = (
@@ -264,8 +284,7 @@ class Scheduler:
             raise QPhaseConfigError(f"Session manifest not found in: {session_path}")
 
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                self.manifest = json.load(f)
+            self.manifest = json_loads(manifest_path.read_bytes())
         except Exception as e:
             raise QPhaseConfigError(f"Failed to load session manifest: {e}") from e
 
@@ -441,7 +460,11 @@ class Scheduler:
                         from .result_loader import load_result
 
                         log.info(f"Loading result for '{job.input}' from disk...")
-                        result = load_result(job.input, job_dir)
+                        result = load_result(
+                            job.input,
+                            job_dir,
+                            mmap=self.system_config.mmap_results,
+                        )
                         # Cache it
                         job_results[job.input] = result
                         return result
@@ -1275,19 +1298,6 @@ class Scheduler:
                 # First, identify all varying parameters in upstream jobs
                 upstream_jobs = [job_registry[name] for name in upstream_expansion]
 
-                # Helper to get value by dotted path
-                def get_val(obj, path):
-                    parts = path.split(".")
-                    curr = obj
-                    for p in parts:
-                        if isinstance(curr, dict):
-                            curr = curr.get(p)
-                        elif hasattr(curr, p):
-                            curr = getattr(curr, p)
-                        else:
-                            return None
-                    return curr
-
                 # Find varying parameters with a deep search.
                 # Scan the full upstream job config for varying values.
 
@@ -1322,11 +1332,13 @@ class Scheduler:
                     first_flat = flatten_job(upstream_jobs[0])
                     candidate_keys = list(first_flat.keys())
 
-                    # Check variance for each key
+                    # Check variance for each key. Every key is read from
+                    # every upstream job, so its path is parsed only once.
                     for key in candidate_keys:
+                        get_val = path_getter(key)
                         values = set()
                         for uj in upstream_jobs:
-                            val = get_val(uj, key)
+                            val = get_val(uj)
                             # Handle unhashable types (list, dict) by stringifying
                             try:
                                 values.add(val)
@@ -1353,15 +1365,11 @@ class Scheduler:
 
                 # Group jobs by the remaining varying keys
                 groups: dict[tuple[Any, ...], list[Any]] = {}
+                sig_getters = [path_getter(k) for k in sorted(varying_keys)]
 
                 for uj in upstream_jobs:
                     # signature is a tuple of values for varying keys
-                    sig_list = []
-                    for k in sorted(varying_keys):
-                        sig_list.append(get_val(uj, k))
-                    sig = tuple(sig_list)
-
-                    # sig = tuple(get_val(uj, k) for k in sorted(varying_keys))
+                    sig = tuple(get_val(uj) for get_val in sig_getters)
                     if sig not in groups:
                         groups[sig] = []
                     groups[sig].append(uj)
@@ -1640,18 +1648,19 @@ class Scheduler:
         return plugins
 
     def _generate_run_id(self) -> str:
-        """Generate a unique run ID with timestamp and UUID suffix."""
-        # In session mode, run_id can be simpler or just a UUID,
-        # but we keep the timestamp for consistency.
+        """Generate a unique run ID with timestamp and random hex suffix."""
+        # In session mode, run_id can be simpler or just a random token,
+        # but we keep the timestamp for consistency. ``token_hex`` draws
+        # exactly the bytes kept instead of truncating a full UUID4.
         ts = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        return f"{ts}_{uuid.uuid4().hex[:8]}"
+        return f"{ts}_{secrets.token_hex(4)}"
 
     def _create_run_dir(self, job: JobConfig, run_id: str) -> Path:
         """Create and return the run directory for a job."""
         # If session is active, create directory inside session dir
         if self.session_dir:
             run_dir = self.session_dir / job.name
-            run_dir.mkdir(parents=True, exist_ok=True)
+            ensure_dir(run_dir, force=True)
             return run_dir
 
         # Fallback for non-session execution (should not happen in normal flow
@@ -1661,7 +1670,7 @@ class Scheduler:
 
         output_root = Path(output_dir).resolve()
         run_dir = output_root / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(run_dir, force=True)
         return run_dir
 
     def _write_snapshot(
@@ -1732,6 +1741,7 @@ def run_jobs(
     default_output_dir: str | None = None,
     on_progress: Callable[[JobProgressUpdate], None] | None = None,
     on_run_dir: Callable[[Path], None] | None = None,
+    on_result: Callable[[JobResult], None] | None = None,
 ) -> list[JobResult]:
     """Execute a list of jobs.
 
@@ -1747,6 +1757,8 @@ def run_jobs(
         Progress callback function
     on_run_dir : Callable[[Path], None] | None, optional
         Callback invoked with run directory after each job completes
+    on_result : Callable[[JobResult], None] | None, optional
+        Callback invoked with each job result as soon as it is available
 
     Returns
     -------
@@ -1758,5 +1770,6 @@ def run_jobs(
         default_output_dir=default_output_dir,
         on_progress=on_progress,
         on_run_dir=on_run_dir,
+        on_result=on_result,
     )
     return scheduler.run(job_list)
@@ -15,7 +15,9 @@ SnapshotManager
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -24,6 +26,117 @@ from pydantic import BaseModel, Field
 
 from .config import JobConfig
 from .system_config import SystemConfig
+from .utils import json_dumps, json_loads
+
+# Snapshot fields that change on every save and must not affect the digest.
+_VOLATILE_FIELDS = frozenset({"created_at"})
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode objects the standard JSON encoder cannot handle."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def _write_atomic(path: Path, data: bytes, *, durable: bool = False) -> None:
+    """Write *data* to *path* through a ``<name>.tmp`` sibling and a rename.
+
+    A crash mid-write never leaves a truncated file behind: readers see
+    either the previous contents or the new ones.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file.
+    data : bytes
+        Complete file contents, written with a single call.
+    durable : bool, default False
+        ``fsync`` the temporary file before the rename. Off by default: run
+        metadata does not need to survive power loss and fsync is expensive.
+
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_json(path: Path, payload: dict[str, Any], *, durable: bool = False) -> None:
+    """Serialize *payload* to *path* as indented UTF-8 JSON.
+
+    The document is encoded in one go and written atomically with
+    :func:`_write_atomic`; ``json.dump`` would instead issue one ``write``
+    per encoder chunk.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file.
+    payload : dict[str, Any]
+        JSON-serializable document.
+    durable : bool, default False
+        ``fsync`` the temporary file before the rename.
+
+    """
+    _write_atomic(
+        path, json_dumps(payload, indent=True, default=_json_default), durable=durable
+    )
+
+
+def _payload_digest(payload: dict[str, Any]) -> str:
+    """Return a BLAKE2b digest of a snapshot payload.
+
+    Volatile fields such as ``created_at`` are excluded so that re-snapshotting
+    an identical configuration (e.g. a resumed run) yields the same digest.
+    The canonical form is always encoded by :mod:`json`, so the digest does
+    not depend on whether orjson is installed.
+    """
+    stable = {k: v for k, v in payload.items() if k not in _VOLATILE_FIELDS}
+    canonical = json.dumps(
+        stable,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    ).encode("utf-8")
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _maybe_write(path: Path, payload: dict[str, Any]) -> bool:
+    """Write *payload* as JSON unless an identical snapshot is already on disk.
+
+    The digest of the last written payload is kept in a ``<name>.sha`` sidecar
+    next to *path*, so the check costs one small read instead of re-parsing
+    the snapshot itself.
+
+    Returns
+    -------
+    bool
+        True if the file was (re)written, False if the write was skipped.
+
+    """
+    digest = _payload_digest(payload)
+    sidecar = path.with_suffix(path.suffix + ".sha")
+    if path.exists() and sidecar.exists():
+        try:
+            if sidecar.read_text(encoding="utf-8").strip() == digest:
+                return False
+        except OSError:
+            pass
+
+    _write_json(path, payload)
+    # Replaced atomically like the snapshot, so a crash never leaves a
+    # truncated digest beside it.
+    _write_atomic(sidecar, digest.encode("utf-8"))
+    return True
 
 
 class ConfigSnapshot(BaseModel):
@@ -98,11 +211,14 @@ class SnapshotManager:
         Parameters
         ----------
         snapshot_dir : Path
-            Directory where snapshots should be stored
+            Root directory searched by :meth:`list_snapshots`. It is not
+            created here: snapshots are written into their run directories.
 
         """
         self.snapshot_dir = Path(snapshot_dir)
-        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed snapshots keyed by path, with the (mtime_ns, size) they were
+        # read at. Listing and lookups re-read a file only after it changed.
+        self._loaded: dict[Path, tuple[tuple[int, int], ConfigSnapshot]] = {}
 
     def create_snapshot(
         self,
@@ -196,20 +312,8 @@ class SnapshotManager:
         # Save snapshot as JSON
         snapshot_path = run_dir / "config_snapshot.json"
 
-        # Use custom JSON encoder for Path objects
-        def json_encoder(obj):
-            if isinstance(obj, Path):
-                return str(obj)
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        with open(snapshot_path, "w", encoding="utf-8") as f:
-            json.dump(
-                snapshot.model_dump(),
-                f,
-                indent=2,
-                default=json_encoder,
-                ensure_ascii=False,
-            )
+        # Skip the write when an identical snapshot already exists
+        _maybe_write(snapshot_path, snapshot.model_dump())
 
         return snapshot_path
 
@@ -231,11 +335,25 @@ class SnapshotManager:
         FileNotFoundError
             If snapshot file doesn't exist
 
+        Notes
+        -----
+        Snapshots are cached per manager until the file's mtime or size
+        changes, so repeated loads return the same instance; treat it as
+        read-only.
+
         """
-        with open(snapshot_path, encoding="utf-8") as f:
-            snapshot_dict = json.load(f)
+        path = Path(snapshot_path)
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._loaded.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        snapshot_dict = json_loads(path.read_bytes())
 
-        return ConfigSnapshot(**snapshot_dict)
+        snapshot = ConfigSnapshot(**snapshot_dict)
+        self._loaded[path] = (key, snapshot)
+        return snapshot
 
     def list_snapshots(self, job_name: str | None = None) -> list[ConfigSnapshot]:
         """List all snapshots.
@@ -355,19 +473,10 @@ class SnapshotManager:
         if include_result and snapshot.run_dir is not None:
             result_path = Path(snapshot.run_dir) / "result.json"
             if result_path.exists():
-                with open(result_path, encoding="utf-8") as f:
-                    result_data = json.load(f)
+                result_data = json_loads(result_path.read_bytes())
                 export_data["result_data"] = result_data
 
         # Save to file
-        def json_encoder(obj):
-            if isinstance(obj, Path):
-                return str(obj)
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        with open(export_path, "w", encoding="utf-8") as f:
-            json.dump(
-                export_data, f, indent=2, default=json_encoder, ensure_ascii=False
-            )
+        _write_json(Path(export_path), export_data)
 
         return export_path
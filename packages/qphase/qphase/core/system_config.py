@@ -8,7 +8,8 @@ configuration context for the framework.
 Public API
 ----------
 SystemConfig
-    Root configuration model with paths, auto_save, and parameter_scan.
+    Root configuration model with paths, auto_save, mmap_results, and
+    parameter_scan.
 PathsConfig
     Nested model for output_dir, global_file, plugin_dirs, config_dirs.
 """
@@ -112,6 +113,12 @@ class SystemConfig(BaseModel):
         Whether scheduler should automatically save job results to disk.
         If False, results are only passed to downstream jobs (if any).
         Default: True
+    mmap_results : bool
+        Whether results loaded back from disk as the input of a downstream
+        job are memory-mapped rather than read. Only trajectories stored
+        uncompressed (e.g. the SDE engine's ``npy`` trajectory format) can be
+        mapped; mapped arrays are read-only.
+        Default: False
     parameter_scan : dict
         Parameter scan configuration for batch execution.
         - enabled: Enable parameter scan expansion (default: True)
@@ -126,6 +133,11 @@ class SystemConfig(BaseModel):
         description="Automatically save job results to disk. Set to False to "
         "disable automatic saving.",
     )
+    mmap_results: bool = Field(
+        default=False,
+        description="Memory-map result data loaded from disk for downstream "
+        "jobs instead of reading it into memory.",
+    )
     parameter_scan: dict[str, Any] = Field(
         default_factory=lambda: {
             "enabled": True,
@@ -8,34 +8,249 @@ introspection.
 Public API
 ----------
 load_yaml
-    Load YAML with error handling and fallback parser.
+    Load YAML with error handling, optionally through in-process and
+    on-disk JSON caches.
+json_dumps, json_loads
+    JSON encoding/decoding, through orjson when it is installed.
+ensure_dir, write_into_dir
+    Create a directory once per process; write a file into it, recovering
+    from a directory deleted since.
 deep_merge_dicts, deep_copy
     Dictionary manipulation utilities.
+path_getter
+    Compiled accessor for a dotted path into nested dicts and objects.
 extract_defaults_from_schema
     Get default values from Pydantic model.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
+import yaml
 from pydantic_core import PydanticUndefined
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.resolver import implicit_resolvers
 
 from .errors import QPhaseConfigError, QPhaseIOError
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # optional speedup, see ``json_dumps``
+    _HAS_ORJSON = False
+
 _ruamel_yaml: Any = YAML(typ="safe")
 
+_T = TypeVar("_T")
+
+# libyaml-backed loader used by ``_parse_yaml``; None without libyaml.
+_LibyamlLoader: type[yaml.CSafeLoader] | None
+
+if getattr(yaml, "__with_libyaml__", False):
+
+    class _Yaml12CSafeLoader(yaml.CSafeLoader):
+        """libyaml-backed safe loader producing ruamel's YAML 1.2 values.
+
+        PyYAML resolves plain scalars by YAML 1.1 rules (``yes`` is a
+        bool, ``1e-3`` a string); this loader uses ruamel's 1.2 resolvers
+        and integer rules instead, and rejects duplicate keys, so it
+        returns what ``_ruamel_yaml`` would for the same document.
+        """
+
+        def __init__(self, stream: Any) -> None:
+            super().__init__(stream)
+            self._checked: set[int] = set()
+
+        def flatten_mapping(self, node: Any) -> None:
+            # Runs once per mapping before merge keys are expanded.
+            if id(node) not in self._checked:
+                self._checked.add(id(node))
+                seen = set()
+                for key_node, _ in node.value:
+                    if key_node.tag == "tag:yaml.org,2002:merge":
+                        continue
+                    if isinstance(key_node, yaml.ScalarNode):
+                        key = (key_node.tag, key_node.value)
+                        if key in seen:
+                            raise yaml.constructor.ConstructorError(
+                                None, None, "found duplicate key", key_node.start_mark
+                            )
+                        seen.add(key)
+            super().flatten_mapping(node)
+
+        def construct_yaml_int(self, node: Any) -> int:
+            value = self.construct_scalar(node).replace("_", "")
+            sign = -1 if value[0] == "-" else 1
+            value = value.lstrip("+-")
+            # Leading zeros are decimal in YAML 1.2; octal is spelled 0o.
+            if value[:2] in ("0b", "0o", "0x"):
+                return sign * int(value, 0)
+            return sign * int(value)
+
+    _Yaml12CSafeLoader.yaml_implicit_resolvers = {}
+    for _versions, _tag, _regexp, _first in implicit_resolvers:
+        if (1, 2) in _versions:
+            _Yaml12CSafeLoader.add_implicit_resolver(_tag, _regexp, _first)
+    _Yaml12CSafeLoader.add_constructor(
+        "tag:yaml.org,2002:int", _Yaml12CSafeLoader.construct_yaml_int
+    )
+    _LibyamlLoader = _Yaml12CSafeLoader
+else:
+    _LibyamlLoader = None
+
+
+def json_dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON.
+
+    Uses orjson when it is installed and the standard library otherwise.
+    Documents orjson rejects (non-string keys, integers beyond 64 bits) or
+    would change (non-finite floats, which it writes as ``null``) are
+    encoded by the standard library instead, so both paths accept the same
+    input and decode to the same values. Both write compact separators, but
+    may spell floats differently (``1e-05`` vs ``0.00001``): digests that
+    must not depend on the environment encode with :mod:`json` directly.
+
+    Parameters
+    ----------
+    obj : Any
+        Document to encode.
+    indent : bool, default False
+        Indent nested containers by two spaces.
+    sort_keys : bool, default False
+        Sort object keys, e.g. for digests.
+    default : Callable[[Any], Any] | None, optional
+        Hook for objects JSON cannot represent; it must raise ``TypeError``
+        for unsupported ones.
+
+    """
+    if _HAS_ORJSON:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (
+            orjson.OPT_SORT_KEYS if sort_keys else 0
+        )
+        try:
+            encoded = orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass
+        else:
+            # ``null`` is rare enough that scanning the bytes first keeps the
+            # walk for non-finite floats off the common path.
+            if b"null" not in encoded or not _maybe_non_finite(obj):
+                return encoded
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _maybe_non_finite(obj: Any) -> bool:
+    """Return True if ``obj`` may hold a NaN or infinite float.
+
+    Objects other than JSON containers and scalars reach the encoder
+    through its ``default`` hook, whose output is unknown here: they count
+    as possibly non-finite.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_maybe_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_maybe_non_finite(v) for v in obj)
+    return not (obj is None or isinstance(obj, (str, int)))
+
+
+# Directories already created through ``ensure_dir``. The scheduler creates
+# a job's run directory once, and exports put several files in one
+# directory: only the first pays. Public writers that may outlive an output
+# tree (results, snapshots) call ``mkdir`` themselves instead.
+_KNOWN_DIRS: set[str] = set()
+
+
+def ensure_dir(directory: Path, *, force: bool = False) -> None:
+    """Create ``directory`` (and parents) unless this process already did.
+
+    Paths are normalized with ``os.path.abspath``, which unlike
+    ``Path.resolve`` needs no filesystem access. A directory removed after
+    it was recorded is not recreated unless ``force`` is set: owners of a
+    directory (e.g. the scheduler creating a run directory) pass it so a
+    long-lived process recovers from deleted output trees.
+    """
+    key = os.path.abspath(directory)
+    if force or key not in _KNOWN_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(key)
+
+
+def write_into_dir(path: Path, write: Callable[[], _T]) -> _T:
+    """Create the directory of ``path`` through :func:`ensure_dir`, then write.
+
+    ``write`` produces the file at ``path``. If it fails with
+    ``FileNotFoundError`` because the directory was removed after this
+    process recorded it (e.g. an export tree cleaned up under a GUI or
+    sweep process), the directory is recreated and ``write`` retried once.
+    """
+    ensure_dir(path.parent)
+    try:
+        return write()
+    except FileNotFoundError:
+        if path.parent.is_dir():
+            raise
+        ensure_dir(path.parent, force=True)
+        return write()
+
 
-def load_yaml(path: Path) -> Any:
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON document, through orjson when it is installed.
+
+    orjson rejects the ``NaN``/``Infinity`` tokens :func:`json_dumps` writes
+    for non-finite floats; such documents are decoded by the standard
+    library.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_yaml(path: Path, *, cache: bool = False) -> Any:
     """Load YAML file using available parser with error handling.
 
     Parameters
     ----------
     path : Path
         Path to the YAML file
+    cache : bool, default False
+        Reuse earlier loads while the file's mtime and size are unchanged:
+        within a process the parsed document is kept in memory, and across
+        processes a JSON copy under ``~/.qphase/cache`` is read instead of
+        the YAML. At most ``_YAML_CACHE_MAX_FILES`` copies are kept; the
+        oldest written are removed first.
+        Decoding JSON is much faster than parsing YAML, which matters for
+        configs that every CLI invocation reads again. Each call returns
+        its own copy of the document.
 
     Returns
     -------
@@ -51,13 +266,156 @@ def load_yaml(path: Path) -> Any:
     if not path.exists():
         raise QPhaseIOError(f"File not found: {path}")
 
+    if cache:
+        return _load_yaml_cached(path)
+    return _parse_yaml(path)
+
+
+def _parse_yaml(path: Path) -> Any:
+    """Parse ``path`` with the safe YAML loader.
+
+    With PyYAML's libyaml bindings the raw bytes are parsed in C, about ten
+    times faster than ruamel's pure-Python parser. Documents the fast loader
+    rejects (duplicate or unhashable keys, ...) are re-parsed by ruamel,
+    which reports the error or handles the construct as before.
+    """
     try:
+        if _LibyamlLoader is not None:
+            data = path.read_bytes()
+            try:
+                return yaml.load(data, Loader=_LibyamlLoader) or {}
+            except yaml.YAMLError:
+                pass
         with open(path, encoding="utf-8") as f:
             return _ruamel_yaml.load(f) or {}
     except Exception as e:
         raise QPhaseConfigError(f"Failed to parse YAML file {path}: {e}") from e
 
 
+# Documents parsed by ``load_yaml(cache=True)`` in this process, keyed by
+# (absolute path, mtime_ns, size) and ordered from least recently used.
+_YAML_MEMO: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+_YAML_MEMO_SIZE = 100
+_yaml_memo_lock = threading.Lock()
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load ``path`` from the in-process cache or its JSON cache file.
+
+    Long-lived processes (GUI, sweeps) read the same configs repeatedly; a
+    hit skips both the YAML parse and the JSON decode. A rewritten file
+    changes the key, and entries past ``_YAML_MEMO_SIZE`` are evicted.
+    Callers may mutate what they get, so they receive a copy.
+    """
+    st = path.stat()
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _yaml_memo_lock:
+        data = _YAML_MEMO.get(key)
+        if data is not None:
+            _YAML_MEMO.move_to_end(key)
+    if data is None:
+        data = _load_yaml_json_cache(path, st)
+        with _yaml_memo_lock:
+            _YAML_MEMO[key] = data
+            if len(_YAML_MEMO) > _YAML_MEMO_SIZE:
+                _YAML_MEMO.popitem(last=False)
+    return deep_copy(data)
+
+
+# Upper bound on JSON cache files. Every distinct config path gets one, so
+# past this count the least recently written are removed and the directory
+# does not grow with every file ever loaded.
+_YAML_CACHE_MAX_FILES = 256
+
+
+def _yaml_cache_file(path: Path) -> tuple[str, Path]:
+    """Return the absolute form of ``path`` and its JSON cache file.
+
+    Cache files live in ``~/.qphase/cache/yaml``, next to the user config,
+    named by a digest of the absolute path so config directories stay
+    untouched.
+    """
+    key = os.path.abspath(path)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return key, Path.home() / ".qphase" / "cache" / "yaml" / f"{digest}.json"
+
+
+def _load_yaml_json_cache(path: Path, st: os.stat_result) -> Any:
+    """Load ``path`` through its JSON cache file, refreshing a stale one.
+
+    The cache file stores ``{"path", "mtime_ns", "size", "data"}``.
+    Documents that JSON cannot represent exactly (non-string keys, dates,
+    ...) are never cached, and a cache file that cannot be read or written
+    is silently ignored.
+    """
+    try:
+        key, cache_file = _yaml_cache_file(path)
+    except RuntimeError:  # no home directory to keep the cache in
+        return _parse_yaml(path)
+    is_new = False
+    try:
+        cached = json_loads(cache_file.read_bytes())
+        if (
+            cached["path"] == key
+            and cached["mtime_ns"] == st.st_mtime_ns
+            and cached["size"] == st.st_size
+        ):
+            return cached["data"]
+    except FileNotFoundError:
+        is_new = True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = _parse_yaml(path)
+    try:
+        encoded = json_dumps(
+            {"path": key, "mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+        )
+    except (TypeError, ValueError):
+        return data
+    if json_loads(encoded)["data"] != data:
+        return data
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(encoded)
+        os.replace(tmp, cache_file)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return data
+    if is_new:
+        _prune_yaml_cache(cache_file.parent)
+    return data
+
+
+def _prune_yaml_cache(cache_dir: Path) -> None:
+    """Remove the oldest JSON cache files beyond ``_YAML_CACHE_MAX_FILES``.
+
+    Runs only when a new cache file was added. Files another process
+    removes meanwhile are skipped, and failures leave the cache as it is.
+    """
+    entries: list[tuple[int, str]] = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except FileNotFoundError:
+                        pass
+    except OSError:
+        return
+    excess = len(entries) - _YAML_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, stale in entries[:excess]:
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass
+
+
 def save_yaml(data: dict[str, Any], path: Path) -> None:
     """Save YAML using available library."""
     try:
@@ -117,6 +475,39 @@ def deep_copy(data: Any) -> Any:
         return data
 
 
+@lru_cache(maxsize=256)
+def path_getter(path: str) -> Callable[[Any], Any]:
+    """Return a function reading the dotted ``path`` from a nested object.
+
+    Each segment is looked up as a dict key, or as an attribute of anything
+    else (e.g. a Pydantic model); a missing segment yields None. The path
+    is split once here, so the returned accessor can be applied to many
+    objects without re-parsing it.
+
+    Parameters
+    ----------
+    path : str
+        Dot-separated path, e.g. ``"plugins.model.kerr.chi"``.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Accessor returning the value at ``path``, or None.
+
+    """
+    keys = tuple(path.split("."))
+
+    def get(obj: Any) -> Any:
+        for key in keys:
+            if isinstance(obj, dict):
+                obj = obj.get(key)
+            else:
+                obj = getattr(obj, key, None)
+        return obj
+
+    return get
+
+
 def schema_to_yaml_map(
     model_cls: type[Any],
     existing_values: dict[str, Any],
@@ -84,10 +84,12 @@ class SchedulerService:
         job_list: JobList,
         progress_callback: Any = None,
         resume_from: str | Path | None = None,
+        result_callback: Any = None,
     ) -> list[JobResult]:
         scheduler = Scheduler(
             system_config=self.system_config,
             on_progress=progress_callback,
+            on_result=result_callback,
         )
         results = scheduler.run(
             job_list,
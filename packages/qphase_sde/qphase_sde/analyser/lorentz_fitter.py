@@ -91,6 +91,13 @@ class LorentzFitterConfig(PluginConfigBase):
         None, description="Output directory; usually injected by the engine"
     )
     pattern: str = Field("*.npz", description="Glob pattern for result files")
+    mmap_results: bool = Field(
+        False,
+        description=(
+            "Memory-map trajectories of result files instead of reading them; "
+            "only their PSD analysis is used"
+        ),
+    )
 
 
 @dataclass(frozen=True)
@@ -519,7 +526,7 @@ def _collect_distribution(
     rows.append(row)
 
 
-def _load_input(data: Any, pattern: str) -> list[LoadedResult]:
+def _load_input(data: Any, pattern: str, mmap: bool = False) -> list[LoadedResult]:
     """Normalize analyzer input into a list of ``LoadedResult``."""
     if isinstance(data, DirectoryInputResult):
         data = data.path
@@ -530,7 +537,7 @@ def _load_input(data: Any, pattern: str) -> list[LoadedResult]:
             LoadedResult(
                 path=path,
                 job_name=path.parent.name or path.stem,
-                result=SDEResult.load(path),
+                result=SDEResult.load(path, mmap=mmap),
             )
             for path in paths
         ]
@@ -607,7 +614,7 @@ class LorentzFitter(Analyzer):
         if not isinstance(config, LorentzFitterConfig):
             raise RuntimeError("LorentzFitter config not initialized")
 
-        loaded_results = _load_input(data, config.pattern)
+        loaded_results = _load_input(data, config.pattern, config.mmap_results)
         if not loaded_results:
             raise QPhaseError("LorentzFitter received no input results")
 
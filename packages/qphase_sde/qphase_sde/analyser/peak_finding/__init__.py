@@ -15,13 +15,15 @@ __all__ = [
     "create_peak_finder",
 ]
 
+_SCIPY_NAMES = frozenset({"scipy", "standard"})
+
 
 def create_peak_finder(config: Any) -> PeakFinder | None:
     """Create a peak finder from configuration."""
     if isinstance(config, str | type(None)):
         if config is None or (isinstance(config, str) and config.lower() == "none"):
             return None
-        if isinstance(config, str) and config.lower() in ["scipy", "standard"]:
+        if isinstance(config, str) and config.lower() in _SCIPY_NAMES:
             return ScipyPeakFinder(ScipyPeakFinderConfig())
         if isinstance(config, str) and config.lower() == "rational":
             return RationalPeakFinder(RationalPeakFinderConfig())
@@ -16,8 +16,18 @@ class PeakInfo(BaseModel):
 
     def model_dump(self, **kwargs) -> dict[str, Any]:
         """Serialize peak info, converting numpy/complex values to plain Python."""
+        if not kwargs:
+            # Default dump: the fields are flat lists, so a dict literal skips
+            # the generic serializer walking ``properties`` a second time.
+            return {
+                "indices": list(self.indices),
+                "frequencies": list(self.frequencies),
+                "values": list(self.values),
+                "properties": _serialize_peak_value(self.properties),
+            }
         data = super().model_dump(**kwargs)
-        data["properties"] = _serialize_peak_value(self.properties)
+        if "properties" in data:
+            data["properties"] = _serialize_peak_value(self.properties)
         return data
 
 
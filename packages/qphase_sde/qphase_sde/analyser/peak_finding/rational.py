@@ -144,9 +144,11 @@ class RationalPeakFinder(PeakFinder):
             valid_peaks = []
             f_min, f_max = freqs.min(), freqs.max()
 
+            # Roots are numpy complex scalars: read ``.real``/``.imag``
+            # directly rather than through the np.real/np.isreal wrappers.
             for root in crit_points:
-                if np.isreal(root):
-                    r_real = np.real(root)
+                if root.imag == 0:
+                    r_real = root.real
                     if f_min <= r_real <= f_max:
                         # Eval second derivative or just value to check if Max
                         val = self._eval_rational(r_real, popt)
@@ -176,9 +178,9 @@ class RationalPeakFinder(PeakFinder):
             # 2. Denom Minima (Roots of D')
             denom_min_roots = D_deriv.roots
             denom_minima = [
-                np.real(r)
+                r.real
                 for r in denom_min_roots
-                if np.isreal(r) and f_min <= np.real(r) <= f_max
+                if r.imag == 0 and f_min <= r.real <= f_max
             ]
 
             props = {
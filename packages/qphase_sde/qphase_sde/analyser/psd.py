@@ -23,7 +23,9 @@ Notes
 
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, ClassVar, Literal, cast
 
 import numpy as _np
@@ -35,6 +37,8 @@ from qphase.core.protocols import PluginConfigBase
 from ..utils import resolve_mode_columns
 from .base import Analyzer
 from .peak_finding import (
+    _SCIPY_NAMES,
+    PeakFinder,
     RationalPeakFinderConfig,
     ScipyPeakFinderConfig,
     create_peak_finder,
@@ -58,6 +62,99 @@ class _PsdEstimate:
     n_independent: int
 
 
+def _power(X: _np.ndarray) -> _np.ndarray:
+    """Return ``|X|**2`` of a complex spectrum without the square root."""
+    P = X.real * X.real
+    P += X.imag * X.imag
+    return P
+
+
+def _mirror_half_spectrum(half: _np.ndarray, n: int) -> _np.ndarray:
+    """Expand a real-input (rfft) power spectrum to the full ``fft`` layout.
+
+    For real signals ``|X(-f)| = |X(f)|``, so the negative-frequency bins are
+    the positive ones in reverse order (excluding DC and, for even ``n``, the
+    Nyquist bin).
+    """
+    full = _np.empty((*half.shape[:-1], n), dtype=half.dtype)
+    n_half = n // 2 + 1
+    full[..., :n_half] = half
+    full[..., n_half:] = half[..., 1 : (n + 1) // 2][..., ::-1]
+    return full
+
+
+def _batched_fft(
+    x: _np.ndarray,
+    n: int,
+    norm: Literal["backward", "ortho", "forward"] | None,
+    workers: int,
+) -> _np.ndarray:
+    """FFT of length ``n`` along the last axis of a temporary host block.
+
+    scipy's pocketfft spreads the batch over ``workers`` threads and may
+    overwrite ``x``, which callers pass as a freshly computed product.
+    """
+    from scipy import fft as _sp_fft
+
+    return _sp_fft.fft(x, n=n, axis=-1, norm=norm, workers=workers, overwrite_x=True)
+
+
+# Upper bound on the elements of one windowed block handed to the FFT. Welch
+# segments and multitaper products of a large ensemble are transformed a few
+# trajectories at a time so they are never all materialized at once.
+_FFT_BLOCK_ELEMENTS = 1 << 22
+
+
+def _spectra_in_chunks(
+    x: _np.ndarray,
+    per_trajectory: int,
+    spectra_of: Callable[[_np.ndarray], _np.ndarray],
+) -> _np.ndarray:
+    """Apply ``spectra_of`` to bounded row chunks of ``x`` and stack the rows.
+
+    ``per_trajectory`` is the number of block elements one trajectory
+    contributes; ``spectra_of`` maps ``(n, n_time)`` rows to ``(n, n_freq)``.
+    """
+    n_traj = x.shape[0]
+    step = max(1, _FFT_BLOCK_ELEMENTS // max(1, per_trajectory))
+    if step >= n_traj:
+        return spectra_of(x)
+    first = spectra_of(x[:step])
+    spectra = _np.empty((n_traj, *first.shape[1:]), dtype=first.dtype)
+    spectra[:step] = first
+    for start in range(step, n_traj, step):
+        spectra[start : start + step] = spectra_of(x[start : start + step])
+    return spectra
+
+
+# Windows and DPSS tapers depend only on (name, length); every mode and every
+# analysis of a same-length series reuses them. Cached arrays are read-only.
+@lru_cache(maxsize=32)
+def _window(window: str | None, n: int) -> tuple[_np.ndarray, float]:
+    """Return the window ``window`` of length ``n`` and its energy."""
+    w = None
+    if window is not None:
+        try:
+            w = getattr(_np, window)(n)
+        except AttributeError:
+            # Unknown window name: fall back to rectangular
+            w = None
+    if w is None:
+        w = _np.ones(n)
+    w.flags.writeable = False
+    return w, float(_np.dot(w, w))
+
+
+@lru_cache(maxsize=16)
+def _dpss_tapers(n: int, nw: float, k_tapers: int) -> _np.ndarray:
+    """Return ``k_tapers`` DPSS tapers of length ``n`` (solving an eigenproblem)."""
+    from scipy.signal.windows import dpss
+
+    tapers = dpss(n, nw, Kmax=k_tapers, sym=False)
+    tapers.flags.writeable = False
+    return tapers
+
+
 class PsdAnalyzerConfig(PluginConfigBase):
     """Configuration for PSD Analyzer."""
 
@@ -99,6 +196,13 @@ class PsdAnalyzerConfig(PluginConfigBase):
     k_tapers: int | None = Field(
         None, ge=1, description="Number of DPSS tapers (default: int(2*nw)-1)"
     )
+    workers: int = Field(
+        1,
+        description=(
+            "Threads per host FFT (scipy.fft workers); -1 uses all cores. "
+            "Keep 1 when analyses already run in parallel processes"
+        ),
+    )
 
     # Peak finding configuration
     # Supports bool (legacy), string ("scipy", "rational"), or specific config objects
@@ -128,9 +232,57 @@ class PsdAnalyzerConfig(PluginConfigBase):
     def validate_modes(self) -> "PsdAnalyzerConfig":
         if not self.modes:
             raise ValueError("modes must be non-empty")
+        if self.workers == 0:
+            raise ValueError("workers must not be zero")
         return self
 
 
+def _peak_finder(config: PsdAnalyzerConfig) -> PeakFinder | None:
+    """Return the peak finder selected by ``config.find_peaks``, if any."""
+    pf_conf = config.find_peaks
+    if pf_conf is False:
+        return None
+    # Backward compatibility: ``True`` and the strings that name the Scipy
+    # finder use one built from the deprecated fields.
+    if pf_conf is True or (
+        isinstance(pf_conf, str) and pf_conf.lower() in _SCIPY_NAMES
+    ):
+        return _legacy_scipy_finder(
+            config.min_height,
+            config.prominence,
+            config.distance,
+            config.smooth_window,
+            config.noise_threshold,
+            config.max_peaks,
+        )
+    return create_peak_finder(pf_conf)
+
+
+# Finders are stateless, so each distinct set of legacy settings is validated
+# into a config once instead of on every analysis.
+@lru_cache(maxsize=16)
+def _legacy_scipy_finder(
+    min_height: float | None,
+    prominence: float | None,
+    distance: int | None,
+    smooth_window: int | None,
+    noise_threshold: float | None,
+    max_peaks: int | None,
+) -> PeakFinder | None:
+    """Return the Scipy finder for the deprecated top-level peak settings."""
+    return create_peak_finder(
+        ScipyPeakFinderConfig(
+            method="scipy",
+            min_height=min_height,
+            prominence=prominence,
+            distance=distance,
+            smooth_window=smooth_window,
+            noise_threshold=noise_threshold,
+            max_peaks=max_peaks,
+        )
+    )
+
+
 class PsdAnalyzer(Analyzer):
     """Analyzer for Power Spectral Density."""
 
@@ -200,50 +352,57 @@ class PsdAnalyzer(Analyzer):
         else:
             data_arr = data
 
-        method = config.method
-        nperseg = config.nperseg
-        noverlap = config.noverlap
-        nfft = config.nfft
-        nw = config.nw
-        k_tapers = config.k_tapers
-
-        # Compute first to get the common axis and uncertainty metadata.
-        estimate0 = self._estimate_single(
-            data_arr[:, :, mode_columns[0]],
-            dt,
-            kind=kind,
-            convention=convention,
-            window=config.window,
-            method=method,
-            nperseg=nperseg,
-            noverlap=noverlap,
-            nfft=nfft,
-            nw=nw,
-            k_tapers=k_tapers,
-            backend=backend,
-        )
-        axis0 = estimate0.axis
-        P_list = [estimate0.mean]
-        P_std_list = [estimate0.std]
-        P_sem_list = [estimate0.sem]
-        for column in mode_columns[1:]:
-            estimate = self._estimate_single(
-                data_arr[:, :, column],
+        if config.method == "periodogram":
+            # One FFT call over a (n_modes, n_traj, n_time) block transforms
+            # every mode together instead of one planned transform per mode.
+            block = backend.stack(
+                tuple(backend.asarray(data_arr[:, :, c]) for c in mode_columns),
+                axis=0,
+            )
+            batch = self._estimate_single(
+                block,
                 dt,
                 kind=kind,
                 convention=convention,
                 window=config.window,
-                method=method,
-                nperseg=nperseg,
-                noverlap=noverlap,
-                nfft=nfft,
-                nw=nw,
-                k_tapers=k_tapers,
                 backend=backend,
             )
-            P_list.append(estimate.mean)
-            P_std_list.append(estimate.std)
-            P_sem_list.append(estimate.sem)
+            del block
+            estimates = [
+                _PsdEstimate(
+                    axis=batch.axis,
+                    mean=batch.mean[i],
+                    std=batch.std[i],
+                    sem=batch.sem[i],
+                    n_independent=batch.n_independent,
+                )
+                for i in range(len(mode_columns))
+            ]
+        else:
+            # Segment-based estimators run per mode with shared settings.
+            estimates = [
+                self._estimate_single(
+                    data_arr[:, :, column],
+                    dt,
+                    kind=kind,
+                    convention=convention,
+                    window=config.window,
+                    method=config.method,
+                    nperseg=config.nperseg,
+                    noverlap=config.noverlap,
+                    nfft=config.nfft,
+                    nw=config.nw,
+                    k_tapers=config.k_tapers,
+                    backend=backend,
+                )
+                for column in mode_columns
+            ]
+        # The first mode provides the common axis and uncertainty metadata.
+        estimate0 = estimates[0]
+        axis0 = estimate0.axis
+        P_list = [e.mean for e in estimates]
+        P_std_list = [e.std for e in estimates]
+        P_sem_list = [e.sem for e in estimates]
         P_mat = _np.vstack(P_list).T  # shape (n_freq, n_modes)
         P_std_mat = _np.vstack(P_std_list).T
         P_sem_mat = _np.vstack(P_sem_list).T
@@ -251,33 +410,7 @@ class PsdAnalyzer(Analyzer):
         # Peak finding
         peaks_info = {}
 
-        # Instantiate peak finder
-        finder = None
-        pf_conf = config.find_peaks
-
-        # Backward compatibility logic.
-        # Build a Scipy config when using legacy bool/string peak-finding flags.
-        legacy_scipy = False
-        if isinstance(pf_conf, bool) and pf_conf:
-            legacy_scipy = True
-        elif isinstance(pf_conf, str) and pf_conf.lower() in ["scipy", "standard"]:
-            legacy_scipy = True
-
-        if legacy_scipy:
-            # Map legacy fields
-            scipy_conf = ScipyPeakFinderConfig(
-                method="scipy",
-                min_height=config.min_height,
-                prominence=config.prominence,
-                distance=config.distance,
-                smooth_window=config.smooth_window,
-                noise_threshold=config.noise_threshold,
-                max_peaks=config.max_peaks,
-            )
-            finder = create_peak_finder(scipy_conf)
-        else:
-            # Just try creating directly
-            finder = create_peak_finder(pf_conf)
+        finder = _peak_finder(config)
 
         if finder:
             for i, m in enumerate(modes):
@@ -402,7 +535,14 @@ class PsdAnalyzer(Analyzer):
             raise ValueError("[524] input `x` must be a 1-D or 2-D array")
 
         if method == "periodogram":
-            return self._compute_periodogram(x_proc, dt, convention, window, backend)
+            return self._compute_periodogram(
+                x_proc,
+                dt,
+                convention,
+                window,
+                backend,
+                owns_input=kind == "modular",
+            )
 
         # Welch and multitaper are implemented on NumPy arrays.
         x_np = convert_to_numpy(x_proc)
@@ -430,15 +570,13 @@ class PsdAnalyzer(Analyzer):
         sem = std / _np.sqrt(float(n_independent))
         return mean, std, sem
 
+    def _fft_workers(self) -> int:
+        """Return the configured thread count for host FFTs."""
+        return cast(PsdAnalyzerConfig, self.config).workers
+
     def _get_window(self, window: str | None, n: int) -> _np.ndarray:
-        """Return a NumPy window of length ``n``."""
-        if window is None:
-            return _np.ones(n)
-        try:
-            return getattr(_np, window)(n)
-        except AttributeError:
-            # Unknown window name: fall back to rectangular
-            return _np.ones(n)
+        """Return a read-only NumPy window of length ``n``."""
+        return _window(window, n)[0]
 
     def _scale_and_shift(
         self,
@@ -449,7 +587,11 @@ class PsdAnalyzer(Analyzer):
         n_fft: int,
         energy: float,
     ) -> tuple[_np.ndarray, _np.ndarray]:
-        """Apply PSD scaling, shift zero frequency to center, and return."""
+        """Apply PSD scaling, shift zero frequency to center, and return.
+
+        ``P`` may carry leading axes (e.g. stacked mean/std/sem); the
+        frequency axis is the last one.
+        """
         if energy <= 0.0:
             energy = 1.0
         if convention in ("symmetric", "unitary"):
@@ -460,7 +602,7 @@ class PsdAnalyzer(Analyzer):
             scale_p = dt / energy
             P = P * scale_p
         axis = _np.fft.fftshift(axis)
-        P = _np.fft.fftshift(P)
+        P = _np.fft.fftshift(P, axes=-1)
         return axis, P
 
     def _scale_and_shift_estimate(
@@ -476,15 +618,12 @@ class PsdAnalyzer(Analyzer):
         n_independent: int,
     ) -> _PsdEstimate:
         """Apply the same linear PSD scaling to its mean and uncertainty."""
-        shifted_axis, shifted_mean = self._scale_and_shift(
-            axis, mean, dt, convention, n_fft, energy
-        )
-        _, shifted_std = self._scale_and_shift(
-            axis, std, dt, convention, n_fft, energy
-        )
-        _, shifted_sem = self._scale_and_shift(
-            axis, sem, dt, convention, n_fft, energy
+        # One scale and one fftshift over the stacked (3, n_fft) block instead
+        # of rescaling and shifting the axis once per statistic.
+        shifted_axis, shifted = self._scale_and_shift(
+            axis, _np.stack((mean, std, sem)), dt, convention, n_fft, energy
         )
+        shifted_mean, shifted_std, shifted_sem = shifted
         return _PsdEstimate(
             axis=shifted_axis,
             mean=shifted_mean,
@@ -500,20 +639,23 @@ class PsdAnalyzer(Analyzer):
         convention: str,
         window: str | None,
         backend: Any,
+        *,
+        owns_input: bool = False,
     ) -> _PsdEstimate:
         """Classical averaged periodogram over trajectories.
 
+        ``x_proc`` has shape ``(..., n_traj, n_time)``; leading axes (e.g. one
+        per mode) are transformed in the same FFT call and kept in the result.
         All heavy array operations stay on the active backend until the very end,
-        minimizing device-to-host transfers for GPU backends.
+        minimizing device-to-host transfers for GPU backends. ``owns_input``
+        marks ``x_proc`` as a temporary that the FFT may overwrite.
         """
         n_time = int(x_proc.shape[-1])
 
+        w, energy = _window(window or None, n_time)
         if window:
-            w = self._get_window(window, n_time)
-            w_backend = backend.asarray(w)
-            x_proc = x_proc * w_backend
-        else:
-            w = _np.ones(n_time)
+            x_proc = x_proc * backend.asarray(w)
+            owns_input = True
 
         norm: Literal["backward", "ortho", "forward"] | None
         if convention in ("symmetric", "unitary"):
@@ -521,29 +663,72 @@ class PsdAnalyzer(Analyzer):
         else:
             norm = None
 
-        X = backend.fft(x_proc, axis=-1, norm=norm)
-        trajectory_psd = backend.abs(X) ** 2
-        del X
-        mean_backend = backend.mean(trajectory_psd, axis=0)
-        n_independent = int(x_proc.shape[0])
+        half_spectrum = False
+        if isinstance(x_proc, _np.ndarray):
+            # Host arrays: scipy's pocketfft runs the batch of trajectories
+            # on the configured threads and may reuse a temporary input buffer.
+            from scipy import fft as _sp_fft
+
+            workers = self._fft_workers()
+
+            if _np.iscomplexobj(x_proc):
+                X = _sp_fft.fft(
+                    x_proc, axis=-1, norm=norm, workers=workers, overwrite_x=owns_input
+                )
+            else:
+                # Real input (e.g. kind='modular'): the spectrum is Hermitian,
+                # so rfft's n_time // 2 + 1 bins carry all of the power.
+                X = _sp_fft.rfft(
+                    x_proc, axis=-1, norm=norm, workers=workers, overwrite_x=owns_input
+                )
+                half_spectrum = True
+        else:
+            X = backend.fft(x_proc, axis=-1, norm=norm)
+        # |X|^2 as Re^2 + Im^2: no square root and no separate magnitude
+        # buffer, just one temporary for the imaginary term.
+        X_re = backend.real(X)
+        X_im = backend.imag(X)
+        trajectory_psd = X_re * X_re
+        trajectory_psd += X_im * X_im
+        del X, X_re, X_im
+        n_independent = int(x_proc.shape[-2])
+        on_host = isinstance(trajectory_psd, _np.ndarray)
+        if on_host:
+            # Trajectory mean as a GEMV with uniform weights (BLAS) rather
+            # than a strided ufunc reduction.
+            weights = _np.full(
+                n_independent, 1.0 / n_independent, dtype=trajectory_psd.dtype
+            )
+            mean_backend = weights @ trajectory_psd
+        else:
+            mean_backend = backend.mean(trajectory_psd, axis=-2)
 
         mean = convert_to_numpy(mean_backend)
         if n_independent > 1:
             # Reuse the power buffer to avoid another n_traj x n_freq allocation.
-            trajectory_psd -= mean_backend
-            trajectory_psd *= trajectory_psd
-            variance_backend = backend.mean(trajectory_psd, axis=0) * (
-                n_independent / (n_independent - 1)
-            )
-            variance = convert_to_numpy(variance_backend)
+            trajectory_psd -= mean_backend[..., None, :]
+            if on_host:
+                # Fused square-and-sum: no squared deviations are written back.
+                sq_dev = _np.einsum("...ij,...ij->...j", trajectory_psd, trajectory_psd)
+                variance = sq_dev / (n_independent - 1)
+            else:
+                trajectory_psd *= trajectory_psd
+                variance_backend = backend.mean(trajectory_psd, axis=-2) * (
+                    n_independent / (n_independent - 1)
+                )
+                variance = convert_to_numpy(variance_backend)
             std = _np.sqrt(_np.maximum(variance, 0.0))
             sem = std / _np.sqrt(float(n_independent))
         else:
             std = _np.full(mean.shape, _np.nan, dtype=mean.dtype)
             sem = std.copy()
 
+        if half_spectrum:
+            mean = _mirror_half_spectrum(mean, n_time)
+            std = _mirror_half_spectrum(std, n_time)
+            sem = _mirror_half_spectrum(sem, n_time)
+
         axis = convert_to_numpy(backend.fftfreq(n_time, d=dt))
-        energy = float(_np.sum(w * w))
         return self._scale_and_shift_estimate(
             axis,
             mean,
@@ -595,20 +780,18 @@ class PsdAnalyzer(Analyzer):
         else:
             norm = None
 
-        trajectory_spectra: list[_np.ndarray] = []
-        for traj in x:
-            segment_spectra: list[_np.ndarray] = []
-            start = 0
-            while start + nperseg <= n_time:
-                seg = traj[start : start + nperseg] * w
-                if nfft > nperseg:
-                    seg = _np.pad(seg, (0, nfft - nperseg), mode="constant")
-                X = _np.fft.fft(seg, norm=norm)
-                segment_spectra.append(_np.abs(X) ** 2)
-                start += step
-            trajectory_spectra.append(_np.mean(segment_spectra, axis=0))
-
-        spectra = _np.stack(trajectory_spectra, axis=0)
+        # The segments of a chunk of trajectories as one strided (n, n_seg,
+        # nperseg) view: a single windowing pass and one batched FFT (zero
+        # padded to ``nfft``) replace the per-trajectory, per-segment loop.
+        workers = self._fft_workers()
+        n_seg = (n_time - nperseg) // step + 1
+
+        def segment_spectra(rows: _np.ndarray) -> _np.ndarray:
+            segments = _np.lib.stride_tricks.sliding_window_view(rows, nperseg, axis=-1)
+            X = _batched_fft(segments[:, ::step] * w, nfft, norm, workers)
+            return _np.mean(_power(X), axis=1)
+
+        spectra = _spectra_in_chunks(x, n_seg * max(nperseg, nfft), segment_spectra)
         mean, std, sem = self._trajectory_statistics(spectra)
         axis = _np.fft.fftfreq(nfft, d=dt)
         return self._scale_and_shift_estimate(
@@ -632,14 +815,14 @@ class PsdAnalyzer(Analyzer):
         k_tapers: int | None,
     ) -> _PsdEstimate:
         """Multitaper PSD with tapers averaged within each trajectory."""
-        from scipy.signal.windows import dpss
-
         n_traj, n_time = x.shape
         if k_tapers is None:
             k_tapers = max(1, int(2.0 * nw) - 1)
 
-        tapers = dpss(n_time, nw, Kmax=k_tapers, sym=False)
-        tapers = tapers.astype(x.real.dtype if _np.iscomplexobj(x) else x.dtype)
+        tapers = _dpss_tapers(n_time, float(nw), k_tapers)
+        tapers = tapers.astype(
+            x.real.dtype if _np.iscomplexobj(x) else x.dtype, copy=False
+        )
         energy = 1.0  # dpss windows are normalized to unit energy
 
         norm: Literal["backward", "ortho", "forward"] | None
@@ -648,16 +831,15 @@ class PsdAnalyzer(Analyzer):
         else:
             norm = None
 
-        trajectory_spectra: list[_np.ndarray] = []
-        for traj in x:
-            tapered_spectra: list[_np.ndarray] = []
-            for taper in tapers:
-                seg = traj * taper
-                X = _np.fft.fft(seg, norm=norm)
-                tapered_spectra.append(_np.abs(X) ** 2)
-            trajectory_spectra.append(_np.mean(tapered_spectra, axis=0))
+        # The (trajectory, taper) products of a chunk of trajectories in one
+        # (n, k, n_time) block and one batched FFT.
+        workers = self._fft_workers()
+
+        def taper_spectra(rows: _np.ndarray) -> _np.ndarray:
+            X = _batched_fft(rows[:, None, :] * tapers, n_time, norm, workers)
+            return _np.mean(_power(X), axis=1)
 
-        spectra = _np.stack(trajectory_spectra, axis=0)
+        spectra = _spectra_in_chunks(x, len(tapers) * n_time, taper_spectra)
         mean, std, sem = self._trajectory_statistics(spectra)
         axis = _np.fft.fftfreq(n_time, d=dt)
         return self._scale_and_shift_estimate(
@@ -358,6 +358,7 @@ class SDEResultSplitter(ResultSplitter):
                 trajectory=slice_traj,
                 meta=meta,
                 analysis=_slice_analysis(batched_result.analysis, idx),
+                trajectory_format=batched_result.trajectory_format,
             )
         return out
 
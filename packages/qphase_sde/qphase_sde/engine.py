@@ -24,6 +24,7 @@ from qphase.core.protocols import EngineBase, EngineManifest, ResultProtocol
 from qphase_sde.buffers import SDEBufferCache
 from qphase_sde.integrator.base import Integrator
 from qphase_sde.model import NoiseSpec, SDEModel
+from qphase_sde.noise import GaussianNoise
 from qphase_sde.result import SDEResult
 from qphase_sde.state import TrajectorySet
 
@@ -37,7 +38,7 @@ class EngineConfig(BaseModel):
     1. Time Domain: t0, t1, dt
     2. Ensemble: n_traj, seed, ic
     3. Adaptive Stepping: adaptive, atol, rtol, min_dt, max_dt
-    4. Output Control: save_stride
+    4. Output Control: save_stride, trajectory_format
     """
 
     model_config = ConfigDict(extra="allow")
@@ -127,6 +128,16 @@ class EngineConfig(BaseModel):
         json_schema_extra={"scanable": False},
     )
 
+    trajectory_format: Literal["npz", "npy"] = Field(
+        "npz",
+        description=(
+            "On-disk layout of saved trajectories. 'npz' stores them in the "
+            "compressed result archive; 'npy' writes a raw array beside it "
+            "that loaders can memory-map directly"
+        ),
+        json_schema_extra={"scanable": False},
+    )
+
     mode: Literal["simulate", "analyze"] = Field(
         "simulate",
         description=(
@@ -188,6 +199,17 @@ def get_integrator() -> Integrator:
     return _context.get_integrator()
 
 
+def _save_offsets(k: int, n_chunk: int, stride: int) -> tuple[int, ...]:
+    """Return the offsets in ``1..n_chunk`` of steps after ``k`` that are saved.
+
+    Saved steps are the multiples of ``stride``, so the offsets form one
+    arithmetic range starting at the first multiple past ``k``; with
+    ``stride == 1`` that is every step of the chunk.
+    """
+    first = (-k) % stride or stride
+    return tuple(range(first, n_chunk + 1, stride))
+
+
 # -----------------------------------------------------------------------------
 # Engine Class
 # -----------------------------------------------------------------------------
@@ -397,10 +419,7 @@ class Engine(EngineBase):
         # expects numpy arrays and retaining it would cause large D2H transfers.
         backend_name = ""
         if self._default_backend is not None:
-            try:
-                backend_name = self._default_backend.backend_name()
-            except Exception:
-                backend_name = ""
+            backend_name = self._default_backend.backend_name()
 
         # Run analyzers if configured
         analysis_results: dict[str, Any] = {}
@@ -511,7 +530,12 @@ class Engine(EngineBase):
             elif hasattr(model, "params"):
                 meta["params"] = model.params
 
-        return SDEResult(trajectory=traj_set, meta=meta, analysis=analysis_results)
+        return SDEResult(
+            trajectory=traj_set,
+            meta=meta,
+            analysis=analysis_results,
+            trajectory_format=self.config.trajectory_format,
+        )
 
     def run_sde(
         self,
@@ -565,7 +589,7 @@ class Engine(EngineBase):
         backend : BackendBase, optional
             Backend instance; overrides Engine default if provided
         noise_spec : NoiseSpec, optional
-            Noise specification
+            Noise specification; defaults to independent channels
         seed : int, optional
             RNG seed
         master_seed : int, optional
@@ -677,6 +701,10 @@ class Engine(EngineBase):
         # Initialize state variables (unwrap State object for loop performance)
         # We keep 'y' (data) and 't' (time) as separate variables to avoid
         # creating State objects in the inner loop.
+        # The integrators' kernels work on C-contiguous host buffers; strided
+        # NumPy initial conditions (e.g. a column view) are copied once here.
+        if isinstance(y0, np.ndarray) and not y0.flags.c_contiguous:
+            y0 = np.ascontiguousarray(y0)
         y = y0
         t = float(t0)
 
@@ -727,9 +755,20 @@ class Engine(EngineBase):
         save_dt = dt * rs
         next_save_time = t0 + save_dt
 
+        # Noise setup: the sampler is built once per run so that per-spec work
+        # (e.g. factorizing a correlated covariance) stays out of the loop.
+        if noise_spec is None:
+            noise_spec = NoiseSpec(kind="independent", dim=model.noise_dim)
+        elif noise_spec.dim != model.noise_dim:
+            raise ValueError(
+                f"noise_spec.dim ({noise_spec.dim}) does not match "
+                f"model.noise_dim ({model.noise_dim})"
+            )
+        noise_dtype = y.real.dtype if hasattr(y, "real") else y.dtype
+        noise = GaussianNoise(noise_spec, be, dtype=noise_dtype)
+
         # Adaptive stepping setup
         use_adaptive = False
-        noise_spec = None
         # Ensure config is not None (use default if None)
         config = self.config if self.config is not None else EngineConfig()
         if (
@@ -751,8 +790,6 @@ class Engine(EngineBase):
             if hasattr(integrator, "max_dt"):
                 integrator.max_dt = config.max_dt
 
-            noise_spec = NoiseSpec(kind="independent", dim=model.noise_dim)
-
         current_dt = dt
         k = 0
 
@@ -777,17 +814,8 @@ class Engine(EngineBase):
                 assert rng is not None, "RNG not initialized"
                 assert callable(chunk_step)
                 n_chunk = min(requested_chunk_steps, steps - k)
-                noise_dtype = y.real.dtype if hasattr(y, "real") else y.dtype
-                raw_noise = be.randn(
-                    rng,
-                    (n_chunk, n_traj, model.noise_dim),
-                    dtype=noise_dtype,
-                )
-                dt_sqrt = be.asarray(dt**0.5, dtype=raw_noise.dtype)
-                d_w = raw_noise * dt_sqrt
-                save_offsets = tuple(
-                    offset for offset in range(1, n_chunk + 1) if (k + offset) % rs == 0
-                )
+                d_w = noise.sample(rng, (n_chunk, n_traj, model.noise_dim), dt)
+                save_offsets = _save_offsets(k, n_chunk, rs)
                 result = chunk_step(
                     y,
                     t,
@@ -814,7 +842,6 @@ class Engine(EngineBase):
                 t_prev = t
 
                 if use_adaptive:
-                    assert noise_spec is not None
                     y_next, t_next, next_dt, error = integrator.step_adaptive(
                         y, t, current_dt, tol, model, noise_spec, be, rng
                     )
@@ -823,22 +850,9 @@ class Engine(EngineBase):
                     current_dt = float(next_dt)
                 else:
                     assert rng is not None, "RNG not initialized"
-                    noise_dtype = float
-                    if hasattr(y, "real") and hasattr(y.real, "dtype"):
-                        noise_dtype = y.real.dtype
-                    elif hasattr(y, "dtype"):
-                        noise_dtype = y.dtype
-
-                    raw_noise = be.randn(
-                        rng, (n_traj, model.noise_dim), dtype=noise_dtype
-                    )
-                    dt_sqrt = current_dt**0.5
-                    if hasattr(raw_noise, "dtype"):
-                        dt_sqrt = be.asarray(dt_sqrt, dtype=raw_noise.dtype)
-
                     dW = buf_cache.get((n_traj, model.noise_dim), noise_dtype)
                     try:
-                        dW[...] = raw_noise * dt_sqrt
+                        noise.sample(rng, (n_traj, model.noise_dim), current_dt, out=dW)
                         dy = integrator.step(y, t, current_dt, model, dW, be)
                         y = y + dy
                         t += current_dt
@@ -0,0 +1,178 @@
+"""qphase_sde: Gaussian Noise Sampling
+---------------------------------------------------------
+Generates the real-valued Wiener increments ``dW`` consumed by the integrators.
+A sampler is built once per simulation from a :class:`NoiseSpec`, so per-run
+work such as factorizing a correlated covariance is kept out of the
+integration loop.
+
+Public API
+----------
+``GaussianNoise`` : Sampler for independent or correlated noise increments.
+"""
+
+import math
+from importlib import import_module
+from typing import Any
+
+import numpy as np
+from qphase.backend.base import BackendBase
+from qphase.backend.xputil import convert_to_numpy
+
+from qphase_sde.model import NoiseSpec
+
+__all__ = ["GaussianNoise"]
+
+
+class GaussianNoise:
+    """Sampler for ``sqrt(dt)``-scaled Gaussian noise increments.
+
+    For ``kind='independent'`` the channels are i.i.d. standard normals. For
+    ``kind='correlated'`` the draws are mixed with the Cholesky factor of
+    ``spec.covariance`` so that ``Cov(dW) = covariance * dt``.
+
+    Parameters
+    ----------
+    spec : NoiseSpec
+        Noise specification (kind, number of channels, covariance).
+    backend : BackendBase
+        Backend used for sampling and array operations.
+    dtype : Any, optional
+        Real dtype of the increments. Defaults to the backend's default.
+
+    """
+
+    def __init__(
+        self, spec: NoiseSpec, backend: BackendBase, dtype: Any | None = None
+    ) -> None:
+        self.spec = spec
+        self.backend = backend
+        self.dtype = dtype
+        self._chol_T: Any | None = None
+        # Integrators call ``sample`` with the same ``dt`` every step, so the
+        # scale factors are cached until ``dt`` changes (adaptive stepping).
+        self._last_dt: float | None = None
+        self._sqrt_dt = 0.0
+        self._chol_T_scaled: Any | None = None
+        # Resolved once: optional in-place fill used for ``out=`` and
+        # per-trajectory streams.
+        self._randn_into = getattr(backend, "randn_into", None)
+        # Correlated draws go into a persistent scratch buffer and are mixed
+        # with ``matmul(..., out=)``, so a step allocates nothing on the host
+        # and skips the device allocator on CUDA backends.
+        self._matmul_into = _resolve_matmul_into(backend)
+        self._z: Any | None = None
+
+        if spec.kind == "correlated":
+            if spec.covariance is None:
+                raise ValueError("Correlated noise requires a covariance matrix")
+            cov = np.asarray(convert_to_numpy(spec.covariance), dtype=np.float64)
+            if cov.shape != (spec.dim, spec.dim):
+                raise ValueError(
+                    f"Noise covariance must have shape ({spec.dim}, {spec.dim}), "
+                    f"got {cov.shape}"
+                )
+            # The (M, M) factor is tiny: factor once on the host and upload the
+            # transpose as a C-contiguous array in the noise dtype, so the
+            # per-step contraction never sees a strided operand.
+            chol = np.linalg.cholesky(cov)
+            self._chol_T = backend.asarray(np.ascontiguousarray(chol.T), dtype=dtype)
+        elif spec.kind != "independent":
+            raise ValueError(
+                f"Unknown noise kind '{spec.kind}'; "
+                "expected 'independent' or 'correlated'"
+            )
+
+    def sample(
+        self, rng: Any, shape: tuple[int, ...], dt: float, out: Any | None = None
+    ) -> Any:
+        """Draw noise increments of ``shape`` scaled by ``sqrt(dt)``.
+
+        The last axis of ``shape`` must equal ``spec.dim``. ``rng`` is either a
+        single RNG handle or a sequence of per-trajectory handles, one for each
+        entry of the trajectory axis ``shape[-2]``. When ``out`` is given the
+        increments are written into it and ``out`` is returned.
+        """
+        if dt != self._last_dt:
+            self._last_dt = dt
+            self._sqrt_dt = math.sqrt(dt)
+            if self._chol_T is not None:
+                self._chol_T_scaled = self._sqrt_dt * self._chol_T
+
+        if self._chol_T_scaled is None:
+            z = self._draw(rng, shape, out)
+            z *= self._sqrt_dt
+            return z
+
+        # Plain GEMM: ``(..., M) @ (M, M)`` dispatches straight to BLAS /
+        # cuBLAS without einsum's per-call path planning. Scaling the small
+        # factor instead of the result avoids a pass over the increments.
+        if self._matmul_into is not None:
+            z = self._draw(rng, shape, self._scratch(shape))
+            return self._matmul_into(z, self._chol_T_scaled, out=out)
+        dW = self.backend.matmul(self._draw(rng, shape, None), self._chol_T_scaled)
+        if out is None:
+            return dW
+        out[...] = dW
+        return out
+
+    def _scratch(self, shape: tuple[int, ...]) -> Any:
+        """Return the reusable standard-normal buffer for ``shape``.
+
+        The buffer only grows along the leading axis, so shorter requests (the
+        final partial chunk) are served by a contiguous leading slice.
+        """
+        z = self._z
+        if z is None or tuple(z.shape[1:]) != shape[1:] or z.shape[0] < shape[0]:
+            z = self._z = self.backend.empty(shape, dtype=self.dtype)
+        return z[: shape[0]]
+
+    def _draw(self, rng: Any, shape: tuple[int, ...], out: Any | None) -> Any:
+        """Draw standard normals, into ``out`` when one is provided."""
+        if isinstance(rng, (list, tuple)):
+            return self._randn_per_trajectory(rng, shape, out)
+        if out is None:
+            return self.backend.randn(rng, shape, dtype=self.dtype)
+        if self._randn_into is not None:
+            self._randn_into(rng, out)
+        else:
+            out[...] = self.backend.randn(rng, shape, dtype=self.dtype)
+        return out
+
+    def _randn_per_trajectory(
+        self, rngs: Any, shape: tuple[int, ...], out: Any | None = None
+    ) -> Any:
+        """Fill one preallocated buffer from per-trajectory RNG streams."""
+        if len(shape) < 2 or len(rngs) != shape[-2]:
+            raise ValueError(
+                f"Expected {shape[-2] if len(shape) >= 2 else '?'} per-trajectory "
+                f"RNGs for noise shape {shape}, got {len(rngs)}"
+            )
+        be = self.backend
+        dtype = self.dtype
+        z = out if out is not None else be.empty(shape, dtype=dtype)
+        fill = self._randn_into
+        row_shape = shape[:-2] + shape[-1:]
+        for i, r in enumerate(rngs):
+            if fill is not None:
+                fill(r, z[..., i, :])
+            else:
+                z[..., i, :] = be.randn(r, row_shape, dtype=dtype)
+        return z
+
+
+# Module providing an ``out=``-capable ``matmul`` for each backend name. Modules
+# are imported on first use so cupy/torch are only loaded when selected.
+_MATMUL_MODULES = {
+    "numpy": "numpy",
+    "numba": "numpy",
+    "cupy": "cupy",
+    "torch": "torch",
+}
+
+
+def _resolve_matmul_into(backend: BackendBase) -> Any | None:
+    """Return an ``out=``-capable matmul for ``backend``, or None if unknown."""
+    module = _MATMUL_MODULES.get(backend.backend_name().lower())
+    if module is None:
+        return None
+    return import_module(module).matmul
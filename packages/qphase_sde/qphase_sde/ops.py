@@ -11,8 +11,11 @@ Public API
     real-basis equivalent.
 ``contract_noise`` : Compute L @ dW across the noise channel dimension.
 ``scaled_noise`` : Generate sqrt(dt) * N(0,1) noise increments.
+``is_complex_dtype`` : Check for a complex NumPy/CuPy or torch dtype.
 """
 
+import math
+from collections.abc import Callable
 from typing import Any
 
 from qphase.backend.base import BackendBase
@@ -22,8 +25,11 @@ __all__ = [
     "contract_noise",
     "scaled_noise",
     "supports_kernelized_terms",
+    "is_complex_dtype",
 ]
 
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
 
 def expand_complex_noise(Lc: Any, backend: BackendBase) -> Any:
     """Expand complex-basis diffusion matrix to an equivalent real basis.
@@ -31,15 +37,62 @@ def expand_complex_noise(Lc: Any, backend: BackendBase) -> Any:
     Transforms ``Lc`` with shape ``(..., n_modes, M_c)`` into ``Lr`` with
     shape ``(..., n_modes, 2*M_c)`` using only backend operations, preserving
     contraction with real-valued noise increments.
+
+    With ``Lc = a + ib`` the real-basis blocks are ``(a + ib) / sqrt(2)`` and
+    ``(-b + ia) / sqrt(2) = i * Lc / sqrt(2)``, so the result is assembled from
+    ``Lc`` and its rotation without splitting into real and imaginary parts.
+    For complex ``Lc`` both blocks are written into one preallocated output
+    and scaled in place, so no intermediate arrays are created.
     """
-    a = backend.real(Lc)
-    b = backend.imag(Lc)
-    s = backend.sqrt(
-        backend.asarray(2.0, dtype=a.dtype if hasattr(a, "dtype") else None)
-    )
-    Lr_real = backend.concatenate((a / s, -b / s), axis=-1)
-    Lr_imag = backend.concatenate((b / s, a / s), axis=-1)
-    return Lr_real + 1j * Lr_imag
+    if not is_complex_dtype(getattr(Lc, "dtype", None)):
+        scaled = Lc * _INV_SQRT2
+        return backend.concatenate((scaled, 1j * scaled), axis=-1)
+    m = Lc.shape[-1]
+    out = backend.empty((*Lc.shape[:-1], 2 * m), dtype=Lc.dtype)
+    lo = out[..., :m]
+    hi = out[..., m:]
+    lo[...] = Lc
+    hi[...] = Lc
+    lo *= _INV_SQRT2
+    hi *= 1j * _INV_SQRT2
+    return out
+
+
+def is_complex_dtype(dtype: Any) -> bool:
+    """Return True for complex NumPy/CuPy dtypes and torch complex dtypes."""
+    kind = getattr(dtype, "kind", None)
+    if kind is not None:
+        return kind == "c"
+    return bool(getattr(dtype, "is_complex", False))
+
+
+def _contract_einsum(L: Any, dW: Any, backend: BackendBase) -> Any:
+    return backend.einsum("...ij,...j->...i", L, dW)
+
+
+def _resolve_contractor(backend: BackendBase) -> Callable[[Any, Any, Any], Any]:
+    """Pick the contraction routine for ``backend`` (imports happen here once)."""
+    be_name = backend.backend_name().lower()
+    if be_name == "cupy":
+        # Avoid importing cupy at module load time; it may not be installed.
+        import cupy as cp
+
+        cp_matmul = cp.matmul
+        return lambda L, dW, _be: cp_matmul(L, dW[..., None]).squeeze(-1)
+
+    if be_name == "torch":
+        import torch as th
+
+        th_bmm = th.bmm
+        return lambda L, dW, _be: th_bmm(L, dW.unsqueeze(-1)).squeeze(-1)
+
+    # Generic fallback: numpy, numba, and any other backend implementing einsum.
+    return _contract_einsum
+
+
+# Contraction routine per backend class, resolved on first use so the per-step
+# call is a single dict lookup (no backend_name() probe or import machinery).
+_CONTRACTORS: dict[type, Callable[[Any, Any, Any], Any]] = {}
 
 
 def contract_noise(L: Any, dW: Any, backend: BackendBase) -> Any:
@@ -54,25 +107,10 @@ def contract_noise(L: Any, dW: Any, backend: BackendBase) -> Any:
     - cupy/torch: batched matrix multiplication
     - numpy/numba: ``einsum("...ij,...j->...i", L, dW)``
     """
-    be_name = ""
-    try:
-        be_name = str(backend.backend_name()).lower()
-    except Exception:
-        pass
-
-    if be_name == "cupy":
-        # Avoid importing cupy at module load time; it may not be installed.
-        import cupy as cp
-
-        return cp.matmul(L, dW[..., None]).squeeze(-1)
-
-    if be_name == "torch":
-        import torch as th
-
-        return th.bmm(L, dW.unsqueeze(-1)).squeeze(-1)
-
-    # Generic fallback: numpy, numba, and any other backend implementing einsum.
-    return backend.einsum("...ij,...j->...i", L, dW)
+    fn = _CONTRACTORS.get(type(backend))
+    if fn is None:
+        fn = _CONTRACTORS[type(backend)] = _resolve_contractor(backend)
+    return fn(L, dW, backend)
 
 
 def scaled_noise(
@@ -7,6 +7,7 @@ Public API
 ``SDEResult`` : Container for SDE simulation results.
 """
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,7 @@ from typing import Any
 import numpy as np
 from qphase.backend.xputil import convert_to_numpy
 from qphase.core.errors import QPhaseError
+from qphase.core.result_loader import load_npz_data
 
 
 @dataclass
@@ -26,12 +28,16 @@ class SDEResult:
         The trajectory data (e.g., numpy array or TrajectorySet).
     meta : dict[str, Any]
         Metadata about the simulation (config, runtime info, etc.).
+    trajectory_format : {"npz", "npy"}
+        How ``save`` stores the trajectory: inside the compressed archive, or
+        as a raw ``.npy`` file beside it that can be memory-mapped.
 
     """
 
     trajectory: Any = None
     analysis: dict[str, Any] = field(default_factory=dict)
     meta: dict[str, Any] = field(default_factory=dict)
+    trajectory_format: str = "npz"
 
     @property
     def data(self) -> Any:
@@ -75,10 +81,14 @@ class SDEResult:
         Parameters
         ----------
         path : str | Path
-            Path to save the result to.
+            Path to save the result to. ``.npz`` is appended when missing.
+            With the ``npy`` trajectory format the trajectory goes to a
+            ``.npy`` file of the same name, which the archive refers to.
 
         """
         path = Path(path)
+        if path.suffix != ".npz":
+            path = path.with_name(path.name + ".npz")
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Convert trajectory to numpy if possible for storage
@@ -109,7 +119,16 @@ class SDEResult:
                 ),
             }
 
-            if data_to_save is not None:
+            if data_to_save is not None and self.trajectory_format == "npy":
+                raw = path.with_suffix(".npy")
+                # Write then rename, so a reader mapping an earlier file
+                # keeps its (unlinked) copy intact.
+                tmp = raw.with_name(raw.name + ".tmp")
+                with open(tmp, "wb") as fh:
+                    np.save(fh, data_to_save)
+                os.replace(tmp, raw)
+                save_kwargs["data_file"] = np.array(raw.name)
+            elif data_to_save is not None:
                 save_kwargs["data"] = data_to_save
 
             np.savez_compressed(path, **save_kwargs)
@@ -117,13 +136,20 @@ class SDEResult:
             raise QPhaseError(f"Failed to save SDEResult to {path}: {e}") from e
 
     @classmethod
-    def load(cls, path: str | Path) -> "SDEResult":
+    def load(cls, path: str | Path, *, mmap: bool = False) -> "SDEResult":
         """Load a result from a file.
 
         Parameters
         ----------
         path : str | Path
             Path to load the result from.
+        mmap : bool, default False
+            Memory-map the trajectory data instead of reading it, so only the
+            pages that are accessed are loaded. This applies to trajectories
+            saved in the ``npy`` format and to archives written uncompressed
+            (e.g. by ``TrajectorySet.save``); compressed ones are always read.
+            The mapped array is read-only, and the file must not be
+            overwritten in place while the result is in use.
 
         Returns
         -------
@@ -136,7 +162,9 @@ class SDEResult:
             raise QPhaseError(f"File not found: {path}")
         try:
             with np.load(path, allow_pickle=True) as npz:
-                data = npz["data"] if "data" in npz else None
+                # On request, trajectories saved as raw ``.npy`` files or
+                # uncompressed members are mapped, not read into memory.
+                data = load_npz_data(path, npz, mmap=mmap)
                 t0 = float(npz["t0"]) if "t0" in npz else 0.0
                 dt = float(npz["dt"]) if "dt" in npz else 1.0
                 meta = npz["meta"].item() if "meta" in npz else {}
@@ -157,7 +185,12 @@ class SDEResult:
 
                     traj = MinimalTrajectory(data, t0, dt, trajectory_meta)
 
-                return cls(trajectory=traj, meta=meta, analysis=analysis)
+                return cls(
+                    trajectory=traj,
+                    meta=meta,
+                    analysis=analysis,
+                    trajectory_format="npy" if "data_file" in npz else "npz",
+                )
 
         except Exception as e:
             raise QPhaseError(f"Failed to load SDEResult from {path}: {e}") from e
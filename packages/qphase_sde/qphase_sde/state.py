@@ -9,16 +9,20 @@ Public API
 ``TrajectorySet`` : Container for a set of trajectories.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
 from qphase.backend.base import ArrayBase
 
+from qphase_sde.ops import is_complex_dtype
+
 __all__ = ["State", "TrajectorySet"]
 
+_ALL = slice(None)
+
 
-@dataclass
+@dataclass(slots=True)
 class State(ArrayBase):
     """Backend-agnostic quantum state container.
 
@@ -37,13 +41,16 @@ class State(ArrayBase):
     t: float = 0.0
 
     def __post_init__(self):
-        """Post-initialization hook to ensure proper data shape."""
-        # Ensure 2D shape (n_traj, n_modes)
-        if hasattr(self.data, "ndim") and self.data.ndim == 1:
-            try:
-                self.data = self.data[None, ...]
-            except Exception:
-                pass
+        """Post-initialization hook to ensure proper data shape.
+
+        The data is never cast or copied: its dtype (e.g. ``complex64``) and
+        memory layout are kept as given, so ``view`` results share memory
+        with their source, and a 1D input is promoted to ``(1, n_modes)``
+        through a view. Kernels that need C-contiguous data make it so where
+        they consume it.
+        """
+        if getattr(self.data, "ndim", None) == 1:
+            self.data = self.data[None, :]
 
     @property
     def n_traj(self) -> int:
@@ -56,12 +63,50 @@ class State(ArrayBase):
         return int(self.data.shape[1])
 
     def view(self, *, modes=None, trajectories=None) -> "State":
+        rows = _ALL if trajectories is None else trajectories
+        cols = _ALL if modes is None else modes
+        if isinstance(rows, slice) or isinstance(cols, slice):
+            # At most one index array: a single indexing call gives the same
+            # selection as slicing rows then columns.
+            y = self.data[rows, cols]
+        else:
+            # Two index arrays would be paired element-wise; keep the
+            # rows-then-columns (outer) selection.
+            y = self.data[rows, :][:, cols]
+        return State(data=y, t=self.t, meta=self._copy_meta())
+
+    def as_real(self, out: Any | None = None) -> Any:
+        """Return the state as real ``[Re(y) | Im(y)]`` of shape (n_traj, 2*n_modes).
+
+        Parameters
+        ----------
+        out : array, optional
+            Destination buffer with the result's shape and the real dtype of
+            ``data`` (e.g. ``float32`` for ``complex64``). Following the NumPy
+            ufunc convention it is filled in place and returned, so callers
+            converting many snapshots can reuse one allocation.
+
+        Returns
+        -------
+        array
+            Real array on the same backend as ``data``.
+
+        """
         y = self.data
-        if trajectories is not None:
-            y = y[trajectories, :]
-        if modes is not None:
-            y = y[:, modes]
-        return State(data=y, t=self.t, meta=self.meta.copy())
+        re = y.real
+        n = y.shape[-1]
+        shape = (*y.shape[:-1], 2 * n)
+        if out is None:
+            out = self.xp.empty(shape, dtype=re.dtype)
+        elif tuple(out.shape) != shape or out.dtype != re.dtype:
+            raise ValueError(
+                f"as_real: out must have shape {shape} and dtype {re.dtype}, "
+                f"got {tuple(out.shape)} and {out.dtype}"
+            )
+        out[..., :n] = re
+        # Real inputs have a zero imaginary half.
+        out[..., n:] = y.imag if is_complex_dtype(y.dtype) else 0
+        return out
 
     # Alias for backward compatibility if needed, but prefer .data
     @property
@@ -82,7 +127,7 @@ class State(ArrayBase):
         self.meta = value
 
 
-@dataclass
+@dataclass(slots=True)
 class TrajectorySet(ArrayBase):
     """Backend-agnostic trajectory set container.
 
@@ -102,6 +147,8 @@ class TrajectorySet(ArrayBase):
     data: Any
     t0: float = 0.0
     dt: float = 1.0
+    # Memoized ``(key, times)`` pair for :attr:`times`; not part of the value.
+    _times: Any = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def n_traj(self) -> int:
@@ -117,8 +164,24 @@ class TrajectorySet(ArrayBase):
 
     @property
     def times(self) -> Any:
-        """Return the time axis."""
-        return self.t0 + self.dt * self.xp.arange(self.n_steps)
+        """Return the time axis.
+
+        The axis is memoized on ``(t0, dt, n_steps)`` since plotters and
+        analysers ask for it repeatedly. The shared NumPy array is marked
+        read-only, so callers can use it without a defensive copy.
+        """
+        key = (self.t0, self.dt, self.n_steps)
+        cached = self._times
+        if cached is None or cached[0] != key:
+            # Start from a float arange and scale in place: no integer array
+            # and no intermediate products are allocated.
+            times = self.xp.arange(self.n_steps, dtype=float)
+            times *= self.dt
+            times += self.t0
+            if isinstance(times, np.ndarray):
+                times.flags.writeable = False
+            cached = self._times = (key, times)
+        return cached[1]
 
     @property
     def index(self) -> Any:
@@ -5,6 +5,7 @@ Defines the configuration schemas for the visualization engine and individual pl
 Public API
 ----------
 `BasePlotterConfig` : Base configuration for all plotters.
+`GridLayoutConfig` : Optional single-figure grid layout shared by plotter configs.
 `TimeSeriesSpec` : Specification for a single Time Series plot.
 `TimeSeriesConfig` : Configuration for Time Series Plotter (list of specs).
 `PhasePlaneSpec` : Specification for a single Phase Plane plot.
@@ -14,9 +15,10 @@ Public API
 `VizEngineConfig` : Configuration for the Visualization Engine.
 """
 
+from collections.abc import Sequence
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class BasePlotterConfig(BaseModel):
@@ -36,9 +38,126 @@ class BasePlotterConfig(BaseModel):
     filename: str | None = Field(
         None, description="Output filename (without extension)"
     )
+    precision: Literal["double", "single"] = Field(
+        "double",
+        description=(
+            "Numeric precision of the plotted data; 'single' downcasts to "
+            "float32/complex64 to halve memory traffic (display only)"
+        ),
+    )
+
+    png_compress_level: int = Field(
+        3,
+        ge=0,
+        le=9,
+        description=(
+            "zlib level for PNG output (0-9); lower saves faster, larger files"
+        ),
+    )
+
+    margins: tuple[float, float, float, float] | None = Field(
+        None,
+        description=(
+            "Fixed (left, right, top, bottom) subplot margins as figure "
+            "fractions; skips the tight bounding-box pass when saving"
+        ),
+    )
+
+    reuse_figure: bool = Field(
+        False,
+        description=(
+            "Redraw into a cached figure of the same size, dpi and margins "
+            "instead of building a new one per plot (batch rendering)"
+        ),
+    )
+
+    background_save: bool = Field(
+        False,
+        description=(
+            "Encode and write the file on a worker thread so the next plot "
+            "renders meanwhile; see plotters.base.wait_for_saves"
+        ),
+    )
+
+    save_mode: Literal["disk", "bytes", "both"] = Field(
+        "disk",
+        description=(
+            "Write the file ('disk'), keep the encoded image in memory for a "
+            "downstream consumer ('bytes'), or do both from one encode"
+        ),
+    )
 
     model_config = ConfigDict(extra="allow")
 
+    @model_validator(mode="after")
+    def _check_background_save(self) -> "BasePlotterConfig":
+        """Reject background saves of figures that the next plot clears."""
+        if self.background_save and self.reuse_figure:
+            raise ValueError("background_save cannot be combined with reuse_figure")
+        return self
+
+    @field_validator("margins")
+    @classmethod
+    def _check_margins(
+        cls, value: tuple[float, float, float, float] | None
+    ) -> tuple[float, float, float, float] | None:
+        """Require 0 <= left < right <= 1 and 0 <= bottom < top <= 1."""
+        if value is not None:
+            left, right, top, bottom = value
+            if not (0 <= left < right <= 1 and 0 <= bottom < top <= 1):
+                raise ValueError(
+                    "margins must satisfy 0 <= left < right <= 1 and "
+                    f"0 <= bottom < top <= 1, got {value}"
+                )
+        return value
+
+    @field_validator("xlim", "ylim")
+    @classmethod
+    def _check_limits(
+        cls, value: tuple[float, float] | None
+    ) -> tuple[float, float] | None:
+        """Reject empty axis ranges once, when the spec is built.
+
+        Reversed limits (``hi < lo``) are allowed: Matplotlib draws them as
+        an inverted axis.
+        """
+        if value is not None and value[0] == value[1]:
+            raise ValueError(f"axis limits must not be equal, got {value}")
+        return value
+
+
+class GridLayoutConfig(BaseModel):
+    """Optional grid layout for a plotter's list of specs.
+
+    With ``grid`` set, all specs are drawn on the axes of one figure (row
+    by row) and saved once, instead of one figure and file per spec.
+    """
+
+    grid: tuple[int, int] | None = Field(
+        None, description="Draw all plots on one figure as (rows, cols) axes"
+    )
+    grid_filename: str | None = Field(
+        None, description="Output filename of the grid figure (without extension)"
+    )
+    plots: Sequence[BasePlotterConfig] = Field(
+        default_factory=list, description="Plot specifications laid out on the grid"
+    )
+
+    @model_validator(mode="after")
+    def _check_grid(self) -> "GridLayoutConfig":
+        """Require a positive grid with room for every spec."""
+        if self.grid is None:
+            return self
+        rows, cols = self.grid
+        if rows < 1 or cols < 1:
+            raise ValueError(f"grid must have positive (rows, cols), got {self.grid}")
+        n_plots = len(self.plots)
+        if n_plots > rows * cols:
+            raise ValueError(
+                f"grid {self.grid} has {rows * cols} axes for {n_plots} plots"
+            )
+        return self
+
 
 class TimeSeriesSpec(BasePlotterConfig):
     """Specification for a single Time Series Plot.
@@ -57,9 +176,17 @@ class TimeSeriesSpec(BasePlotterConfig):
         "mean", description="Trajectory selection: int (index), 'mean', or 'all'"
     )
     legend: bool = Field(True, description="Show legend")
+    max_points: int | None = Field(
+        None, ge=1, description="Decimate each trace to at most this many points"
+    )
+    max_trajectories: int | None = Field(
+        None,
+        ge=1,
+        description="Draw at most this many trajectories when trajectories='all'",
+    )
 
 
-class TimeSeriesConfig(BaseModel):
+class TimeSeriesConfig(GridLayoutConfig):
     """Configuration for Time Series Plotter.
 
     Contains a list of plot specifications.
@@ -88,7 +215,7 @@ class PhasePlaneSpec(BasePlotterConfig):
     cmap: str = Field("viridis", description="Colormap")
 
 
-class PhasePlaneConfig(BaseModel):
+class PhasePlaneConfig(GridLayoutConfig):
     """Configuration for Phase Plane Plotter.
 
     Contains a list of plot specifications.
@@ -113,6 +240,7 @@ class PowerSpectrumSpec(BasePlotterConfig):
         "hann", description="Window function"
     )
     scale: Literal["linear", "log", "dB"] = Field("log", description="Y-axis scale")
+    legend: bool = Field(True, description="Show legend")
     detrend: bool = Field(True, description="Detrend data before FFT")
     nperseg: int | None = Field(
         None, description="Length of each segment for Welch's method"
@@ -121,7 +249,7 @@ class PowerSpectrumSpec(BasePlotterConfig):
     annotate_peaks: bool = Field(False, description="Annotate peaks on plot")
 
 
-class PowerSpectrumConfig(BaseModel):
+class PowerSpectrumConfig(GridLayoutConfig):
     """Configuration for Power Spectrum Plotter.
 
     Contains a list of plot specifications.
@@ -175,5 +303,20 @@ class VizEngineConfig(BaseModel):
     style_overrides: dict[str, Any] = Field(
         default_factory=dict, description="Global matplotlib style overrides"
     )
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Worker processes rendering plotters in parallel; 1 renders "
+            "in the calling process"
+        ),
+    )
+    incremental: bool = Field(
+        default=False,
+        description=(
+            "Skip plotters whose config, format, styles and input data are "
+            "unchanged since their files were written (replotting)"
+        ),
+    )
 
     model_config = ConfigDict(extra="allow")
@@ -7,28 +7,173 @@ Public API
 ``VizEngine``, ``VizResult``
 """
 
+import contextlib
+import hashlib
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TypeVar
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
+import numpy as np
 from qphase.core.errors import QPhaseRuntimeError
 from qphase.core.protocols import EngineBase, EngineManifest, ResultProtocol
+from qphase.core.utils import json_dumps, json_loads
 
 from .config import VizEngineConfig
-from .plotters.base import PlotterProtocol
+from .plotters.base import PlotterProtocol, pop_rendered_bytes, wait_for_saves
+
+_T = TypeVar("_T")
 
 
 def _set_default_rcparams() -> None:
     """Apply project-wide default Matplotlib font/mathtext settings."""
-    plt.rcParams["font.family"] = "sans-serif"
-    plt.rcParams["font.sans-serif"] = ["Arial"]
-    plt.rcParams["mathtext.fontset"] = "custom"
-    plt.rcParams["mathtext.rm"] = "sans"
-    plt.rcParams["mathtext.it"] = "sans:italic"
-    plt.rcParams["mathtext.bf"] = "sans:bold"
-    plt.rcParams["axes.labelsize"] = 18
-    plt.rcParams["xtick.labelsize"] = 15
-    plt.rcParams["ytick.labelsize"] = 15
+    mpl.rcParams["font.family"] = "sans-serif"
+    mpl.rcParams["font.sans-serif"] = ["Arial"]
+    mpl.rcParams["mathtext.fontset"] = "custom"
+    mpl.rcParams["mathtext.rm"] = "sans"
+    mpl.rcParams["mathtext.it"] = "sans:italic"
+    mpl.rcParams["mathtext.bf"] = "sans:bold"
+    mpl.rcParams["axes.labelsize"] = 18
+    mpl.rcParams["xtick.labelsize"] = 15
+    mpl.rcParams["ytick.labelsize"] = 15
+
+
+def _apply_styles(style_overrides: dict[str, Any]) -> None:
+    """Apply the default rcParams followed by the configured overrides."""
+    _set_default_rcparams()
+    if style_overrides:
+        mpl.rcParams.update(style_overrides)
+
+
+def _render_in_worker(
+    plotter: PlotterProtocol, data: Any, output_dir: Path, format: str
+) -> tuple[list[Path], dict[Path, bytes], set[Path]]:
+    """Run one plotter in a worker process and flush its saves there.
+
+    Background saves and in-memory images live in the worker, so both are
+    settled before the paths and bytes are sent back.
+    """
+    return _render_and_flush(lambda: plotter.plot(data, output_dir, format))
+
+
+def _render_and_flush(
+    render: Callable[[], _T],
+) -> tuple[_T, dict[Path, bytes], set[Path]]:
+    """Call ``render``, then settle the saves and images it left behind.
+
+    Blocks until the background saves are written and collects the images
+    encoded in memory (see :func:`pop_rendered_bytes`). Both happen even
+    when ``render`` fails, so nothing is left over for a later run; the
+    rendering error then takes precedence over a failed save.
+    """
+    try:
+        result = render()
+    except BaseException:
+        try:
+            with contextlib.suppress(Exception):
+                wait_for_saves()
+        finally:
+            pop_rendered_bytes()
+        raise
+    try:
+        wait_for_saves()
+    except Exception as e:
+        raise QPhaseRuntimeError(f"Saving plots failed: {e}") from e
+    finally:
+        images, memory_only = pop_rendered_bytes()
+    return result, images, memory_only
+
+
+def _data_digest(data: Any) -> str | None:
+    """Return a content digest of the engine input, or None if unsupported.
+
+    Arrays (also inside ``ArrayBase`` containers, results, dicts and lists)
+    are hashed by dtype, shape and bytes; scalars and strings by value.
+    Inputs of any other kind cannot be fingerprinted and are always
+    rendered.
+    """
+    h = hashlib.blake2b(digest_size=16)
+
+    def feed(obj: Any) -> bool:
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                return False
+            h.update(f"nd:{obj.dtype.str}:{obj.shape}".encode())
+            h.update(np.ascontiguousarray(obj).data)
+        elif obj is None or isinstance(obj, (str, int, float, complex, np.generic)):
+            h.update(f"{type(obj).__name__}:{obj!r};".encode())
+        elif isinstance(obj, dict):
+            h.update(f"dict:{len(obj)};".encode())
+            for key in sorted(obj, key=repr):
+                h.update(f"{key!r}=".encode())
+                if not feed(obj[key]):
+                    return False
+        elif isinstance(obj, (list, tuple)):
+            h.update(f"seq:{len(obj)};".encode())
+            return all(feed(item) for item in obj)
+        elif hasattr(obj, "to_numpy"):
+            h.update(b"array:")
+            if not feed(obj.to_numpy()):
+                return False
+            return feed([getattr(obj, name, None) for name in ("t0", "dt")])
+        elif hasattr(obj, "data") and hasattr(obj, "metadata"):
+            h.update(b"result:")
+            return feed(obj.data) and feed(obj.metadata)
+        else:
+            return False
+        return True
+
+    return h.hexdigest() if feed(data) else None
+
+
+@cache
+def _package_version() -> str | None:
+    """Return the installed qphase-viz version, or None for a bare checkout."""
+    try:
+        return version("qphase-viz")
+    except PackageNotFoundError:
+        return None
+
+
+def _writes_bytes(plotter: PlotterProtocol) -> bool:
+    """Return True if any spec of ``plotter`` encodes images into memory."""
+    plots = getattr(plotter.config, "plots", ())
+    return any(getattr(spec, "save_mode", "disk") != "disk" for spec in plots)
+
+
+def _sidecar(output_dir: Path, key: str) -> Path:
+    """Return the signature file recording the outputs of plugin ``key``."""
+    return output_dir / f".{key}.vizsig"
+
+
+def _reuse_outputs(output_dir: Path, key: str, signature: str) -> list[Path] | None:
+    """Return the recorded files of ``key`` if they are still up to date.
+
+    They are reused when the sidecar holds ``signature`` and every file it
+    lists still exists; anything else means the plotter must run.
+    """
+    try:
+        record = json_loads(_sidecar(output_dir, key).read_bytes())
+        if record["signature"] != signature:
+            return None
+        paths = [Path(p) for p in record["files"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return paths if all(p.exists() for p in paths) else None
+
+
+def _record_outputs(
+    output_dir: Path, key: str, signature: str, paths: list[Path]
+) -> None:
+    """Write the sidecar read by :func:`_reuse_outputs`; failures are ignored."""
+    record = {"signature": signature, "files": [str(p) for p in paths]}
+    try:
+        _sidecar(output_dir, key).write_bytes(json_dumps(record))
+    except OSError:
+        pass
 
 
 class VizResult(ResultProtocol):
@@ -40,6 +185,10 @@ class VizResult(ResultProtocol):
         List of paths to generated plot files.
     analysis_results : dict[str, Any] | None
         Dictionary of analysis results (e.g. PSD data).
+    images : dict[Path, bytes] | None
+        Encoded images of plots saved with ``save_mode`` "bytes" or "both",
+        keyed by their output path. Plots saved with "bytes" are not written
+        and their paths are not listed in ``generated_files``.
 
     """
 
@@ -47,9 +196,11 @@ class VizResult(ResultProtocol):
         self,
         generated_files: list[Path],
         analysis_results: dict[str, Any] | None = None,
+        images: dict[Path, bytes] | None = None,
     ):
         self._data = generated_files
         self._analysis = analysis_results or {}
+        self._images = images or {}
         self._metadata = {
             "count": len(generated_files),
             "has_analysis": bool(self._analysis),
@@ -65,6 +216,11 @@ class VizResult(ResultProtocol):
         """Get the analysis results."""
         return self._analysis
 
+    @property
+    def images(self) -> dict[Path, bytes]:
+        """Get the in-memory images, keyed by output path."""
+        return self._images
+
     @property
     def metadata(self) -> dict[str, Any]:
         """Get the result metadata."""
@@ -139,36 +295,151 @@ class VizEngine(EngineBase):
             raise QPhaseRuntimeError("VizEngine requires input data.")
 
         # Apply global styles
-        _set_default_rcparams()
-        if self.config.style_overrides:
-            plt.rcParams.update(self.config.style_overrides)
+        _apply_styles(self.config.style_overrides)
 
         output_dir = Path(self.config.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        generated_files = []
-
         # Filter for visualizer plugins
         visualizers = [
-            p for p in self.plugins.values() if isinstance(p, PlotterProtocol)
+            (key, p)
+            for key, p in self.plugins.items()
+            if isinstance(p, PlotterProtocol)
         ]
-
         total_plugins = len(visualizers)
 
-        for i, plotter in enumerate(visualizers):
-            try:
-                # Execute plot
-                # The plotter is already configured via its own config
-                out_paths = plotter.plot(data, output_dir, self.config.format)
-                generated_files.extend(out_paths)
-            except Exception as e:
-                raise QPhaseRuntimeError(
-                    f"Plotting failed for '{plotter.name}': {e}"
-                ) from e
-
-            # Report progress
+        # Files per plotter, in plotter order; None until rendered or reused.
+        outputs: list[list[Path] | None] = [None] * total_plugins
+        signatures: list[str | None] = [None] * total_plugins
+        if self.config.incremental:
+            digest = _data_digest(data)
+            for i, (key, plotter) in enumerate(visualizers):
+                if digest is None or _writes_bytes(plotter):
+                    continue
+                signature = self._signature(plotter, digest)
+                signatures[i] = signature
+                outputs[i] = _reuse_outputs(output_dir, key, signature)
+
+        done = 0
+
+        def _report(plotter: PlotterProtocol, verb: str) -> None:
+            nonlocal done
+            done += 1
             if progress_cb:
-                percent = (i + 1) / total_plugins
-                progress_cb(percent, None, f"Ran {plotter.name}", "rendering")
+                percent = done / total_plugins
+                progress_cb(percent, None, f"{verb} {plotter.name}", "rendering")
+
+        for i, (_, plotter) in enumerate(visualizers):
+            if outputs[i] is not None:
+                _report(plotter, "Reused")
+        pending = [i for i in range(total_plugins) if outputs[i] is None]
+
+        workers = min(self.config.workers, len(pending))
+        if workers > 1:
+            rendered, images, memory_only = self._run_parallel(
+                [visualizers[i][1] for i in pending],
+                data,
+                output_dir,
+                workers,
+                _report,
+            )
+            for i, paths in zip(pending, rendered, strict=True):
+                outputs[i] = paths
+        else:
+
+            def _render_pending() -> None:
+                for i in pending:
+                    plotter = visualizers[i][1]
+                    try:
+                        # Execute plot
+                        # The plotter is already configured via its own config
+                        outputs[i] = plotter.plot(data, output_dir, self.config.format)
+                    except Exception as e:
+                        raise QPhaseRuntimeError(
+                            f"Plotting failed for '{plotter.name}': {e}"
+                        ) from e
+                    _report(plotter, "Ran")
+
+            # Plotters with ``background_save`` return before their files exist.
+            _, images, memory_only = _render_and_flush(_render_pending)
+
+        rendered_outputs: list[list[Path]] = []
+        for i, files in enumerate(outputs):
+            if files is None:
+                raise QPhaseRuntimeError(
+                    f"Plotter '{visualizers[i][1].name}' produced no outputs"
+                )
+            recorded = signatures[i]
+            if i in pending and recorded is not None:
+                _record_outputs(output_dir, visualizers[i][0], recorded, files)
+            rendered_outputs.append(files)
+
+        # Plots kept in memory only are returned through ``images``.
+        generated_files = [
+            path
+            for paths in rendered_outputs
+            for path in paths
+            if path not in memory_only
+        ]
+        return VizResult(generated_files, images=images)
+
+    def _signature(self, plotter: PlotterProtocol, data_digest: str) -> str:
+        """Return the digest of everything that determines a plotter's files."""
+        config = plotter.config
+        dumped = (
+            config.model_dump(mode="json")
+            if hasattr(config, "model_dump")
+            else repr(config)
+        )
+        payload = {
+            "plotter": plotter.name,
+            "config": dumped,
+            "format": self.config.format,
+            "style": self.config.style_overrides,
+            "data": data_digest,
+            "version": _package_version(),
+        }
+        encoded = json_dumps(payload, sort_keys=True, default=repr)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
-        return VizResult(generated_files)
+    def _run_parallel(
+        self,
+        visualizers: list[PlotterProtocol],
+        data: Any,
+        output_dir: Path,
+        workers: int,
+        report: Callable[[PlotterProtocol, str], None],
+    ) -> tuple[list[list[Path]], dict[Path, bytes], set[Path]]:
+        """Render each plotter in its own task on a process pool.
+
+        Matplotlib drawing holds the GIL, so plotters only overlap across
+        processes. Each worker applies the styles once when it starts.
+        Returns the files of each plotter, in plotter order, the in-memory
+        images of all of them and the paths kept in memory only.
+        """
+        fmt = self.config.format
+        outputs: list[list[Path]] = []
+        images: dict[Path, bytes] = {}
+        memory_only: set[Path] = set()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_apply_styles,
+            initargs=(self.config.style_overrides,),
+        ) as ex:
+            futures = [
+                ex.submit(_render_in_worker, plotter, data, output_dir, fmt)
+                for plotter in visualizers
+            ]
+            for plotter, future in zip(visualizers, futures, strict=True):
+                try:
+                    out_paths, rendered, unwritten = future.result()
+                except Exception as e:
+                    raise QPhaseRuntimeError(
+                        f"Plotting failed for '{plotter.name}': {e}"
+                    ) from e
+                outputs.append(out_paths)
+                images.update(rendered)
+                memory_only |= unwritten
+                report(plotter, "Ran")
+
+        return outputs, images, memory_only
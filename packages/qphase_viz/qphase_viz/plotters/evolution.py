@@ -7,16 +7,37 @@ Public API
 ``TimeSeriesPlotter``
 """
 
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, ClassVar
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection
 from qphase.backend.base import ArrayBase
 from qphase.backend.xputil import convert_to_numpy
 
 from ..config import TimeSeriesConfig, TimeSeriesSpec
-from .base import PlotterProtocol
+from .base import (
+    PlotterProtocol,
+    new_figure,
+    plan_outputs,
+    render_grid,
+    save_figure_to,
+    save_options,
+    to_single_precision,
+)
+
+# Above this many points a trajectory overlay is rasterized in vector output.
+_RASTERIZE_POINTS = 100_000
+
+# transform name -> (elementwise function, axis label suffix)
+_TRANSFORMS: dict[str, tuple[Callable[[np.ndarray], np.ndarray], str]] = {
+    "real": (np.real, "Re"),
+    "imag": (np.imag, "Im"),
+    "abs": (np.abs, "|.|"),
+    "angle": (np.angle, "Arg"),
+    "number": (lambda z: np.abs(z) ** 2, "n"),
+}
 
 
 class TimeSeriesPlotter(PlotterProtocol):
@@ -32,54 +53,96 @@ class TimeSeriesPlotter(PlotterProtocol):
         self.config = config
 
     def plot(self, data: ArrayBase, output_dir: Path, format: str) -> list[Path]:
-        generated_files = []
-        for spec in self.config.plots:
-            generated_files.append(self._plot_single(data, spec, output_dir, format))
+        # Every spec draws from the same host copy of the trajectories and
+        # the same time axis: convert them once rather than per spec.
+        series = _resolve_series(data)
+        plots = self.config.plots
+        if self.config.grid is not None and len(plots) > 1:
+            path = render_grid(
+                plots,
+                lambda spec, ax: self._draw(data, spec, ax, series),
+                self.config.grid,
+                output_dir,
+                self.config.grid_filename or "time_series_grid",
+                format,
+            )
+            return [path]
+        out_paths = plan_outputs(plots, output_dir, format, _default_filename)
+        generated_files: list[Path] = []
+        for spec, out_path in zip(plots, out_paths, strict=True):
+            generated_files.append(
+                self._plot_single(
+                    data, spec, output_dir, format, series=series, out_path=out_path
+                )
+            )
         return generated_files
 
     def _plot_single(
-        self, data: ArrayBase, spec: TimeSeriesSpec, output_dir: Path, format: str
+        self,
+        data: ArrayBase,
+        spec: TimeSeriesSpec,
+        output_dir: Path,
+        format: str,
+        series: tuple[np.ndarray, np.ndarray] | None = None,
+        out_path: Path | None = None,
     ) -> Path:
-        config = spec.model_dump()
-        # Extract data
-        # Expecting TrajectorySet: (n_traj, n_steps, n_modes)
-        # or State: (n_traj, n_modes) - but State has no time axis usually?
-        # Assume TrajectorySet-like structure
-
-        y = data.to_numpy()  # (N, T, M)
-        if hasattr(data, "times"):
-            t = convert_to_numpy(data.times)
-        else:
-            t = np.arange(y.shape[1])
-
-        channels = config["channels"]
-        transform = config["transform"]
-        traj_sel = config["trajectories"]
-
-        fig, ax = plt.subplots(figsize=config["figsize"], dpi=config["dpi"])
-
-        # Data transformation
-        for ch in channels:
-            y_ch = y[:, :, ch]  # (N, T)
-
-            if transform == "real":
-                val = np.real(y_ch)
-                label_suffix = "Re"
-            elif transform == "imag":
-                val = np.imag(y_ch)
-                label_suffix = "Im"
-            elif transform == "abs":
-                val = np.abs(y_ch)
-                label_suffix = "|.|"
-            elif transform == "angle":
-                val = np.angle(y_ch)
-                label_suffix = "Arg"
-            elif transform == "number":
-                val = np.abs(y_ch) ** 2
-                label_suffix = "n"
-            else:
-                val = np.real(y_ch)
-                label_suffix = ""
+        fig, ax = new_figure(spec)
+        self._draw(data, spec, ax, series)
+        if out_path is None:
+            (out_path,) = plan_outputs([spec], output_dir, format, _default_filename)
+        return save_figure_to(fig, out_path, format, **save_options(spec))
+
+    def _draw(
+        self,
+        data: ArrayBase,
+        spec: TimeSeriesSpec,
+        ax: Any,
+        series: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> None:
+        """Draw ``spec`` into ``ax``; grid cells share the caller's figure."""
+        y, t = series if series is not None else _resolve_series(data)
+
+        # Only the samples inside the requested time range are drawn; the
+        # axis limits below would clip everything else anyway.
+        if spec.xlim is not None:
+            window = _time_window(t, spec.xlim)
+            y = y[:, window]
+            t = t[window]
+
+        # Stride-decimate for display: traces longer than the figure has
+        # pixels only cost path simplification time.
+        max_points = spec.max_points
+        if max_points is not None and y.shape[1] > max_points:
+            stride = -(-y.shape[1] // max_points)
+            y = y[:, ::stride]
+            t = t[::stride]
+
+        channels = spec.channels
+        transform = spec.transform
+        traj_sel = spec.trajectories
+
+        # Narrow the trajectory axis with views as well, so the channel
+        # gather below is the only copy and it covers just the drawn rows.
+        if isinstance(traj_sel, int):
+            y = y[traj_sel][None]
+        elif traj_sel == "all":
+            max_traj = spec.max_trajectories
+            if max_traj is not None and y.shape[0] > max_traj:
+                y = y[:: -(-y.shape[0] // max_traj)]
+
+        # Data transformation: one gather and one ufunc pass over all
+        # requested channels instead of a separate pass per channel. Done
+        # before drawing anything so bad channel indices fail early.
+        # The gather yields a contiguous buffer; any downcast runs on it
+        # rather than on the full trajectory array.
+        func, label_suffix = _TRANSFORMS.get(transform, (np.real, ""))
+        sel = y[:, :, channels]
+        if spec.precision == "single":
+            sel = to_single_precision(sel)
+        vals = func(sel)  # (N, T, C)
+
+        for k, ch in enumerate(channels):
+            val = vals[:, :, k]  # (N, T)
 
             # Trajectory selection
             if traj_sel == "mean":
@@ -88,33 +151,85 @@ class TimeSeriesPlotter(PlotterProtocol):
                 ax.plot(t, mean_val, label=f"Ch{ch} {label_suffix}")
                 ax.fill_between(t, mean_val - std_val, mean_val + std_val, alpha=0.2)
             elif traj_sel == "all":
-                for i in range(val.shape[0]):
-                    ax.plot(t, val[i], alpha=0.3, linewidth=0.5)
+                # One LineCollection per channel instead of one Line2D per
+                # trajectory: a single artist keeps draw time flat in n_traj.
+                segs = np.empty((*val.shape, 2))
+                segs[..., 0] = t
+                segs[..., 1] = val
+                ax.add_collection(
+                    LineCollection(
+                        # One (T, 2) view per trajectory; no data is copied.
+                        list(segs),
+                        colors=f"C{k}",
+                        alpha=0.3,
+                        linewidths=0.5,
+                        label=f"Ch{ch} {label_suffix}",
+                        # Dense overlays are embedded as an image in vector
+                        # output (PDF/SVG); raster formats are unaffected.
+                        rasterized=val.size > _RASTERIZE_POINTS,
+                    )
+                )
+                ax.autoscale_view()
             elif isinstance(traj_sel, int):
-                ax.plot(t, val[traj_sel], label=f"Ch{ch} {label_suffix}")
+                ax.plot(t, val[0], label=f"Ch{ch} {label_suffix}")
 
         # Styling
-        if config["title"]:
-            ax.set_title(config["title"])
-        if config["xlabel"]:
-            ax.set_xlabel(config["xlabel"])
+        if spec.title:
+            ax.set_title(spec.title)
+        if spec.xlabel:
+            ax.set_xlabel(spec.xlabel)
         else:
             ax.set_xlabel("Time")
-        if config["ylabel"]:
-            ax.set_ylabel(config["ylabel"])
-        if config["xlim"]:
-            ax.set_xlim(config["xlim"])
-        if config["ylim"]:
-            ax.set_ylim(config["ylim"])
-        if config["grid"]:
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel)
+        if spec.xlim:
+            ax.set_xlim(spec.xlim)
+        if spec.ylim:
+            ax.set_ylim(spec.ylim)
+        if spec.grid:
             ax.grid(True, alpha=0.3)
-        if config["legend"]:
+        if spec.legend:
             ax.legend()
 
-        # Save
-        filename = config["filename"] or f"time_series_{transform}"
-        out_path = output_dir / f"{filename}.{format}"
-        fig.savefig(out_path, format=format, bbox_inches="tight")
-        plt.close(fig)
 
-        return out_path
+def _default_filename(spec: TimeSeriesSpec) -> str:
+    """Return the file name of ``spec`` when it does not set one."""
+    return f"time_series_{spec.transform}"
+
+
+def _resolve_series(data: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(y, t)``: the trajectories as NumPy and their time axis.
+
+    Expects TrajectorySet-like input of shape (n_traj, n_steps, n_modes);
+    without a ``times`` attribute the step index is used as the time axis.
+    """
+    y = data.to_numpy()  # (N, T, M)
+    if hasattr(data, "times"):
+        t = convert_to_numpy(data.times)
+    else:
+        t = np.arange(y.shape[1])
+    return y, t
+
+
+def _time_window(t: np.ndarray, xlim: tuple[float, float]) -> slice:
+    """Return the slice of the uniform time axis ``t`` covering ``xlim``.
+
+    One sample beyond each edge is kept so traces run to the axis limits.
+    The bounds follow from ``t0`` and ``dt`` with integer floor/ceil
+    division, so no search over ``t`` is needed. Reversed limits select
+    the same samples as ascending ones. A window that misses the data
+    leaves the axis untouched.
+    """
+    n = len(t)
+    if n < 2:
+        return slice(None)
+    t0 = float(t[0])
+    dt = float(t[1]) - t0
+    if dt <= 0:
+        return slice(None)
+    lo, hi = min(xlim), max(xlim)
+    k0 = max(0, int((lo - t0) // dt))
+    k1 = min(n - 1, -int(-(hi - t0) // dt))
+    if k1 < k0:
+        return slice(None)
+    return slice(k0, k1 + 1)
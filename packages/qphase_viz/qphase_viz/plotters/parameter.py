@@ -4,20 +4,31 @@ Plots metrics (e.g. PSD peaks) against scanning parameters.
 """
 
 import re
+from functools import cache
 from pathlib import Path
 from typing import Any, ClassVar
 
-import matplotlib.pyplot as plt
 import numpy as np
 from qphase.backend.numpy_backend import NumpyBackend
 from qphase.core.protocols import ResultProtocol
 
 from ..config import ParameterEvolutionConfig, ParameterEvolutionSpec
-from .base import PlotterProtocol
+from .base import (
+    PlotterProtocol,
+    new_figure,
+    plan_outputs,
+    save_figure_to,
+    save_options,
+)
 
 
+@cache
 def _get_psd_analyzer_classes():
-    """Lazy import of PsdAnalyzer to keep qphase_sde optional."""
+    """Lazy import of PsdAnalyzer to keep qphase_sde optional.
+
+    Resolved on first use and memoized: the analyzer is looked up for every
+    spec and result, and a failed import is retried on the next call.
+    """
     try:
         from qphase_sde.analyser import PsdAnalyzer, PsdAnalyzerConfig
     except ImportError as e:
@@ -48,9 +59,13 @@ class ParameterEvolutionPlotter(PlotterProtocol):
             # If not aggregated, we can't plot evolution
             return []
 
+        plots = self.config.plots
+        out_paths = plan_outputs(plots, output_dir, format, _default_filename)
         generated_files = []
-        for spec in self.config.plots:
-            generated_files.append(self._plot_single(data, spec, output_dir, format))
+        for spec, out_path in zip(plots, out_paths, strict=True):
+            generated_files.append(
+                self._plot_single(data, spec, output_dir, format, out_path)
+            )
         return generated_files
 
     def _extract_parameter(
@@ -173,6 +188,7 @@ class ParameterEvolutionPlotter(PlotterProtocol):
         spec: ParameterEvolutionSpec,
         output_dir: Path,
         format: str,
+        out_path: Path | None = None,
     ) -> Path:
         # Extract (param, metric) pairs
         points = []
@@ -189,8 +205,7 @@ class ParameterEvolutionPlotter(PlotterProtocol):
         y = [p[1] for p in points]
 
         # Plot
-        config = spec.model_dump()
-        fig, ax = plt.subplots(figsize=config["figsize"], dpi=config["dpi"])
+        fig, ax = new_figure(spec)
 
         ax.plot(x, y, "o-", label=f"Ch{spec.channel}")
 
@@ -301,9 +316,11 @@ class ParameterEvolutionPlotter(PlotterProtocol):
             ax.grid(True, alpha=0.3)
 
         # Save
-        fname = spec.filename or f"evol_{spec.parameter}_{spec.metric}"
-        out_path = output_dir / f"{fname}.{format}"
-        fig.savefig(out_path, bbox_inches="tight")
-        plt.close(fig)
+        if out_path is None:
+            (out_path,) = plan_outputs([spec], output_dir, format, _default_filename)
+        return save_figure_to(fig, out_path, format, **save_options(spec))
+
 
-        return out_path
+def _default_filename(spec: ParameterEvolutionSpec) -> str:
+    """Return the file name of ``spec`` when it does not set one."""
+    return f"evol_{spec.parameter}_{spec.metric}"
@@ -10,12 +10,61 @@ Public API
 from pathlib import Path
 from typing import Any, ClassVar
 
-import matplotlib.pyplot as plt
 import numpy as np
 from qphase.backend.base import ArrayBase
 
 from ..config import PhasePlaneConfig, PhasePlaneSpec
-from .base import PlotterProtocol
+from .base import (
+    PlotterProtocol,
+    new_figure,
+    plan_outputs,
+    render_grid,
+    save_figure_to,
+    save_options,
+    to_single_precision,
+)
+
+# Sentinel for "not resolved yet"; ``None`` means "no distributions".
+_UNRESOLVED: Any = object()
+
+
+def _resolve_distributions(data: Any) -> dict | None:
+    """Return the pre-computed distributions carried by ``data``, if any.
+
+    Analysis results may be wrapped under the analyzer name (e.g. ``"dist"``).
+    The result is keyed by channel index (see :func:`_by_channel`).
+    """
+    if not isinstance(data, dict):
+        return None
+    if "distributions" in data:
+        return _by_channel(data["distributions"])
+    inner = data.get("dist")
+    if isinstance(inner, dict) and "distributions" in inner:
+        return _by_channel(inner["distributions"])
+    return None
+
+
+def _by_channel(distributions: Any) -> Any:
+    """Re-key ``distributions`` by integer channel index.
+
+    The analyzer keys distributions by mode index, but a JSON round trip
+    turns those keys into strings. Converting them once lets each spec look
+    up ``channel_x`` directly; an integer key wins over its string form.
+    """
+    if not isinstance(distributions, dict):
+        return distributions
+    by_channel = {}
+    for key, value in distributions.items():
+        if isinstance(key, str):
+            try:
+                key = int(key)
+            except ValueError:
+                pass
+            else:
+                if key in distributions:
+                    continue
+        by_channel[key] = value
+    return by_channel
 
 
 class PhasePlanePlotter(PlotterProtocol):
@@ -69,13 +118,48 @@ class PhasePlanePlotter(PlotterProtocol):
             A list of paths to the generated plot files.
 
         """
-        generated_files = []
-        for spec in self.config.plots:
-            generated_files.append(self._plot_single(data, spec, output_dir, format))
+        # Whether ``data`` carries pre-computed distributions does not depend
+        # on the spec: unwrap the analysis result once for all plots.
+        distributions = _resolve_distributions(data)
+        plots = self.config.plots
+        if self.config.grid is not None and len(plots) > 1:
+            path = render_grid(
+                plots,
+                lambda spec, ax: self._draw(data, spec, ax, distributions),
+                self.config.grid,
+                output_dir,
+                self.config.grid_filename or "phase_plane_grid",
+                format,
+            )
+            return [path]
+        out_paths = plan_outputs(
+            plots,
+            output_dir,
+            format,
+            lambda spec: _default_filename(spec, distributions),
+        )
+        generated_files: list[Path] = []
+        for spec, out_path in zip(plots, out_paths, strict=True):
+            generated_files.append(
+                self._plot_single(
+                    data,
+                    spec,
+                    output_dir,
+                    format,
+                    distributions=distributions,
+                    out_path=out_path,
+                )
+            )
         return generated_files
 
     def _plot_single(
-        self, data: ArrayBase, spec: PhasePlaneSpec, output_dir: Path, format: str
+        self,
+        data: ArrayBase,
+        spec: PhasePlaneSpec,
+        output_dir: Path,
+        format: str,
+        distributions: Any = _UNRESOLVED,
+        out_path: Path | None = None,
     ) -> Path:
         """Generate a single phase plane plot.
 
@@ -89,6 +173,12 @@ class PhasePlanePlotter(PlotterProtocol):
             The directory to save the plot to.
         format : str
             The file format for the plot.
+        distributions : dict or None, optional
+            Pre-computed distributions resolved by :meth:`plot`; looked up
+            from ``data`` when omitted.
+        out_path : Path, optional
+            Output file resolved by :meth:`plot`; derived from ``spec`` when
+            omitted.
 
         Returns
         -------
@@ -96,36 +186,37 @@ class PhasePlanePlotter(PlotterProtocol):
             The path to the generated plot file.
 
         """
-        config = spec.model_dump()
-
+        if distributions is _UNRESOLVED:
+            distributions = _resolve_distributions(data)
+        fig, ax = new_figure(spec)
+        self._draw(data, spec, ax, distributions)
+        if out_path is None:
+            (out_path,) = plan_outputs(
+                [spec],
+                output_dir,
+                format,
+                lambda spec: _default_filename(spec, distributions),
+            )
+        return save_figure_to(fig, out_path, format, **save_options(spec))
+
+    def _draw(
+        self,
+        data: ArrayBase,
+        spec: PhasePlaneSpec,
+        ax: Any,
+        distributions: Any = _UNRESOLVED,
+    ) -> None:
+        """Draw ``spec`` into ``ax``; grid cells share the caller's figure."""
         # Check for pre-computed distribution (Analysis Result)
-        if isinstance(data, dict):
-            # Unwrap if wrapped in analyzer name (e.g. "dist")
-            tgt = None
-            if "distributions" in data:
-                tgt = data
-            elif (
-                "dist" in data
-                and isinstance(data["dist"], dict)
-                and "distributions" in data["dist"]
-            ):
-                tgt = data["dist"]
-
-            if tgt:
-                distributions = tgt["distributions"]
-                ch_x = config["channel_x"]
-                ch_y = config["channel_y"]
-
-            # Map channel to the analyzer's mode key
-            # Analyzer keyed by mode index (int)
+        if distributions is _UNRESOLVED:
+            distributions = _resolve_distributions(data)
+        if distributions is not None:
+            ch_x = spec.channel_x
+
+            # Keyed by mode index, also after JSON serialization.
             dist_data = distributions.get(ch_x)
-            if dist_data is None:
-                # Try string key if JSON serialization happened
-                dist_data = distributions.get(str(ch_x))
 
             if dist_data:
-                fig, ax = plt.subplots(figsize=config["figsize"], dpi=config["dpi"])
-
                 if dist_data["type"] == "2d_complex":
                     H = dist_data["hist"]
                     xedges = dist_data["xedges"]
@@ -141,22 +232,22 @@ class PhasePlanePlotter(PlotterProtocol):
                         origin="lower",
                         extent=[xedges[0], xedges[-1], yedges[0], yedges[-1]],
                         aspect="auto",
-                        cmap=config["cmap"],
+                        cmap=spec.cmap,
                     )
-                    fig.colorbar(im, ax=ax, label="Density")
+                    ax.figure.colorbar(im, ax=ax, label="Density")
 
                     # Styling
-                    if config["title"]:
-                        ax.set_title(config["title"])
+                    if spec.title:
+                        ax.set_title(spec.title)
                     else:
                         ax.set_title(f"Phase Space Density (Mode {ch_x})")
 
-                    if config["xlabel"]:
-                        ax.set_xlabel(config["xlabel"])
+                    if spec.xlabel:
+                        ax.set_xlabel(spec.xlabel)
                     else:
                         ax.set_xlabel("Re")
-                    if config["ylabel"]:
-                        ax.set_ylabel(config["ylabel"])
+                    if spec.ylabel:
+                        ax.set_ylabel(spec.ylabel)
                     else:
                         ax.set_ylabel("Im")
 
@@ -164,19 +255,17 @@ class PhasePlanePlotter(PlotterProtocol):
                     # Handle 1D case if necessary (PhasePlane is usually 2D)
                     # Maybe bar plot?
                     pass
-
-                # Save
-                filename = config["filename"] or f"phase_plane_dist_{ch_x}"
-                out_path = output_dir / f"{filename}.{format}"
-                fig.savefig(out_path, format=format, bbox_inches="tight")
-                plt.close(fig)
-                return out_path
+                return
 
         # Existing Trajectory Logic
         y = data.to_numpy()
+        # Downcast per extracted column: the cast then doubles as the gather
+        # of the strided column into a contiguous buffer, and unused modes
+        # are never converted.
+        single = spec.precision == "single"
 
-        ch_x = config["channel_x"]
-        ch_y = config["channel_y"]
+        ch_x = spec.channel_x
+        ch_y = spec.channel_y
 
         # Flatten trajectories for phase plane statistics
         # (N*T, M)
@@ -184,8 +273,10 @@ class PhasePlanePlotter(PlotterProtocol):
 
         if ch_y is None:
             # Re vs Im of single channel
-            x_data = np.real(y_flat[:, ch_x])
-            y_data = np.imag(y_flat[:, ch_x])
+            column = y_flat[:, ch_x]
+            if single:
+                column = to_single_precision(column)
+            x_data, y_data = _re_im(column)
             xlabel = f"Re(Ch{ch_x})"
             ylabel = f"Im(Ch{ch_x})"
         else:
@@ -196,14 +287,15 @@ class PhasePlanePlotter(PlotterProtocol):
             # Let's assume we plot Real parts if complex, or values if real.
             # Or maybe we should stick to the standard "Phase Space" definition.
             # Let's use Real parts for general correlation.
-            x_data = np.real(y_flat[:, ch_x])
-            y_data = np.real(y_flat[:, ch_y])
+            x_data = y_flat[:, ch_x].real
+            y_data = y_flat[:, ch_y].real
+            if single:
+                x_data = to_single_precision(x_data)
+                y_data = to_single_precision(y_data)
             xlabel = f"Re(Ch{ch_x})"
             ylabel = f"Re(Ch{ch_y})"
 
-        fig, ax = plt.subplots(figsize=config["figsize"], dpi=config["dpi"])
-
-        mode = config["mode"]
+        mode = spec.mode
 
         if mode == "scatter":
             # Downsample if too many points for scatter
@@ -216,20 +308,19 @@ class PhasePlanePlotter(PlotterProtocol):
                 x_plot = x_data
                 y_plot = y_data
 
-            ax.scatter(x_plot, y_plot, alpha=0.1, s=1, c="k")
+            # Thousands of markers: embed as an image in vector output.
+            ax.scatter(x_plot, y_plot, alpha=0.1, s=1, c="k", rasterized=True)
 
         elif mode == "hist2d":
-            h = ax.hist2d(
-                x_data, y_data, bins=config["bins"], cmap=config["cmap"], density=True
-            )
-            fig.colorbar(h[3], ax=ax, label="Probability Density")
+            h = ax.hist2d(x_data, y_data, bins=spec.bins, cmap=spec.cmap, density=True)
+            ax.figure.colorbar(h[3], ax=ax, label="Probability Density")
 
         elif mode == "kde":
             # Simple Gaussian KDE approximation or contour
             # For now, fallback to hist2d as KDE is expensive on large datasets
             # without scipy optimization or implement a simple contour over hist2d
             counts, xedges, yedges = np.histogram2d(
-                x_data, y_data, bins=config["bins"], density=True
+                x_data, y_data, bins=spec.bins, density=True
             )
             x_centers = (xedges[:-1] + xedges[1:]) / 2
             y_centers = (yedges[:-1] + yedges[1:]) / 2
@@ -237,31 +328,48 @@ class PhasePlanePlotter(PlotterProtocol):
 
             # Smooth slightly?
 
-            c = ax.contourf(X, Y, counts.T, cmap=config["cmap"], levels=20)
-            fig.colorbar(c, ax=ax, label="Density")
+            c = ax.contourf(X, Y, counts.T, cmap=spec.cmap, levels=20)
+            ax.figure.colorbar(c, ax=ax, label="Density")
 
         # Styling
-        if config["title"]:
-            ax.set_title(config["title"])
-        if config["xlabel"]:
-            ax.set_xlabel(config["xlabel"])
+        if spec.title:
+            ax.set_title(spec.title)
+        if spec.xlabel:
+            ax.set_xlabel(spec.xlabel)
         else:
             ax.set_xlabel(xlabel)
-        if config["ylabel"]:
-            ax.set_ylabel(config["ylabel"])
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel)
         else:
             ax.set_ylabel(ylabel)
-        if config["xlim"]:
-            ax.set_xlim(config["xlim"])
-        if config["ylim"]:
-            ax.set_ylim(config["ylim"])
-        if config["grid"]:
+        if spec.xlim:
+            ax.set_xlim(spec.xlim)
+        if spec.ylim:
+            ax.set_ylim(spec.ylim)
+        if spec.grid:
             ax.grid(True, alpha=0.3)
 
-        # Save
-        filename = config["filename"] or f"phase_plane_{mode}"
-        out_path = output_dir / f"{filename}.{format}"
-        fig.savefig(out_path, format=format, bbox_inches="tight")
-        plt.close(fig)
 
-        return out_path
+def _default_filename(spec: PhasePlaneSpec, distributions: dict | None) -> str:
+    """Return the file name of ``spec`` when it does not set one.
+
+    Specs drawn from a pre-computed distribution are named after the channel,
+    trajectory plots after the plot mode.
+    """
+    if distributions is not None and distributions.get(spec.channel_x):
+        return f"phase_plane_dist_{spec.channel_x}"
+    return f"phase_plane_{spec.mode}"
+
+
+def _re_im(column: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split a complex column into real and imaginary parts.
+
+    The strided column is gathered once into a contiguous complex buffer and
+    reinterpreted as ``(n, 2)`` real pairs, so both parts come from the same
+    cache lines instead of two passes with a stride of ``n_modes`` elements.
+    """
+    if not np.iscomplexobj(column):
+        return column, np.zeros_like(column)
+    col = np.ascontiguousarray(column)
+    pairs = col.view(col.real.dtype).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
@@ -5,22 +5,36 @@ Plotters for spectral analysis (PSD).
 Public API
 ----------
 `PowerSpectrumPlotter` : Plots Power Spectral Density (PSD).
+`update_psd_lines` : Refresh existing PSD lines in place (interactive use).
 """
 
+from functools import cache
 from pathlib import Path
 from typing import Any, ClassVar
 
-import matplotlib.pyplot as plt
 import numpy as np
 from qphase.backend.base import ArrayBase
 from qphase.backend.numpy_backend import NumpyBackend
 
 from ..config import PowerSpectrumConfig, PowerSpectrumSpec
-from .base import PlotterProtocol
+from .base import (
+    PlotterProtocol,
+    new_figure,
+    plan_outputs,
+    render_grid,
+    save_figure_to,
+    save_options,
+    to_single_precision,
+)
 
 
+@cache
 def _get_psd_analyzer_classes():
-    """Lazy import of PsdAnalyzer to keep qphase_sde optional."""
+    """Lazy import of PsdAnalyzer to keep qphase_sde optional.
+
+    Resolved on first use and memoized: the analyzer is looked up for every
+    spec and result, and a failed import is retried on the next call.
+    """
     try:
         from qphase_sde.analyser import PsdAnalyzer, PsdAnalyzerConfig
     except ImportError as e:
@@ -31,6 +45,32 @@ def _get_psd_analyzer_classes():
     return PsdAnalyzer, PsdAnalyzerConfig
 
 
+def _default_filename(spec: PowerSpectrumSpec) -> str:
+    """Return the file name of ``spec`` when it does not set one."""
+    return "power_spectrum"
+
+
+def _resolve_source(data: Any) -> tuple[dict | None, float]:
+    """Return ``(psd_data, dt)`` describing the plotter input.
+
+    ``psd_data`` is the pre-computed PSD result when ``data`` is one, also
+    when nested under the analyzer key (e.g. ``data['psd']['psd']``), and
+    ``None`` for raw trajectories, whose sampling step is returned as ``dt``.
+    """
+    if isinstance(data, dict):
+        if "psd" in data and "axis" in data:
+            return data, 1.0
+        inner = data.get("psd")
+        if isinstance(inner, dict) and "psd" in inner:
+            return inner, 1.0
+    if hasattr(data, "dt"):
+        return None, data.dt
+    if hasattr(data, "times"):
+        t = data.times
+        return None, t[1] - t[0] if len(t) > 1 else 1.0
+    return None, 1.0
+
+
 class PowerSpectrumPlotter(PlotterProtocol):
     """Plots Power Spectral Density (PSD)."""
 
@@ -46,29 +86,70 @@ class PowerSpectrumPlotter(PlotterProtocol):
         self.config = config
 
     def plot(self, data: ArrayBase, output_dir: Path, format: str) -> list[Path]:
-        generated_files = []
-        for spec in self.config.plots:
-            generated_files.append(self._plot_single(data, spec, output_dir, format))
+        generated_files: list[Path] = []
+        # Specs that differ only in styling (scale, limits, ...) share one
+        # PSD computation of the raw trajectories.
+        psd_cache: dict[tuple, Any] = {}
+        # The input's shape (pre-computed PSD or raw trajectories) and its
+        # time step are the same for every spec: resolve them once.
+        source = _resolve_source(data)
+        plots = self.config.plots
+        if self.config.grid is not None and len(plots) > 1:
+            path = render_grid(
+                plots,
+                lambda spec, ax: self._draw(
+                    spec, ax, self._spectra(data, spec, psd_cache, source)
+                ),
+                self.config.grid,
+                output_dir,
+                self.config.grid_filename or "power_spectrum_grid",
+                format,
+            )
+            return [path]
+        out_paths = plan_outputs(plots, output_dir, format, _default_filename)
+        for spec, out_path in zip(plots, out_paths, strict=True):
+            generated_files.append(
+                self._plot_single(
+                    data,
+                    spec,
+                    output_dir,
+                    format,
+                    psd_cache,
+                    source=source,
+                    out_path=out_path,
+                )
+            )
         return generated_files
 
     def _plot_single(
-        self, data: ArrayBase, spec: PowerSpectrumSpec, output_dir: Path, format: str
+        self,
+        data: ArrayBase,
+        spec: PowerSpectrumSpec,
+        output_dir: Path,
+        format: str,
+        psd_cache: dict[tuple, Any] | None = None,
+        source: tuple[dict | None, float] | None = None,
+        out_path: Path | None = None,
     ) -> Path:
-        config = spec.model_dump()
-        fig, ax = plt.subplots(figsize=config["figsize"], dpi=config["dpi"])
-        channels = config["channels"]
-        scale = config["scale"]
-
-        # Check if data is pre-computed PSD (dict)
-        # Handle nesting in analyzer key (e.g. data['psd']['psd'])
-        psd_data = None
-        if isinstance(data, dict):
-            if "psd" in data and "axis" in data:
-                psd_data = data
-            elif (
-                "psd" in data and isinstance(data["psd"], dict) and "psd" in data["psd"]
-            ):
-                psd_data = data["psd"]
+        # The figure is only created once the spectra are available, so a
+        # failing analysis neither pays for nor leaks a figure.
+        spectra = self._spectra(data, spec, psd_cache, source)
+        fig, ax = new_figure(spec)
+        self._draw(spec, ax, spectra)
+        if out_path is None:
+            (out_path,) = plan_outputs([spec], output_dir, format, _default_filename)
+        return save_figure_to(fig, out_path, format, **save_options(spec))
+
+    def _spectra(
+        self,
+        data: ArrayBase,
+        spec: PowerSpectrumSpec,
+        psd_cache: dict[tuple, Any] | None = None,
+        source: tuple[dict | None, float] | None = None,
+    ) -> tuple[Any, Any, Any, Any]:
+        """Return ``(freqs, psd, modes, peaks)`` to draw for ``spec``."""
+        channels = spec.channels
+        psd_data, dt = source if source is not None else _resolve_source(data)
 
         if psd_data:
             # Pre-computed PSD
@@ -79,110 +160,161 @@ class PowerSpectrumPlotter(PlotterProtocol):
             peaks_info = psd_data.get("peaks", {})
         else:
             # Compute using PsdAnalyzer
-            PsdAnalyzer, PsdAnalyzerConfig = _get_psd_analyzer_classes()
-            if hasattr(data, "dt"):
-                dt = data.dt
-            elif hasattr(data, "times"):
-                t = data.times
-                if len(t) > 1:
-                    dt = t[1] - t[0]
-                else:
-                    dt = 1.0
-            else:
-                dt = 1.0
-
-            # Configure analyzer
-            # We assume complex signal by default for generality
-            # Note: peak finding parameters rely on PsdAnalyzer defaults
-            # now to ensure consistency
-            analyzer_config = PsdAnalyzerConfig(
-                kind="complex",
-                modes=channels,
-                convention="symmetric",
-                dt=dt,
-                window=spec.window,
-                find_peaks=spec.annotate_peaks,
+            key = (
+                tuple(channels),
+                float(dt),
+                spec.window,
+                spec.annotate_peaks,
+                spec.precision,
             )
-            analyzer = PsdAnalyzer(analyzer_config)
-
-            # Run analysis
-            # Use NumpyBackend for plotting context
-            res = analyzer.analyze(data, backend=NumpyBackend())
+            res = psd_cache.get(key) if psd_cache is not None else None
+            if res is None:
+                res = self._analyze(data, channels, dt, spec)
+                if psd_cache is not None:
+                    psd_cache[key] = res
 
             f = res.data["axis"]
             Pxx_all = res.data["psd"]
             available_modes = channels
             peaks_info = res.data.get("peaks", {})
+        return f, Pxx_all, available_modes, peaks_info
+
+    def _draw(
+        self, spec: PowerSpectrumSpec, ax: Any, spectra: tuple[Any, Any, Any, Any]
+    ) -> None:
+        """Draw ``spectra`` into ``ax``; grid cells share the caller's figure."""
+        f, Pxx_all, available_modes, peaks_info = spectra
+        channels = spec.channels
+        scale = spec.scale
 
-        # Plotting
+        # Axis scaling depends only on the spec: decide it once, not per mode.
+        to_db = scale == "dB"
+        ylabel = "PSD [dB/Hz]" if to_db else "PSD [V**2/Hz]"
+        if scale == "log":
+            ax.set_yscale("log")
+
+        # Resolve the PSD columns once and transform them in a single pass
+        # instead of a list search and a log10 per channel.
+        column_of = {int(m): i for i, m in enumerate(available_modes)}
+        plotted = []
         for ch in channels:
-            if ch in available_modes:
-                idx = available_modes.index(ch)
-                val = Pxx_all[:, idx]
-
-                if scale == "dB":
-                    val = 10 * np.log10(val + 1e-20)
-                    ylabel = "PSD [dB/Hz]"
-                elif scale == "log":
-                    ax.set_yscale("log")
-                    ylabel = "PSD [V**2/Hz]"
-                else:
-                    ylabel = "PSD [V**2/Hz]"
-
-                (line,) = ax.plot(f, val, label=f"Ch{ch}")
-
-                # Annotate peaks
-                if spec.annotate_peaks and ch in peaks_info:
-                    p_freqs = peaks_info[ch]["frequencies"]
-                    p_vals = peaks_info[ch]["values"]
-
-                    # If scale is dB, we need to transform peak values too for plotting
-                    if scale == "dB":
-                        p_vals_plot = 10 * np.log10(p_vals + 1e-20)
-                    else:
-                        p_vals_plot = p_vals
-
-                    ax.plot(p_freqs, p_vals_plot, "x", color=line.get_color())
-
-                    # Add text labels for top 3 peaks
-                    # Sort by value
-                    sorted_idx = np.argsort(p_vals)[::-1]
-                    for i in sorted_idx[:3]:
-                        ax.annotate(
-                            f"{p_freqs[i]:.2f}",
-                            xy=(p_freqs[i], p_vals_plot[i]),
-                            xytext=(0, 5),
-                            textcoords="offset points",
-                            ha="center",
-                            fontsize=8,
-                        )
+            if ch in column_of:
+                plotted.append(ch)
             else:
                 print(f"Warning: Channel {ch} not found in PSD data.")
+        P_sel = Pxx_all[:, [column_of[ch] for ch in plotted]]
+        if to_db:
+            P_sel = 10 * np.log10(P_sel + 1e-20)
+
+        # Plotting: one call draws a Line2D per column, all sharing ``f``.
+        lines = ax.plot(f, P_sel) if plotted else []
+        for line, ch in zip(lines, plotted, strict=True):
+            line.set_label(f"Ch{ch}")
+
+            # Annotate peaks
+            if spec.annotate_peaks and ch in peaks_info:
+                p_freqs = peaks_info[ch]["frequencies"]
+                p_vals = peaks_info[ch]["values"]
+
+                # If scale is dB, we need to transform peak values too for plotting
+                if to_db:
+                    p_vals_plot = 10 * np.log10(p_vals + 1e-20)
+                else:
+                    p_vals_plot = p_vals
+
+                ax.plot(p_freqs, p_vals_plot, "x", color=line.get_color())
+
+                # Add text labels for top 3 peaks
+                # Sort by value
+                sorted_idx = np.argsort(p_vals)[::-1]
+                for i in sorted_idx[:3]:
+                    ax.annotate(
+                        f"{p_freqs[i]:.2f}",
+                        xy=(p_freqs[i], p_vals_plot[i]),
+                        xytext=(0, 5),
+                        textcoords="offset points",
+                        ha="center",
+                        fontsize=8,
+                    )
 
         # Styling
-        if config["title"]:
-            ax.set_title(config["title"])
-        if config["xlabel"]:
-            ax.set_xlabel(config["xlabel"])
+        if spec.title:
+            ax.set_title(spec.title)
+        if spec.xlabel:
+            ax.set_xlabel(spec.xlabel)
         else:
             ax.set_xlabel("Frequency [Hz]")
-        if config["ylabel"]:
-            ax.set_ylabel(config["ylabel"])
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel)
         else:
             ax.set_ylabel(ylabel)
-        if config["xlim"]:
-            ax.set_xlim(config["xlim"])
-        if config["ylim"]:
-            ax.set_ylim(config["ylim"])
-        if config["grid"]:
+        if spec.xlim:
+            ax.set_xlim(spec.xlim)
+        if spec.ylim:
+            ax.set_ylim(spec.ylim)
+        if spec.grid:
             ax.grid(True, alpha=0.3, which="both")
-        if config.get("legend", True):
+        if spec.legend:
             ax.legend()
 
-        # Save
-        filename = config["filename"] or "power_spectrum"
-        out_path = output_dir / f"{filename}.{format}"
-        fig.savefig(out_path, format=format, bbox_inches="tight")
-        plt.close(fig)
+    @staticmethod
+    def _analyze(
+        data: ArrayBase, channels: list[int], dt: float, spec: PowerSpectrumSpec
+    ) -> Any:
+        """Run the PSD analysis of raw trajectories for ``channels``."""
+        PsdAnalyzer, PsdAnalyzerConfig = _get_psd_analyzer_classes()
+        # Configure analyzer
+        # We assume complex signal by default for generality
+        # Note: peak finding parameters rely on PsdAnalyzer defaults
+        # now to ensure consistency
+        analyzer_config = PsdAnalyzerConfig(
+            kind="complex",
+            modes=channels,
+            convention="symmetric",
+            dt=dt,
+            window=spec.window,
+            find_peaks=spec.annotate_peaks,
+        )
+        analyzer = PsdAnalyzer(analyzer_config)
+        if spec.precision == "single":
+            # complex64 input keeps the FFT and reductions in single precision.
+            data = to_single_precision(data)
+
+        # Run analysis
+        # Use NumpyBackend for plotting context
+        return analyzer.analyze(data, backend=NumpyBackend())
+
+
+def update_psd_lines(lines: list[Any], psd: Any, background: Any | None = None) -> None:
+    """Refresh PSD line artists in place with new spectra.
+
+    Interactive loops can keep the ``Line2D`` objects of a PSD figure and
+    update them each frame instead of rebuilding the figure.
+
+    Parameters
+    ----------
+    lines : list[Line2D]
+        Lines of one axes, one per PSD column.
+    psd : array
+        New PSD values of shape ``(n_freq, len(lines))`` on the same axis.
+    background : Any, optional
+        Region saved with ``canvas.copy_from_bbox(ax.bbox)``. When given and
+        the canvas supports blitting, only the lines are redrawn; otherwise
+        a regular idle redraw is requested.
+
+    """
+    if not lines:
+        return
+    psd = np.asarray(psd)
+    for line, values in zip(lines, psd.T, strict=True):
+        line.set_ydata(values)
 
-        return out_path
+    ax = lines[0].axes
+    canvas = ax.figure.canvas
+    if background is None or not canvas.supports_blit:
+        canvas.draw_idle()
+        return
+    canvas.restore_region(background)
+    for line in lines:
+        ax.draw_artist(line)
+    canvas.blit(ax.bbox)
@@ -32,6 +32,20 @@ def setup_env():
     yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Point the home directory (``HOME``, and so ``Path.home``) at ``tmp_path``.
+
+    The user config and the YAML JSON cache live under ``~/.qphase``; tests
+    must never read or write the developer's real home directory.
+    """
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
 @pytest.fixture
 def temp_workspace(tmp_path):
     """Create a temporary workspace with config and output directories."""
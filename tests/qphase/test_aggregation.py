@@ -0,0 +1,56 @@
+"""Tests for generic result aggregation helpers."""
+
+from pathlib import Path
+
+from qphase.core.aggregation import iter_directory_results, write_table_csv
+from qphase.core.utils import ensure_dir
+
+
+def test_iter_directory_results_matches_glob_discovery(tmp_path):
+    for job in ("job_b", "job_a"):
+        (tmp_path / job).mkdir()
+        (tmp_path / job / "result.npz").write_bytes(b"")
+        (tmp_path / job / "notes.txt").write_bytes(b"")
+    # Directories whose name matches the pattern are not results.
+    (tmp_path / "job_a" / "cache.npz").mkdir()
+    (tmp_path / "top.npz").write_bytes(b"")
+
+    expected = sorted(p for p in tmp_path.glob("*/*.npz") if p.is_file())
+    assert iter_directory_results(tmp_path) == expected
+    assert [p.parent.name for p in expected] == ["job_a", "job_b"]
+
+    # Without per-job subdirectories the run directory itself is scanned.
+    flat = tmp_path / "flat"
+    flat.mkdir()
+    for name in ("b.npz", "a.npz", "c.json"):
+        (flat / name).write_bytes(b"")
+    assert iter_directory_results(flat) == [flat / "a.npz", flat / "b.npz"]
+    assert iter_directory_results(flat, "*.json") == [flat / "c.json"]
+
+
+def test_ensure_dir_creates_each_directory_once(tmp_path, monkeypatch):
+    calls = []
+    real_mkdir = Path.mkdir
+
+    def _counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _counting_mkdir)
+    out = tmp_path / "exports"
+    write_table_csv([{"x": 1}], out / "a.csv")
+    write_table_csv([{"x": 2}], out / "b.csv")
+    assert calls == [out]
+
+    # A directory deleted since is recreated by the next write into it.
+    (out / "a.csv").unlink()
+    (out / "b.csv").unlink()
+    out.rmdir()
+    write_table_csv([{"x": 3}], out / "c.csv")
+    assert (out / "c.csv").exists()
+
+    # Owners pass ``force`` to recreate it up front.
+    (out / "c.csv").unlink()
+    out.rmdir()
+    ensure_dir(out, force=True)
+    assert out.is_dir()
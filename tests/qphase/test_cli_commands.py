@@ -97,3 +97,24 @@ def test_run_jobs_command(temp_workspace, sample_job_file, dummy_model):
 
     # There should be a subdirectory for the run if it succeeded
     # assert any(output_dir.iterdir())
+
+
+def test_cli_import_defers_execution_stack():
+    """Loading the CLI does not import the scheduler or syntax highlighting."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, qphase.main\n"
+        "loaded = {'qphase.core.scheduler', 'qphase.service', 'rich.syntax'}\n"
+        "print(sorted(loaded & set(sys.modules)))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+    from qphase.core import Scheduler
+    from qphase.core.scheduler import Scheduler as DirectScheduler
+
+    assert Scheduler is DirectScheduler
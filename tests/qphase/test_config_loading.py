@@ -1,8 +1,11 @@
+import math
+import os
 from pathlib import Path
 
+import pytest
 from qphase.core.config_loader import load_global_config, load_system_config
 from qphase.core.system_config import SystemConfig, save_user_config
-from qphase.core.utils import load_yaml
+from qphase.core.utils import load_yaml, path_getter
 
 
 def test_silent_generation_system_config(tmp_path, monkeypatch):
@@ -65,3 +68,143 @@ def test_config_reset_system(tmp_path, monkeypatch):
     # Verify reset
     config = load_system_config(force_reload=True)
     assert config.auto_save_results is True
+
+
+def test_cached_yaml_load_reuses_json_cache_until_file_changes(tmp_path, monkeypatch):
+    from qphase.core import utils
+
+    config_dir = tmp_path / "configs"
+    config_dir.mkdir()
+    path = config_dir / "job.yaml"
+    path.write_text("name: demo\nengine:\n  sde: {dt: 0.1}\n", encoding="utf-8")
+    expected = {"name": "demo", "engine": {"sde": {"dt": 0.1}}}
+    assert load_yaml(path, cache=True) == expected
+    # The cache lives in the user cache directory, not next to the config.
+    assert [p.name for p in config_dir.iterdir()] == ["job.yaml"]
+    assert utils._yaml_cache_file(path)[1].exists()
+
+    def _no_parse(p):
+        raise AssertionError("YAML re-parsed despite a fresh cache file")
+
+    # A new process starts without the in-memory cache.
+    utils._YAML_MEMO.clear()
+    with monkeypatch.context() as m:
+        m.setattr(utils, "_parse_yaml", _no_parse)
+        assert load_yaml(path, cache=True) == expected
+
+    path.write_text("name: changed, longer\n", encoding="utf-8")
+    assert load_yaml(path, cache=True) == {"name": "changed, longer"}
+
+
+def test_cached_yaml_load_keeps_parsed_documents_in_memory(tmp_path, monkeypatch):
+    from qphase.core import utils
+
+    path = tmp_path / "modes.yaml"
+    path.write_text("1: a\n2: {x: [1, 2]}\n", encoding="utf-8")
+    first = load_yaml(path, cache=True)
+
+    def _no_load(p, st):
+        raise AssertionError("document loaded again despite the memo")
+
+    monkeypatch.setattr(utils, "_load_yaml_json_cache", _no_load)
+    second = load_yaml(path, cache=True)
+    assert second == first == {1: "a", 2: {"x": [1, 2]}}
+    # Callers get private copies.
+    second[2]["x"].append(3)
+    assert load_yaml(path, cache=True)[2]["x"] == [1, 2]
+
+    monkeypatch.undo()
+    path.write_text("1: changed\n", encoding="utf-8")
+    assert load_yaml(path, cache=True) == {1: "changed"}
+
+
+def test_cached_yaml_load_skips_documents_json_cannot_represent(tmp_path):
+    from qphase.core import utils
+
+    path = tmp_path / "modes.yaml"
+    path.write_text("1: a\n2: b\n", encoding="utf-8")
+    assert load_yaml(path, cache=True) == {1: "a", 2: "b"}
+    assert not utils._yaml_cache_file(path)[1].exists()
+
+
+def test_yaml_cache_keeps_a_bounded_number_of_files(
+    tmp_path, monkeypatch, isolated_home
+):
+    from qphase.core import utils
+
+    monkeypatch.setattr(utils, "_YAML_CACHE_MAX_FILES", 3)
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"job{i}.yaml"
+        path.write_text(f"name: job{i}\n", encoding="utf-8")
+        assert load_yaml(path, cache=True) == {"name": f"job{i}"}
+        cache_file = utils._yaml_cache_file(path)[1]
+        # Distinct, increasing write times regardless of the clock resolution.
+        os.utime(cache_file, ns=(i * 10**9, i * 10**9))
+        paths.append(cache_file)
+
+    cache_dir = isolated_home / ".qphase" / "cache" / "yaml"
+    # The oldest written files were removed once the limit was exceeded.
+    assert sorted(cache_dir.iterdir()) == sorted(paths[2:])
+
+
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_json_helpers_agree_with_and_without_orjson(monkeypatch, with_orjson):
+    from qphase.core import utils
+
+    if not with_orjson:
+        monkeypatch.setattr(utils, "_HAS_ORJSON", False)
+    elif not utils._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+
+    doc = {"b": [1, 2.5, None], "a": {"x": "µ"}, "p": Path("out")}
+    encoded = utils.json_dumps(doc, sort_keys=True, default=str)
+    assert encoded.startswith(b'{"a"')
+    assert "µ".encode() in encoded
+    assert utils.json_loads(encoded) == {**doc, "p": "out"}
+    assert utils.json_dumps(doc, indent=True, default=str).startswith(b'{\n  "b"')
+    # Non-string keys fall back to the standard encoder on both paths.
+    assert utils.json_loads(utils.json_dumps({1: "a"})) == {"1": "a"}
+    # Both paths write the same compact bytes and keep non-finite floats.
+    assert utils.json_dumps({"a": [1, None], "b": "x"}) == b'{"a":[1,null],"b":"x"}'
+    decoded = utils.json_loads(utils.json_dumps({"x": float("nan"), "y": None}))
+    assert math.isnan(decoded["x"]) and decoded["y"] is None
+
+
+def test_libyaml_loader_matches_ruamel_yaml_1_2_values(tmp_path):
+    from qphase.core import utils
+    from qphase.core.errors import QPhaseConfigError
+
+    if utils._LibyamlLoader is None:
+        pytest.skip("PyYAML built without libyaml")
+
+    path = tmp_path / "values.yaml"
+    path.write_text(
+        "dt: 1e-3\nflag: yes\non_: On\nt: true\nn: 010\no: 0o17\nh: 0x1F\n"
+        "u: 1_000\nneg: -.inf\nnull_: ~\nday: 2024-01-02\n"
+        "base: &b {p: 1, q: 2}\nderived:\n  <<: *b\n  p: 3\n",
+        encoding="utf-8",
+    )
+    parsed = load_yaml(path)
+    assert parsed == utils._ruamel_yaml.load(path.read_text(encoding="utf-8"))
+    assert parsed["dt"] == 0.001
+    assert parsed["flag"] == "yes"
+    assert parsed["n"] == 10
+    assert parsed["derived"] == {"p": 3, "q": 2}
+
+    path.write_text("a: 1\na: 2\n", encoding="utf-8")
+    with pytest.raises(QPhaseConfigError, match="duplicate key"):
+        load_yaml(path)
+
+
+def test_path_getter_walks_dicts_and_attributes():
+    from types import SimpleNamespace
+
+    job = SimpleNamespace(plugins={"model": {"kerr": {"chi": 0.5}}})
+
+    get_chi = path_getter("plugins.model.kerr.chi")
+    assert get_chi(job) == 0.5
+    assert path_getter("plugins.model.kerr.chi") is get_chi
+    assert path_getter("plugins.model.vdp.chi")(job) is None
+    assert path_getter("missing.key")(job) is None
+    assert path_getter("a.b")({"a": {"b": [1]}}) == [1]
@@ -0,0 +1,113 @@
+"""Tests for plugin discovery."""
+
+import importlib
+import importlib.metadata
+
+from qphase.core.registry import DiscoveryService, RegistryCenter
+
+
+def test_entry_point_scan_is_cached_until_reset(monkeypatch):
+    calls = []
+    real = importlib.metadata.entry_points
+
+    def _counting(**kwargs):
+        calls.append(kwargs)
+        return real(**kwargs)
+
+    monkeypatch.setattr(importlib.metadata, "entry_points", _counting)
+    discovery = DiscoveryService(RegistryCenter())
+    discovery.reset()
+
+    discovery.discover_plugins(group="qphase")
+    discovery.discover_plugins(group="qphase")
+    assert len(calls) == 1
+
+    discovery.reset()
+    discovery.discover_plugins(group="qphase")
+    assert len(calls) == 2
+
+
+def test_register_lazy_uses_presplit_target():
+    registry = RegistryCenter()
+    registry.register_lazy(
+        "demo",
+        "join",
+        "os.path:join",
+        target_parts=("os.path", "join"),
+        return_callable=True,
+    )
+    registry.register_lazy("demo", "dirname", "os.path.dirname", return_callable=True)
+
+    import os.path
+
+    assert registry.create("demo:join") is os.path.join
+    assert registry.create("demo:dirname") is os.path.dirname
+    assert registry._tables["demo"]["dirname"].target_parts == ("os.path", "dirname")
+
+
+def test_dotted_entry_is_imported_once(monkeypatch):
+    registry_module = importlib.import_module("qphase.core.registry")
+    calls = []
+    real = registry_module.import_module
+
+    def _counting(name):
+        calls.append(name)
+        return real(name)
+
+    monkeypatch.setattr(registry_module, "import_module", _counting)
+    registry = RegistryCenter()
+    registry.register_lazy("demo", "counter", "collections:Counter")
+
+    first = registry.create("demo:counter")
+    second = registry.create("demo:counter")
+    assert calls == ["collections"]
+    # Only the class is memoized; every create builds a new instance.
+    assert first is not second
+
+
+def test_scanable_params_are_read_once_per_schema():
+    from pydantic import BaseModel, Field
+
+    class _Schema(BaseModel):
+        omega: float = Field(1.0, json_schema_extra={"scanable": True})
+        phase: float = Field(0.0, json_schema_extra=lambda s: s.update(scanable=True))
+        label: str = "x"
+
+    class _Plugin:
+        config_schema = _Schema
+
+    registry = RegistryCenter()
+    registry.register("demo", "plugin", _Plugin)
+    registry_module = importlib.import_module("qphase.core.registry")
+
+    before = registry_module._scanable_fields.cache_info().hits
+    first = registry.get_scanable_params("demo", "plugin")
+    second = registry.get_scanable_params("demo", "plugin")
+    assert first == second == {"omega": True, "phase": True, "label": False}
+    assert registry_module._scanable_fields.cache_info().hits == before + 1
+    # Callers get their own dict, not the cached mapping.
+    first["label"] = True
+    assert registry.get_scanable_params("demo", "plugin")["label"] is False
+
+
+def test_create_plugin_instance_skips_full_name_round_trip(monkeypatch):
+    from pydantic import BaseModel
+
+    class _Config(BaseModel):
+        gain: float = 1.0
+
+    class _Plugin:
+        config_schema = _Config
+
+        def __init__(self, config):
+            self.config = config
+
+    def _no_split(full_name):
+        raise AssertionError(f"re-split {full_name!r}")
+
+    registry = RegistryCenter()
+    registry.register("demo", "plugin", _Plugin)
+    monkeypatch.setattr(registry, "_split", _no_split)
+
+    plugin = registry.create_plugin_instance("demo", {"name": "plugin", "gain": 2})
+    assert plugin.config == _Config(gain=2.0)
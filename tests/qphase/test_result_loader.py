@@ -0,0 +1,68 @@
+"""Tests for loading job results from disk."""
+
+import json
+
+import numpy as np
+import pytest
+from qphase.core.errors import QPhaseError
+from qphase.core.result_loader import load_result
+
+
+def test_load_result_prefers_job_name_then_single_file(tmp_path):
+    payload = {"data": [1, 2], "metadata": {"label": "j"}}
+    (tmp_path / "result.json").write_text(json.dumps(payload), encoding="utf-8")
+    np.savez(tmp_path / "job.npz", data=np.arange(3))
+
+    # ``{job_name}.npz`` wins over the generic ``result.json``.
+    np.testing.assert_array_equal(load_result("job", tmp_path).data, [0, 1, 2])
+    loaded = load_result("other", tmp_path)
+    assert (loaded.data, loaded.label) == ([1, 2], "j")
+
+    # Without an exact name, the only file of a supported type is used.
+    scan = tmp_path / "scan"
+    scan.mkdir()
+    (scan / "notes.txt").write_text("x", encoding="utf-8")
+    (scan / "out.json").write_text("[3]", encoding="utf-8")
+    assert load_result("missing", scan).data == [3]
+
+    (scan / "more.json").write_text("[4]", encoding="utf-8")
+    with pytest.raises(QPhaseError, match="No supported result file"):
+        load_result("missing", scan)
+
+
+def test_npz_result_is_opened_once(tmp_path, monkeypatch):
+    import builtins
+
+    data = np.arange(12.0).reshape(3, 4)
+    np.savez(tmp_path / "job.npz", data=data, meta=np.array({"label": "a"}))
+
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    loaded = load_result("job", tmp_path, mmap=True)
+    monkeypatch.undo()
+
+    assert opened == [str(tmp_path / "job.npz")]
+    # The map outlives the archive handle it was created from.
+    assert isinstance(loaded.data, np.memmap)
+    np.testing.assert_array_equal(loaded.data, data)
+    assert loaded.label == "a"
+
+
+def test_mmap_falls_back_to_path_without_archive_internals(tmp_path):
+    from qphase.core.result_loader import mmap_npz_member
+
+    data = np.arange(6.0)
+    np.savez(tmp_path / "job.npz", data=data)
+
+    class OpaqueArchive:
+        """An archive object without NpzFile's ``fid``/``zip`` attributes."""
+
+    mapped = mmap_npz_member(tmp_path / "job.npz", "data", OpaqueArchive())
+    assert isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(mapped, data)
@@ -16,6 +16,7 @@ def mock_system_config(tmp_path):
     config.paths.output_dir = str(tmp_path / "runs")
     config.parameter_scan = {"enabled": True, "method": "cartesian"}
     config.auto_save_results = True
+    config.mmap_results = False
     config.progress_update_interval = 0.1
     return config
 
@@ -49,6 +50,53 @@ def test_dry_run(mock_system_config, simple_job_list):
         assert scheduler.session_dir.exists()
 
 
+def test_results_are_streamed_as_jobs_finish(mock_system_config, simple_job_list):
+    streamed = []
+    scheduler = Scheduler(system_config=mock_system_config, on_result=streamed.append)
+    real_run_single = scheduler._run_single
+
+    def _run_single(job, *args, **kwargs):
+        # Earlier jobs are handed over before the next one starts.
+        assert [r.job_name for r in streamed] == [
+            j.name for j in simple_job_list.jobs[: args[0]]
+        ]
+        return real_run_single(job, *args, **kwargs)
+
+    with (
+        patch.object(scheduler, "_validate_jobs"),
+        patch.object(
+            scheduler, "_expand_parameter_scans", return_value=simple_job_list.jobs
+        ),
+        patch.object(scheduler, "_run_single", side_effect=_run_single),
+    ):
+        results = scheduler.run(simple_job_list, dry_run=True)
+
+    assert streamed == results
+
+
+def test_failing_result_callback_does_not_abort_run(
+    mock_system_config, simple_job_list
+):
+    calls = []
+
+    def broken_pipe(result):
+        calls.append(result)
+        raise BrokenPipeError("reader went away")
+
+    scheduler = Scheduler(system_config=mock_system_config, on_result=broken_pipe)
+    with (
+        patch.object(scheduler, "_validate_jobs"),
+        patch.object(
+            scheduler, "_expand_parameter_scans", return_value=simple_job_list.jobs
+        ),
+    ):
+        results = scheduler.run(simple_job_list, dry_run=True)
+
+    # Every job still runs; the consumer is dropped after its first error.
+    assert [r.job_name for r in results] == ["job1", "job2"]
+    assert len(calls) == 1
+
+
 def test_resume_capability(mock_system_config, simple_job_list, tmp_path):
     # 1. Create a fake previous session
     session_dir = tmp_path / "runs" / "old_session"
@@ -103,6 +151,29 @@ def test_resume_capability(mock_system_config, simple_job_list, tmp_path):
             assert new_manifest["status"] == "completed"
 
 
+@pytest.mark.parametrize("mmap_results", [False, True])
+def test_resumed_input_is_mapped_when_configured(
+    mock_system_config, tmp_path, mmap_results
+):
+    import numpy as np
+
+    session_dir = tmp_path / "runs" / "old_session"
+    (session_dir / "job1").mkdir(parents=True)
+    np.savez(session_dir / "job1" / "job1.npz", data=np.arange(4.0))
+    mock_system_config.mmap_results = mmap_results
+    scheduler = Scheduler(system_config=mock_system_config)
+    scheduler.session_dir = session_dir
+    scheduler.manifest = {
+        "jobs": {"job1": {"status": "completed", "output_dir": "job1"}}
+    }
+
+    job = JobConfig(name="job2", engine={"test_engine": {}}, input="job1")
+    result = scheduler._resolve_input(job, {})
+
+    assert isinstance(result.data, np.memmap) is mmap_results
+    np.testing.assert_array_equal(result.data, np.arange(4.0))
+
+
 def test_validate_command_logic(mock_system_config, simple_job_list):
     scheduler = Scheduler(system_config=mock_system_config)
 
@@ -0,0 +1,106 @@
+"""Tests for configuration snapshot persistence."""
+
+from pathlib import Path
+
+import pytest
+from qphase.core import snapshot as snapshot_module
+from qphase.core.config import JobConfig
+from qphase.core.snapshot import SnapshotManager
+
+
+def _make_snapshot(manager: SnapshotManager, run_dir: Path, **metadata):
+    job = JobConfig(name="demo", engine={"sde": {"dt": 0.1}})
+    return manager.create_snapshot(
+        job=job,
+        job_index=0,
+        system_config=None,
+        validated_plugins={},
+        engine_config={"sde": {"dt": 0.1}},
+        run_dir=run_dir,
+        metadata=metadata,
+    )
+
+
+def test_save_snapshot_skips_identical_payload(tmp_path):
+    """Re-saving an unchanged snapshot must not rewrite the file."""
+    manager = SnapshotManager(tmp_path)
+    run_dir = tmp_path / "run"
+
+    path = manager.save_snapshot(_make_snapshot(manager, run_dir), run_dir)
+    first = path.read_text(encoding="utf-8")
+    assert path.with_suffix(".json.sha").exists()
+    # Both files are renamed into place; no temporaries are left behind.
+    assert sorted(p.name for p in run_dir.iterdir()) == [
+        "config_snapshot.json",
+        "config_snapshot.json.sha",
+    ]
+
+    # A fresh snapshot only differs by ``created_at``; the file is kept as-is.
+    manager.save_snapshot(_make_snapshot(manager, run_dir), run_dir)
+    assert path.read_text(encoding="utf-8") == first
+
+    # Changing the payload forces a rewrite.
+    manager.save_snapshot(_make_snapshot(manager, run_dir, note="changed"), run_dir)
+    assert manager.load_snapshot(path).metadata == {"note": "changed"}
+
+
+def test_export_snapshot_round_trips(tmp_path):
+    """Exported snapshots share the JSON writer and load back unchanged."""
+    manager = SnapshotManager(tmp_path)
+    snapshot = _make_snapshot(manager, tmp_path / "run")
+
+    exported = manager.export_snapshot(snapshot, tmp_path / "export.json")
+    loaded = manager.load_snapshot(exported)
+    assert loaded.job_config == snapshot.job_config
+    assert str(loaded.run_dir) == str(snapshot.run_dir)
+
+
+def test_manager_does_not_create_snapshot_dir(tmp_path):
+    """Constructing a manager has no filesystem side effects."""
+    root = tmp_path / "missing"
+    manager = SnapshotManager(root)
+    assert not root.exists()
+    assert manager.list_snapshots() == []
+
+
+def test_failed_write_keeps_previous_snapshot(tmp_path, monkeypatch):
+    """An interrupted write leaves the old file intact and no temp file."""
+    manager = SnapshotManager(tmp_path)
+    run_dir = tmp_path / "run"
+    path = manager.save_snapshot(_make_snapshot(manager, run_dir), run_dir)
+    before = path.read_text(encoding="utf-8")
+
+    def _boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(snapshot_module.os, "replace", _boom)
+    with pytest.raises(OSError, match="disk full"):
+        manager.save_snapshot(_make_snapshot(manager, run_dir, note="x"), run_dir)
+
+    assert path.read_text(encoding="utf-8") == before
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+def test_listing_reuses_parsed_snapshots(tmp_path, monkeypatch):
+    """Unchanged snapshot files are parsed once per manager."""
+    manager = SnapshotManager(tmp_path)
+    run_dir = tmp_path / "run"
+    path = manager.save_snapshot(_make_snapshot(manager, run_dir), run_dir)
+
+    parsed = []
+    real_loads = snapshot_module.json_loads
+
+    def _counting_loads(data):
+        parsed.append(data)
+        return real_loads(data)
+
+    monkeypatch.setattr(snapshot_module, "json_loads", _counting_loads)
+    latest = manager.get_latest_snapshot("demo")
+    assert manager.list_snapshots("demo") == [latest]
+    assert manager.load_snapshot(path) is latest
+    assert len(parsed) == 1
+
+    # A rewritten file is parsed again.
+    manager.save_snapshot(_make_snapshot(manager, run_dir, note="new"), run_dir)
+    assert manager.load_snapshot(path).metadata == {"note": "new"}
+    assert len(parsed) == 2
@@ -0,0 +1,50 @@
+"""Tests for array namespace utilities."""
+
+import numpy as np
+from qphase.backend import xputil
+from qphase.backend.xputil import convert_to_numpy, get_xp
+
+
+def test_get_xp_numpy_and_fallback():
+    assert get_xp(np.zeros(3)) is np
+    assert get_xp([1.0, 2.0]) is np
+    np.testing.assert_array_equal(convert_to_numpy([1, 2]), [1, 2])
+
+
+def test_get_xp_resolution_is_cached_per_type():
+    get_xp(np.zeros(2))
+    assert xputil._XP_BY_TYPE[np.ndarray] is np
+
+
+def test_optional_backends_resolve_lazily():
+    from importlib.util import find_spec
+
+    import qphase.backend as backend_pkg
+    import qphase.core as core_pkg
+
+    # Lazy names stay exported; ``dir`` offers only backends that can run.
+    lazy = {"NumbaBackend": "numba", "TorchBackend": "torch", "CuPyBackend": "cupy"}
+    assert set(lazy) <= set(backend_pkg.__all__)
+    listed = set(dir(backend_pkg))
+    for name, lib in lazy.items():
+        if name not in vars(backend_pkg):
+            assert (name in listed) == (find_spec(lib) is not None)
+    assert set(core_pkg.__all__) <= set(dir(core_pkg))
+    try:
+        from qphase.backend.numba_backend import NumbaBackend
+    except ImportError:  # pragma: no cover - numba not installed
+        return
+    assert backend_pkg.NumbaBackend is NumbaBackend
+
+
+def test_cuda_dlpack_probe():
+    class _FakeCudaArray:
+        def __dlpack__(self, stream=None):  # pragma: no cover - never consumed
+            raise NotImplementedError
+
+        def __dlpack_device__(self):
+            return (2, 0)
+
+    assert xputil.is_cuda_dlpack(_FakeCudaArray())
+    assert not xputil.is_cuda_dlpack(np.zeros(2))
+    assert not xputil.is_cuda_dlpack([1.0])
@@ -6,6 +6,7 @@ from qphase.backend.numpy_backend import NumpyBackend, NumpyConfig
 from qphase_sde.engine import Engine, EngineConfig
 from qphase_sde.integrator.base import ChunkStepResult
 from qphase_sde.integrator.euler_maruyama import EulerMaruyama
+from qphase_sde.result import SDEResult
 
 pytestmark = pytest.mark.integration
 
@@ -77,6 +78,30 @@ def test_engine_run():
     assert result.trajectory.data.shape[1] >= 5  # n_steps
 
 
+def test_engine_result_uses_configured_trajectory_format(tmp_path):
+    config = EngineConfig(
+        dt=0.01,
+        t0=0.0,
+        t1=0.05,
+        n_traj=2,
+        ic=np.zeros((2, 1)),
+        keep_traj=True,
+        trajectory_format="npy",
+    )
+    plugins = {
+        "backend": NumpyBackend(),
+        "integrator": EulerMaruyama(),
+        "model": DummySDEModel(),
+    }
+
+    result = Engine(config=config, plugins=plugins).run()
+    result.save(tmp_path / "job")
+
+    assert (tmp_path / "job.npy").exists()
+    loaded = SDEResult.load(tmp_path / "job.npz", mmap=True)
+    assert isinstance(loaded.trajectory.data, np.memmap)
+
+
 class DummyChunkIntegrator:
     class Config:
         """Minimal chunk configuration."""
@@ -130,6 +155,18 @@ def test_engine_chunk_path_preserves_save_boundaries():
     np.testing.assert_allclose(trajectory.data[0, :, 0], [0.0, 0.3, 0.6, 0.9])
 
 
+def test_chunk_save_offsets_match_stride_multiples():
+    from qphase_sde.engine import _save_offsets
+
+    for stride in (1, 2, 3, 7):
+        for k in range(0, 15):
+            for n_chunk in (1, 4, 9):
+                expected = tuple(
+                    o for o in range(1, n_chunk + 1) if (k + o) % stride == 0
+                )
+                assert _save_offsets(k, n_chunk, stride) == expected
+
+
 def test_engine_records_selected_modes_in_state_dtype():
     ic = np.array([[1.0 + 2.0j, 3.0 + 4.0j]], dtype=np.complex64)
     config = EngineConfig(
@@ -164,6 +201,31 @@ def test_engine_records_selected_modes_in_state_dtype():
     np.testing.assert_allclose(trajectory.data[0, :, 0], 3.0 + 4.0j)
 
 
+def test_engine_accepts_strided_initial_condition():
+    base = np.array([[1.0 + 0j, 9.0, 2.0 + 1j, 9.0]] * 2)
+    ic = base[:, ::2]  # a strided column view
+    engine = Engine(
+        config=EngineConfig(dt=0.1, t0=0.0, t1=0.2, n_traj=2, seed=3, ic=ic),
+        plugins={
+            "backend": NumpyBackend(),
+            "integrator": EulerMaruyama(),
+            "model": TwoModeModel(),
+        },
+    )
+
+    trajectory = engine.run_sde(
+        model=TwoModeModel(),
+        ic=ic,
+        time={"t0": 0.0, "dt": 0.1, "steps": 2},
+        n_traj=2,
+        seed=3,
+    )
+
+    np.testing.assert_allclose(trajectory.data[:, -1], ic)
+    # The caller's array is copied, not written through.
+    np.testing.assert_array_equal(base[:, 1::2], 9.0)
+
+
 @pytest.mark.parametrize("record_modes", [[0, 0], [2], [-1]])
 def test_engine_rejects_invalid_record_modes(record_modes):
     config = EngineConfig(
@@ -185,3 +247,25 @@ def test_engine_rejects_invalid_record_modes(record_modes):
             solver=EulerMaruyama(),
             seed=9,
         )
+
+
+def test_engine_per_trajectory_streams_are_reproducible():
+    """``per_traj_seeds`` drives one RNG stream per trajectory."""
+    engine = Engine(
+        config=EngineConfig(dt=0.1, t0=0.0, t1=0.3, n_traj=3, ic=[[0.0]]),
+        plugins={"backend": NumpyBackend(), "integrator": EulerMaruyama()},
+    )
+
+    def _run(seeds):
+        return engine.run_sde(
+            model=DummySDEModel(),
+            ic=[[0.0]],
+            time={"t0": 0.0, "dt": 0.1, "steps": 3},
+            n_traj=3,
+            per_traj_seeds=seeds,
+        ).data
+
+    first = _run([1, 2, 3])
+    np.testing.assert_allclose(first, _run([1, 2, 3]))
+    # Trajectory 0 only depends on its own seed.
+    np.testing.assert_allclose(first[0], _run([1, 5, 6])[0])
@@ -121,3 +121,27 @@ def test_srk_custom_method_placeholder(backend):
 
     dy = integrator.step(y, 0.0, 0.01, model, dW, backend)
     assert dy.shape == y.shape
+
+
+def test_expand_complex_noise_preserves_noise_covariance():
+    """The real-basis expansion keeps ``Lc Lc^H`` and a zero pseudo-covariance."""
+    from qphase_sde import ops
+
+    rng = np.random.default_rng(0)
+    Lc = rng.standard_normal((2, 3)) + 1j * rng.standard_normal((2, 3))
+    Lr = ops.expand_complex_noise(Lc, NumpyBackend())
+
+    assert Lr.shape == (2, 6)
+    np.testing.assert_allclose(Lr @ Lr.conj().T, Lc @ Lc.conj().T)
+    np.testing.assert_allclose(Lr @ Lr.T, np.zeros((2, 2)), atol=1e-12)
+
+
+def test_expand_complex_noise_keeps_dtype_and_accepts_real_input():
+    from qphase_sde import ops
+
+    be = NumpyBackend()
+    Lc = np.ones((2, 1), dtype=np.complex64)
+    assert ops.expand_complex_noise(Lc, be).dtype == np.complex64
+
+    Lr = ops.expand_complex_noise(np.ones((2, 1)), be)
+    np.testing.assert_allclose(Lr, np.full((2, 2), 1 / np.sqrt(2)) * [1, 1j])
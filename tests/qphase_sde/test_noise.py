@@ -0,0 +1,138 @@
+"""Tests for Gaussian noise sampling."""
+
+import numpy as np
+import pytest
+from qphase.backend.numpy_backend import NumpyBackend
+from qphase_sde.model import NoiseSpec
+from qphase_sde.noise import GaussianNoise
+
+
+@pytest.fixture
+def backend():
+    return NumpyBackend()
+
+
+def test_independent_noise_scaled_by_sqrt_dt(backend):
+    """Independent increments have variance ``dt`` per channel."""
+    noise = GaussianNoise(NoiseSpec(kind="independent", dim=2), backend)
+    dW = noise.sample(backend.rng(0), (20000, 2), 0.04)
+
+    assert dW.shape == (20000, 2)
+    np.testing.assert_allclose(dW.var(axis=0), [0.04, 0.04], rtol=0.05)
+
+
+def test_correlated_noise_matches_covariance(backend):
+    """Correlated increments reproduce ``covariance * dt``."""
+    cov = np.array([[1.0, 0.6], [0.6, 2.0]])
+    noise = GaussianNoise(NoiseSpec(kind="correlated", dim=2, covariance=cov), backend)
+    assert noise._chol_T.flags.c_contiguous
+
+    dt = 0.1
+    dW = noise.sample(backend.rng(1), (50000, 2), dt)
+    np.testing.assert_allclose(np.cov(dW.T), cov * dt, atol=0.01)
+
+
+def test_correlated_noise_requires_matching_covariance(backend):
+    """Missing or mis-shaped covariance is rejected up front."""
+    with pytest.raises(ValueError, match="covariance"):
+        GaussianNoise(NoiseSpec(kind="correlated", dim=2), backend)
+    with pytest.raises(ValueError, match="shape"):
+        GaussianNoise(
+            NoiseSpec(kind="correlated", dim=2, covariance=np.eye(3)), backend
+        )
+
+
+def test_noise_keeps_requested_dtype(backend):
+    """Scaling by ``sqrt(dt)`` must not promote single-precision noise."""
+    cov = np.array([[1.0, 0.2], [0.2, 1.0]])
+    for spec in (
+        NoiseSpec(kind="independent", dim=2),
+        NoiseSpec(kind="correlated", dim=2, covariance=cov),
+    ):
+        noise = GaussianNoise(spec, backend, dtype=np.float32)
+        assert noise.sample(backend.rng(0), (4, 2), 0.01).dtype == np.float32
+
+
+def test_per_trajectory_rngs_fill_rows_independently(backend):
+    """Each trajectory row is drawn from its own RNG stream."""
+    noise = GaussianNoise(NoiseSpec(kind="independent", dim=3), backend)
+    rngs = backend.spawn_rngs(5, 4)
+    dW = noise.sample(rngs, (4, 3), 0.25)
+
+    expected = backend.spawn_rngs(5, 4)[2].standard_normal(3) * 0.5
+    np.testing.assert_allclose(dW[2], expected)
+
+    # Chunked shapes draw one (n_chunk, M) block per trajectory.
+    chunk = noise.sample(backend.spawn_rngs(5, 4), (6, 4, 3), 0.25)
+    assert chunk.shape == (6, 4, 3)
+
+    with pytest.raises(ValueError, match="per-trajectory"):
+        noise.sample(backend.spawn_rngs(5, 2), (4, 3), 0.25)
+
+
+def test_scaled_factor_cached_per_dt(backend):
+    """The scaled Cholesky factor is reused until ``dt`` changes."""
+    noise = GaussianNoise(
+        NoiseSpec(kind="correlated", dim=2, covariance=[[1.0, 0.5], [0.5, 1.0]]),
+        backend,
+    )
+    rng = backend.rng(0)
+    noise.sample(rng, (4, 2), 0.01)
+    cached = noise._chol_T_scaled
+    noise.sample(rng, (4, 2), 0.01)
+    assert noise._chol_T_scaled is cached
+    noise.sample(rng, (4, 2), 0.04)
+    assert noise._chol_T is not None
+    np.testing.assert_allclose(noise._chol_T_scaled, 0.2 * noise._chol_T)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_backend_randn_samples_natively(backend, dtype):
+    """``randn`` draws in the requested precision rather than casting fp64."""
+    z = backend.randn(backend.rng(3), (5, 2), dtype=dtype)
+    expected = np.random.default_rng(3).standard_normal((5, 2), dtype=dtype)
+    assert z.dtype == dtype
+    np.testing.assert_array_equal(z, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_backend_randn_into_fills_buffers_in_their_precision(backend, dtype):
+    """``randn_into`` fills contiguous and strided slots like ``randn``."""
+    expected = backend.randn(backend.rng(5), (3, 4), dtype=dtype)
+
+    out = np.empty((3, 4), dtype=dtype)
+    assert backend.randn_into(backend.rng(5), out) is out
+    np.testing.assert_array_equal(out, expected)
+
+    # A trajectory column of a chunk is strided and filled through a copy.
+    chunk = np.zeros((3, 2, 4), dtype=dtype)
+    backend.randn_into(backend.rng(5), chunk[:, 0])
+    assert chunk.dtype == dtype
+    np.testing.assert_array_equal(chunk[:, 0], expected)
+    assert not chunk[:, 1].any()
+
+
+@pytest.mark.parametrize("kind", ["independent", "correlated"])
+def test_sample_into_out_matches_fresh_draw(backend, kind):
+    """``out=`` fills the caller's buffer with the same increments."""
+    cov = [[1.0, 0.3], [0.3, 2.0]] if kind == "correlated" else None
+    noise = GaussianNoise(NoiseSpec(kind=kind, dim=2, covariance=cov), backend)
+    expected = noise.sample(backend.rng(4), (6, 2), 0.01)
+
+    out = np.empty((6, 2))
+    result = noise.sample(backend.rng(4), (6, 2), 0.01, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, expected)
+    # Returned arrays never alias the internal scratch buffer.
+    assert not np.shares_memory(expected, out)
+    assert not np.shares_memory(noise.sample(backend.rng(4), (6, 2), 0.01), expected)
+
+
+def test_scratch_buffer_reused_for_shorter_chunks(backend):
+    """A trailing partial chunk reuses the leading slice of the scratch."""
+    cov = [[1.0, 0.0], [0.0, 1.0]]
+    noise = GaussianNoise(NoiseSpec(kind="correlated", dim=2, covariance=cov), backend)
+    noise.sample(backend.rng(0), (4, 3, 2), 0.1)
+    scratch = noise._z
+    assert noise.sample(backend.rng(0), (2, 3, 2), 0.1).shape == (2, 3, 2)
+    assert noise._z is scratch
@@ -139,6 +139,19 @@ def test_peak_info_serialization_no_numpy_or_complex():
     assert _no_special_types(props)
 
 
+def test_peak_info_default_dump_matches_serializer_path():
+    """The default dump fast path agrees with the generic serializer."""
+    info = PeakInfo(
+        indices=[3],
+        frequencies=[0.25],
+        values=[2.0],
+        properties={"prominences": np.array([1.5])},
+    )
+
+    assert info.model_dump() == info.model_dump(mode="python")
+    assert info.model_dump(include={"indices"}) == {"indices": [3]}
+
+
 def test_scipy_properties_serialized():
     """Scipy finder returns ndarray properties; model_dump should convert them."""
     freqs = np.linspace(-2.0, 2.0, 401)
@@ -152,3 +165,21 @@ def test_scipy_properties_serialized():
     # SciPy find_peaks properties contain arrays; they must be lists now.
     for value in dumped["properties"].values():
         assert not isinstance(value, np.ndarray)
+
+
+def test_psd_legacy_peak_flags_build_one_finder():
+    """Legacy ``find_peaks`` flags map onto one shared Scipy finder."""
+    from qphase_sde.analyser.psd import PsdAnalyzerConfig, _peak_finder
+
+    base = {"modes": [0], "kind": "complex"}
+    legacy = {**base, "prominence": 0.5, "max_peaks": 2}
+    finder = _peak_finder(PsdAnalyzerConfig(find_peaks=True, **legacy))
+    assert isinstance(finder, ScipyPeakFinder)
+    assert finder.config.prominence == 0.5
+    assert finder.config.noise_threshold is None
+    assert _peak_finder(PsdAnalyzerConfig(find_peaks="Standard", **legacy)) is finder
+    assert _peak_finder(PsdAnalyzerConfig(**base)) is None
+    assert isinstance(
+        _peak_finder(PsdAnalyzerConfig(**base, find_peaks="rational")),
+        RationalPeakFinder,
+    )
@@ -241,3 +241,130 @@ def test_psd_method_invalid():
             modes=[0],
             method="not_a_method",
         )
+
+
+@pytest.mark.parametrize("n_time", [32, 33])
+def test_modular_periodogram_matches_full_fft(n_time):
+    """The real-input (rfft) path reproduces the two-sided FFT spectrum."""
+    dt = 0.1
+    values = _make_sine_data(n_traj=5, n_time=n_time, dt=dt)
+    data = TrajectorySet(data=values, t0=0.0, dt=dt)
+    payload = (
+        PsdAnalyzer(kind="modular", modes=[0], convention="pragmatic")
+        .analyze(data, BACKEND)
+        .data_dict
+    )
+
+    trajectory_psd = np.abs(np.fft.fft(np.abs(values[:, :, 0]), axis=-1)) ** 2
+    trajectory_psd = np.fft.fftshift(trajectory_psd * dt / n_time, axes=-1)
+    np.testing.assert_allclose(payload["psd"][:, 0], trajectory_psd.mean(axis=0))
+    np.testing.assert_allclose(
+        payload["psd_std"][:, 0], trajectory_psd.std(axis=0, ddof=1)
+    )
+    np.testing.assert_allclose(
+        payload["axis"], np.fft.fftshift(np.fft.fftfreq(n_time, d=dt))
+    )
+
+
+def test_windows_and_tapers_are_cached_read_only():
+    """Per-length windows/tapers are built once and shared across modes."""
+    from qphase_sde.analyser import psd as psd_module
+
+    psd_module._dpss_tapers.cache_clear()
+    data = TrajectorySet(data=_make_sine_data(n_traj=2, n_time=64), dt=0.1)
+    PsdAnalyzer(kind="complex", modes=[0, 0], method="multitaper").analyze(
+        data, BACKEND
+    )
+    info = psd_module._dpss_tapers.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+    w, energy = psd_module._window("hanning", 16)
+    assert not w.flags.writeable
+    assert energy == pytest.approx(np.sum(np.hanning(16) ** 2))
+
+
+@pytest.mark.parametrize("kind", ["complex", "modular"])
+def test_batched_periodogram_matches_per_mode_analysis(kind):
+    """All modes share one FFT call but match single-mode results."""
+    rng = np.random.default_rng(3)
+    values = rng.standard_normal((4, 40, 3)) + 1j * rng.standard_normal((4, 40, 3))
+    data = TrajectorySet(data=values, t0=0.0, dt=0.1)
+
+    batched = (
+        PsdAnalyzer(kind=kind, modes=[2, 0], window="hanning")
+        .analyze(data, BACKEND)
+        .data_dict
+    )
+    for j, mode in enumerate([2, 0]):
+        single = (
+            PsdAnalyzer(kind=kind, modes=[mode], window="hanning")
+            .analyze(data, BACKEND)
+            .data_dict
+        )
+        for field in ("psd", "psd_std", "psd_sem"):
+            np.testing.assert_allclose(batched[field][:, j], single[field][:, 0])
+        # The unbatched 2-D path gives the same spectrum.
+        _, mean = PsdAnalyzer(kind=kind, modes=[mode])._compute_single(
+            values[:, :, mode], 0.1, kind=kind, window="hanning", backend=BACKEND
+        )
+        np.testing.assert_allclose(batched["psd"][:, j], mean)
+
+
+def test_welch_segments_are_transformed_in_one_batch():
+    """The strided segment batch matches an explicit per-segment loop."""
+    rng = np.random.default_rng(5)
+    x = rng.standard_normal((3, 100)) + 1j * rng.standard_normal((3, 100))
+    nperseg, noverlap, nfft, dt = 24, 10, 32, 0.1
+
+    estimate = PsdAnalyzer(kind="complex", modes=[0])._estimate_single(
+        x,
+        dt,
+        convention="pragmatic",
+        method="welch",
+        nperseg=nperseg,
+        noverlap=noverlap,
+        nfft=nfft,
+    )
+
+    w = np.hanning(nperseg)
+    starts = range(0, 100 - nperseg + 1, nperseg - noverlap)
+    expected = np.mean(
+        [
+            [np.abs(np.fft.fft(traj[s : s + nperseg] * w, n=nfft)) ** 2 for s in starts]
+            for traj in x
+        ],
+        axis=(0, 1),
+    ) * (dt / np.sum(w * w))
+    np.testing.assert_allclose(estimate.mean, np.fft.fftshift(expected))
+
+
+@pytest.mark.parametrize("method", ["welch", "multitaper"])
+def test_segment_methods_transform_trajectories_in_bounded_chunks(method, monkeypatch):
+    """Chunking the trajectory batch leaves the estimate unchanged."""
+    import qphase_sde.analyser.psd as psd_module
+
+    values = _make_sine_data(n_traj=7, n_time=256)
+    analyzer = PsdAnalyzer(kind="complex", modes=[0], method=method, nperseg=64)
+    whole = analyzer.analyze(values, BACKEND).data_dict
+
+    # Room for about two trajectories per FFT block: several chunks, the
+    # last one partial.
+    monkeypatch.setattr(psd_module, "_FFT_BLOCK_ELEMENTS", 2 * 4 * 256)
+    chunked = analyzer.analyze(values, BACKEND).data_dict
+    for field in ("psd", "psd_std", "psd_sem"):
+        np.testing.assert_allclose(chunked[field], whole[field])
+
+
+def test_fft_worker_count_comes_from_config():
+    """Host FFT threads are configured; zero is rejected like in scipy."""
+    from pydantic import ValidationError
+
+    values = _make_sine_data(n_traj=4, n_time=128)
+    single = PsdAnalyzer(kind="complex", modes=[0]).analyze(values, BACKEND)
+    threaded = PsdAnalyzer(kind="complex", modes=[0], workers=-1).analyze(
+        values, BACKEND
+    )
+    np.testing.assert_allclose(threaded.data_dict["psd"], single.data_dict["psd"])
+
+    with pytest.raises(ValidationError, match="workers"):
+        PsdAnalyzer(kind="complex", modes=[0], workers=0)
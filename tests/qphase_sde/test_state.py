@@ -0,0 +1,207 @@
+"""Tests for SDE state containers."""
+
+import numpy as np
+import pytest
+from qphase_sde.state import State, TrajectorySet
+
+
+def test_view_and_copy_get_independent_meta():
+    state = State(data=np.zeros((3, 2)), t=0.5, meta={"label": "a"})
+    view = state.view(modes=[1])
+    view.meta["label"] = "b"
+    assert state.meta == {"label": "a"}
+    assert view.data.shape == (3, 1)
+
+    bare = State(data=np.zeros((3, 2)))
+    clone = bare.copy()
+    clone.meta["x"] = 1
+    assert bare.meta == {}
+
+
+def test_trajectory_set_times():
+    ts = TrajectorySet(data=np.zeros((2, 4, 1)), t0=1.0, dt=0.5)
+    np.testing.assert_allclose(ts.times, [1.0, 1.5, 2.0, 2.5])
+
+
+def test_state_keeps_dtype_and_promotes_1d_by_view():
+    y = np.arange(3, dtype=np.complex64)
+    state = State(data=y)
+    assert state.data.shape == (1, 3)
+    assert state.data.dtype == np.complex64
+    assert np.shares_memory(state.data, y)
+
+
+def test_trajectory_set_times_memoized_until_axis_changes():
+    ts = TrajectorySet(data=np.zeros((1, 3, 1)), t0=0.0, dt=0.1)
+    first = ts.times
+    assert ts.times is first
+    ts.dt = 0.2
+    np.testing.assert_allclose(ts.times, [0.0, 0.2, 0.4])
+
+
+def test_state_and_views_share_memory_with_strided_input():
+    y = np.zeros((4, 6), dtype=np.complex128)
+    assert State(data=y).data is y
+    strided = y[:, ::2]
+    assert State(data=strided).data is strided
+
+    state = State(data=y)
+    for view in (
+        state.view(modes=slice(0, 2)),
+        state.view(trajectories=slice(1, 3)),
+        state.view(trajectories=slice(0, 4, 2), modes=slice(1, 5, 2)),
+    ):
+        assert np.shares_memory(view.data, y)
+
+
+def test_state_containers_use_slots():
+    state = State(data=np.zeros((1, 2)))
+    ts = TrajectorySet(data=np.zeros((1, 2, 1)))
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(ts, "__dict__")
+    assert ts.copy().t0 == ts.t0
+
+
+def test_view_selects_trajectories_and_modes():
+    y = np.arange(12.0).reshape(4, 3)
+    state = State(data=y)
+    np.testing.assert_array_equal(state.view(trajectories=[0, 2]).data, y[[0, 2]])
+    np.testing.assert_array_equal(
+        state.view(trajectories=slice(1, 3), modes=[2]).data, y[1:3, [2]]
+    )
+    np.testing.assert_array_equal(
+        state.view(trajectories=[1, 3], modes=[0, 2]).data, y[np.ix_([1, 3], [0, 2])]
+    )
+
+
+def test_to_backend_is_identity_when_data_already_on_backend():
+    from qphase.backend.numpy_backend import NumpyBackend
+
+    state = State(data=np.zeros((2, 2)), meta={"k": 1})
+    assert state.to_backend(NumpyBackend()) is state
+
+    listed = TrajectorySet(data=[[[1.0]]], t0=0.5)
+    moved = listed.to_backend(NumpyBackend())
+    assert moved is not listed
+    assert isinstance(moved.data, np.ndarray)
+    assert moved.t0 == 0.5
+
+
+def test_trajectory_set_times_are_float64():
+    ts = TrajectorySet(data=np.zeros((1, 3, 1), dtype=np.complex64), t0=2, dt=1)
+    assert ts.times.dtype == np.float64
+    np.testing.assert_array_equal(ts.times, [2.0, 3.0, 4.0])
+
+
+def test_trajectory_set_times_are_read_only():
+    ts = TrajectorySet(data=np.zeros((1, 3, 1)))
+    with pytest.raises(ValueError):
+        ts.times[0] = 1.0
+
+
+def test_state_as_real_fills_out_in_place():
+    y = np.array([[1 + 2j, 3 - 4j]], dtype=np.complex64)
+    state = State(data=y)
+
+    real = state.as_real()
+    assert real.dtype == np.float32
+    np.testing.assert_array_equal(real, [[1, 3, 2, -4]])
+
+    out = np.full((1, 4), np.nan, dtype=np.float32)
+    assert state.as_real(out=out) is out
+    np.testing.assert_array_equal(out, real)
+
+    with pytest.raises(ValueError, match="out must have shape"):
+        state.as_real(out=np.empty((1, 4), dtype=np.float64))
+
+
+def test_state_as_real_of_real_data_has_zero_imaginary_half():
+    np.testing.assert_array_equal(
+        State(data=np.array([[1.0, 2.0]])).as_real(), [[1.0, 2.0, 0.0, 0.0]]
+    )
+
+
+def test_default_meta_is_private_and_writable():
+    a = State(data=np.zeros((1, 1)))
+    b = State(data=np.zeros((1, 1)))
+    a.meta["label"] = "a"
+    assert b.meta == {}
+    assert a.view().meta == {"label": "a"}
+
+
+def test_saved_trajectories_are_memory_mapped_on_request(tmp_path):
+    from qphase.core.result_loader import load_result
+    from qphase_sde.result import SDEResult
+
+    data = np.arange(24, dtype=np.complex64).reshape(2, 4, 3)
+    TrajectorySet(data=data, t0=1.0, dt=0.5, meta={"label": "a"}).save(tmp_path / "job")
+
+    # Loading reads writable arrays unless mapping is asked for.
+    loaded = load_result("job", tmp_path)
+    assert not isinstance(loaded.data, np.memmap)
+    assert loaded.data.flags.writeable
+    traj = SDEResult.load(tmp_path / "job.npz").trajectory
+    assert not isinstance(traj.data, np.memmap)
+    assert traj.data.flags.writeable
+
+    loaded = load_result("job", tmp_path, mmap=True)
+    assert isinstance(loaded.data, np.memmap)
+    np.testing.assert_array_equal(loaded.data, data)
+    assert loaded.metadata == {"label": "a"}
+
+    traj = SDEResult.load(tmp_path / "job.npz", mmap=True).trajectory
+    assert isinstance(traj.data, np.memmap)
+    np.testing.assert_array_equal(traj.data, data)
+    assert (traj.t0, traj.dt) == (1.0, 0.5)
+
+    # Compressed archives cannot be mapped and are read as before.
+    np.savez_compressed(tmp_path / "packed.npz", data=data)
+    packed = SDEResult.load(tmp_path / "packed.npz", mmap=True).trajectory.data
+    assert not isinstance(packed, np.memmap)
+    np.testing.assert_array_equal(packed, data)
+
+
+def test_npy_trajectory_format_is_opened_with_open_memmap(tmp_path):
+    from qphase.core.result_loader import load_result
+    from qphase_sde.result import SDEResult
+
+    run_dir = tmp_path / "run"
+    data = np.arange(24, dtype=np.complex64).reshape(2, 4, 3)
+    traj = TrajectorySet(data=data, t0=1.0, dt=0.5, meta={"label": "a"})
+    SDEResult(trajectory=traj, meta={"label": "a"}, trajectory_format="npy").save(
+        run_dir / "job"
+    )
+    assert sorted(p.name for p in run_dir.iterdir()) == ["job.npy", "job.npz"]
+
+    loaded = SDEResult.load(run_dir / "job.npz")
+    assert not isinstance(loaded.trajectory.data, np.memmap)
+    assert loaded.trajectory_format == "npy"
+
+    loaded = SDEResult.load(run_dir / "job.npz", mmap=True)
+    assert isinstance(loaded.trajectory.data, np.memmap)
+    np.testing.assert_array_equal(loaded.trajectory.data, data)
+    assert (loaded.trajectory.t0, loaded.trajectory.dt) == (1.0, 0.5)
+
+    # The raw file is not picked as a result of its own.
+    for name in ("job", "other"):
+        generic = load_result(name, run_dir, mmap=True)
+        assert isinstance(generic.data, np.memmap)
+        assert generic.metadata == {"label": "a"}
+
+    # Saving again replaces the file without touching a live mapping.
+    zeros = TrajectorySet(data=np.zeros_like(data), t0=1.0, dt=0.5)
+    SDEResult(trajectory=zeros, trajectory_format="npy").save(run_dir / "job")
+    np.testing.assert_array_equal(loaded.trajectory.data, data)
+
+
+def test_result_save_recreates_a_deleted_directory(tmp_path):
+    from qphase_sde.result import SDEResult
+
+    result = SDEResult(trajectory=TrajectorySet(data=np.ones((1, 2, 1))))
+    out = tmp_path / "runs" / "job.npz"
+    result.save(out)
+    # Long-lived processes keep saving after an output tree was cleaned up.
+    out.unlink()
+    out.parent.rmdir()
+    result.save(out)
+    assert out.exists()
@@ -58,6 +58,138 @@ def test_viz_engine_run_renders_files(tmp_path):
         assert path.stat().st_size > 0
 
 
+def test_viz_engine_waits_for_background_saves(tmp_path):
+    plots = [
+        {"channels": [0], "background_save": True, "filename": f"bg_{i}"}
+        for i in range(3)
+    ]
+    engine = VizEngine(
+        config=VizEngineConfig(output_dir=str(tmp_path), format="png"),
+        plugins={"visualizer": TimeSeriesPlotter(plots=plots)},
+    )
+
+    result = engine.run(_trajectory())
+
+    assert [p.name for p in result.data] == ["bg_0.png", "bg_1.png", "bg_2.png"]
+    for path in result.data:
+        assert path.stat().st_size > 0
+
+
+def test_viz_engine_settles_background_saves_when_a_plotter_fails(tmp_path):
+    from qphase_viz.plotters import base
+
+    engine = VizEngine(
+        config=VizEngineConfig(output_dir=str(tmp_path), format="png"),
+        plugins={
+            "visualizer": TimeSeriesPlotter(
+                plots=[{"channels": [0], "background_save": True, "filename": "ok"}]
+            ),
+            "visualizer_bad": TimeSeriesPlotter(plots=[{"channels": [5]}]),
+        },
+    )
+
+    with pytest.raises(QPhaseRuntimeError, match="Plotting failed"):
+        engine.run(_trajectory())
+
+    assert base._pending_saves == []
+    assert (tmp_path / "ok.png").stat().st_size > 0
+
+
+def test_viz_engine_returns_in_memory_images(tmp_path):
+    engine = VizEngine(
+        config=VizEngineConfig(output_dir=str(tmp_path), format="png"),
+        plugins={
+            "visualizer": TimeSeriesPlotter(
+                plots=[
+                    {"channels": [0], "save_mode": "bytes", "filename": "mem"},
+                    {"channels": [0], "save_mode": "both", "filename": "tee"},
+                ]
+            )
+        },
+    )
+
+    result = engine.run(_trajectory())
+
+    # Only files on disk are listed; the in-memory plot is in ``images``.
+    (tee,) = result.data
+    mem = tmp_path / "mem.png"
+    assert not mem.exists()
+    assert result.images[mem].startswith(b"\x89PNG")
+    assert tee.read_bytes() == result.images[tee]
+    assert result.metadata["count"] == 1
+
+
+def test_viz_engine_drops_in_memory_images_of_a_failed_run(tmp_path):
+    from qphase_viz.plotters import base
+
+    engine = VizEngine(
+        config=VizEngineConfig(output_dir=str(tmp_path), format="png"),
+        plugins={
+            "visualizer": TimeSeriesPlotter(
+                plots=[{"channels": [0], "save_mode": "bytes", "filename": "mem"}]
+            ),
+            "visualizer_bad": TimeSeriesPlotter(plots=[{"channels": [5]}]),
+        },
+    )
+
+    with pytest.raises(QPhaseRuntimeError, match="Plotting failed"):
+        engine.run(_trajectory())
+
+    assert base.pop_rendered_bytes() == ({}, set())
+
+
+def test_viz_engine_renders_plotters_in_worker_processes(tmp_path):
+    plugins = {
+        f"visualizer_{i}": TimeSeriesPlotter(
+            plots=[{"channels": [0], "save_mode": "both", "filename": f"w{i}"}]
+        )
+        for i in range(3)
+    }
+    engine = VizEngine(
+        config=VizEngineConfig(output_dir=str(tmp_path), format="png", workers=2),
+        plugins=plugins,
+    )
+    progress = []
+
+    result = engine.run(_trajectory(), progress_cb=lambda p, *_: progress.append(p))
+
+    assert [p.name for p in result.data] == ["w0.png", "w1.png", "w2.png"]
+    for path in result.data:
+        assert path.read_bytes() == result.images[path]
+    assert progress[-1] == 1.0
+
+
+def test_viz_engine_incremental_skips_unchanged_plotters(tmp_path, monkeypatch):
+    plotter = TimeSeriesPlotter(plots=[{"channels": [0], "filename": "ts"}])
+    config = VizEngineConfig(output_dir=str(tmp_path), incremental=True)
+    first = VizEngine(config=config, plugins={"visualizer": plotter}).run(_trajectory())
+    assert [p.name for p in first.data] == ["ts.png"]
+
+    calls = []
+    real_plot = TimeSeriesPlotter.plot
+
+    def counting_plot(self, *args):
+        calls.append(1)
+        return real_plot(self, *args)
+
+    monkeypatch.setattr(TimeSeriesPlotter, "plot", counting_plot)
+
+    # Same config, format and data: the recorded file is reused.
+    again = VizEngine(config=config, plugins={"visualizer": plotter}).run(_trajectory())
+    assert again.data == first.data
+    assert calls == []
+
+    # Changed input data or a changed spec renders again.
+    changed = _trajectory()
+    changed._data = changed._data * 2
+    VizEngine(config=config, plugins={"visualizer": plotter}).run(changed)
+    restyled = TimeSeriesPlotter(
+        plots=[{"channels": [0], "filename": "ts", "grid": False}]
+    )
+    VizEngine(config=config, plugins={"visualizer": restyled}).run(changed)
+    assert len(calls) == 2
+
+
 def test_viz_engine_requires_input(tmp_path):
     engine = VizEngine(config=VizEngineConfig(output_dir=str(tmp_path)))
     with pytest.raises(QPhaseRuntimeError):
@@ -10,3 +10,26 @@ def test_viz_import():
     spec = importlib.util.find_spec("qphase_viz")
     if spec is None:
         pytest.fail("Could not find qphase_viz module")
+
+
+def test_config_validators_are_built_at_import():
+    """Spec models compile their validators at class creation, not on first use.
+
+    A forward reference or ``defer_build`` would postpone schema building to
+    the first ``model_validate`` call, i.e. into the first render.
+    """
+    import inspect
+
+    from pydantic import BaseModel
+    from qphase_viz import config
+
+    models = [
+        obj
+        for obj in vars(config).values()
+        if inspect.isclass(obj)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == config.__name__
+    ]
+    assert models
+    incomplete = [m.__name__ for m in models if not m.__pydantic_complete__]
+    assert incomplete == []
@@ -55,6 +55,21 @@ def _trajectory(n_traj: int = 4, n_steps: int = 64, n_modes: int = 2):
     return _FakeTrajectory(data)
 
 
+def _capture_figures(monkeypatch) -> list:
+    """Record every figure passed to ``savefig`` (files are still written)."""
+    from matplotlib.figure import Figure
+
+    figures = []
+    savefig = Figure.savefig
+
+    def _savefig(fig, *args, **kwargs):
+        figures.append(fig)
+        return savefig(fig, *args, **kwargs)
+
+    monkeypatch.setattr(Figure, "savefig", _savefig)
+    return figures
+
+
 def _assert_files_generated(files: list[Path], output_dir: Path) -> None:
     assert files, "plotter returned no files"
     for path in files:
@@ -71,6 +86,133 @@ def test_time_series_plotter_renders(tmp_path):
     _assert_files_generated(files, tmp_path)
 
 
+def test_time_series_all_trajectories_use_one_collection_per_channel(
+    tmp_path, monkeypatch
+):
+    figures = _capture_figures(monkeypatch)
+    plotter = TimeSeriesPlotter(
+        plots=[{"channels": [0, 1], "transform": "abs", "trajectories": "all"}]
+    )
+    files = plotter.plot(_trajectory(n_traj=50), tmp_path, "png")
+    _assert_files_generated(files, tmp_path)
+
+    (ax,) = figures[0].axes
+    assert len(ax.lines) == 0
+    assert [len(c.get_segments()) for c in ax.collections] == [50, 50]
+
+
+def test_time_series_rasterizes_dense_overlays(tmp_path, monkeypatch):
+    from qphase_viz.plotters import evolution
+
+    figures = _capture_figures(monkeypatch)
+    monkeypatch.setattr(evolution, "_RASTERIZE_POINTS", 100)
+    plotter = TimeSeriesPlotter(plots=[{"channels": [0], "trajectories": "all"}])
+    plotter.plot(_trajectory(n_traj=1, n_steps=64), tmp_path, "svg")
+    plotter.plot(_trajectory(n_traj=4, n_steps=64), tmp_path, "svg")
+
+    sparse, dense = (fig.axes[0].collections[0] for fig in figures)
+    assert not sparse.get_rasterized()
+    assert dense.get_rasterized()
+
+
+def test_time_series_transforms_all_channels_at_once(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    traj = _trajectory()
+    plotter = TimeSeriesPlotter(
+        plots=[{"channels": [1, 0], "transform": "number", "trajectories": 2}]
+    )
+    plotter.plot(traj, tmp_path, "png")
+
+    lines = figures[0].axes[0].lines
+    y = traj.to_numpy()
+    for line, ch in zip(lines, [1, 0], strict=True):
+        assert line.get_label() == f"Ch{ch} n"
+        np.testing.assert_allclose(line.get_ydata(), np.abs(y[2, :, ch]) ** 2)
+
+
+def test_time_series_decimates_points_and_trajectories(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    plotter = TimeSeriesPlotter(
+        plots=[
+            {
+                "channels": [0],
+                "trajectories": "all",
+                "max_points": 10,
+                "max_trajectories": 4,
+            }
+        ]
+    )
+    plotter.plot(_trajectory(n_traj=9, n_steps=64), tmp_path, "png")
+
+    segments = figures[0].axes[0].collections[0].get_segments()
+    assert len(segments) == 3
+    assert all(len(seg) == 10 for seg in segments)
+
+
+def test_time_series_single_precision_downcasts_plot_data(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    plotter = TimeSeriesPlotter(
+        plots=[
+            {"channels": [0], "trajectories": 0, "precision": "single"},
+            {"channels": [0], "trajectories": 0, "filename": "double"},
+        ]
+    )
+    plotter.plot(_trajectory(), tmp_path, "png")
+
+    single, double = (fig.axes[0].lines[0].get_ydata() for fig in figures)
+    assert single.dtype == np.float32
+    assert double.dtype == np.float64
+    np.testing.assert_allclose(single, double, rtol=1e-6)
+
+
+def test_plotters_read_specs_without_serializing(tmp_path, monkeypatch):
+    """Rendering uses the validated spec attributes; no per-render dump."""
+    from pydantic import BaseModel
+
+    def _no_dump(self, *args, **kwargs):
+        raise AssertionError("model_dump called while rendering")
+
+    monkeypatch.setattr(BaseModel, "model_dump", _no_dump)
+    data = _trajectory()
+    files = TimeSeriesPlotter(plots=[{"channels": [0]}]).plot(data, tmp_path, "png")
+    files += PhasePlanePlotter(plots=[{"mode": "scatter"}]).plot(data, tmp_path, "png")
+    _assert_files_generated(files, tmp_path)
+
+
+def test_time_series_single_trajectory_matches_full_selection(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    traj = _trajectory(n_traj=5)
+    plotter = TimeSeriesPlotter(
+        plots=[
+            {"channels": [1], "trajectories": -1, "transform": "abs"},
+            {"channels": [1], "trajectories": 3, "precision": "single"},
+        ]
+    )
+    plotter.plot(traj, tmp_path, "png")
+
+    last, third = (fig.axes[0].lines[0].get_ydata() for fig in figures)
+    np.testing.assert_allclose(last, np.abs(traj.to_numpy()[-1, :, 1]))
+    assert third.dtype == np.float32
+    np.testing.assert_allclose(third, traj.to_numpy()[3, :, 1].real, rtol=1e-6)
+
+
+def test_time_series_draws_only_the_xlim_window(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    traj = _trajectory(n_steps=64)  # t = 0.0, 0.1, ..., 6.3
+    plotter = TimeSeriesPlotter(
+        plots=[
+            {"channels": [0], "trajectories": 0, "xlim": (1.05, 2.0)},
+            {"channels": [0], "trajectories": 0, "xlim": (-5.0, 100.0)},
+        ]
+    )
+    plotter.plot(traj, tmp_path, "png")
+
+    window, full = (fig.axes[0].lines[0] for fig in figures)
+    np.testing.assert_allclose(window.get_xdata(), traj.times[10:21])
+    np.testing.assert_allclose(window.get_ydata(), traj.to_numpy()[0, 10:21, 0].real)
+    assert len(full.get_xdata()) == 64
+
+
 def test_phase_plane_plotter_renders_hist2d(tmp_path):
     plotter = PhasePlanePlotter(
         plots=[{"channel_x": 0, "mode": "hist2d", "bins": 8}]
@@ -112,3 +254,355 @@ def test_parameter_evolution_plotter_ignores_non_aggregate(tmp_path):
         plots=[{"parameter": "omega_a", "metric": "psd_peak_freq", "channel": 0}]
     )
     assert plotter.plot(np.zeros((2, 4, 1)), tmp_path, "png") == []
+
+
+def test_phase_plane_re_im_split_matches_real_imag():
+    from qphase_viz.plotters.phase import _re_im
+
+    y = _trajectory().to_numpy().reshape(-1, 2).astype(np.complex64)
+    x, im = _re_im(y[:, 1])
+    assert x.dtype == np.float32
+    np.testing.assert_array_equal(x, y[:, 1].real)
+    np.testing.assert_array_equal(im, y[:, 1].imag)
+
+    x, im = _re_im(y[:, 0].real)
+    np.testing.assert_array_equal(x, y[:, 0].real)
+    assert not im.any()
+
+
+def test_power_spectrum_specs_share_one_psd_computation(tmp_path, monkeypatch):
+    """Specs differing only in styling reuse the raw-trajectory PSD."""
+    calls = []
+    axis = np.linspace(-1.0, 1.0, 16)
+
+    class _Result:
+        data = {"axis": axis, "psd": np.ones((16, 1))}
+
+    def _fake_analyze(data, channels, dt, spec):
+        calls.append((tuple(channels), dt))
+        return _Result()
+
+    monkeypatch.setattr(PowerSpectrumPlotter, "_analyze", staticmethod(_fake_analyze))
+    plotter = PowerSpectrumPlotter(
+        plots=[
+            {"channels": [0], "scale": "log", "filename": "a"},
+            {"channels": [0], "scale": "dB", "filename": "b"},
+            {"channels": [1], "scale": "dB", "filename": "c"},
+        ]
+    )
+    files = plotter.plot(_trajectory(), tmp_path, "png")
+    _assert_files_generated(files, tmp_path)
+    assert calls == [((0,), 0.1), ((1,), 0.1)]
+
+
+def test_plotters_resolve_input_once_per_plot_call(tmp_path, monkeypatch):
+    """The data-shape dispatch runs once per call, not once per spec."""
+    from qphase_viz.plotters import phase, spectrum
+
+    calls = []
+
+    def _counting(resolve):
+        def wrapper(data):
+            calls.append(resolve.__name__)
+            return resolve(data)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        spectrum, "_resolve_source", _counting(spectrum._resolve_source)
+    )
+    monkeypatch.setattr(
+        phase, "_resolve_distributions", _counting(phase._resolve_distributions)
+    )
+    axis = np.linspace(-1.0, 1.0, 16)
+    psd = {"psd": {"axis": axis, "psd": np.ones((16, 2)), "modes": [0, 1]}}
+    PowerSpectrumPlotter(
+        plots=[
+            {"channels": [0], "filename": "a"},
+            {"channels": [1], "filename": "b"},
+        ]
+    ).plot(psd, tmp_path, "png")
+
+    hist = {
+        "type": "2d_complex",
+        "hist": np.ones((4, 4)),
+        "xedges": np.linspace(0, 1, 5),
+        "yedges": np.linspace(0, 1, 5),
+    }
+    dist = {"dist": {"distributions": {"0": hist, 1: hist}}}
+    files = PhasePlanePlotter(plots=[{"channel_x": 0}, {"channel_x": 1}]).plot(
+        dist, tmp_path, "png"
+    )
+    _assert_files_generated(files, tmp_path)
+    assert calls == ["_resolve_source", "_resolve_distributions"]
+
+
+def test_phase_distributions_are_keyed_by_channel_once():
+    from qphase_viz.plotters.phase import _resolve_distributions
+
+    dists = {"0": "json", 0: "native", "2": "only-json", "re": "named"}
+    assert _resolve_distributions({"distributions": dists}) == {
+        0: "native",
+        2: "only-json",
+        "re": "named",
+    }
+
+
+def test_time_series_converts_trajectories_once_for_all_specs(tmp_path):
+    traj = _trajectory()
+    calls = []
+    to_numpy = traj.to_numpy
+
+    def counting_to_numpy():
+        calls.append(1)
+        return to_numpy()
+
+    traj.to_numpy = counting_to_numpy
+
+    files = TimeSeriesPlotter(
+        plots=[
+            {"channels": [0], "filename": "a"},
+            {"channels": [1], "transform": "abs", "filename": "b"},
+            {"channels": [0], "xlim": (0.5, 1.5), "filename": "c"},
+        ]
+    ).plot(traj, tmp_path, "png")
+
+    _assert_files_generated(files, tmp_path)
+    assert len(calls) == 1
+
+
+def test_power_spectrum_axis_scale_is_set_once_per_figure(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    axis = np.linspace(-1.0, 1.0, 32)
+    data = {"axis": axis, "psd": np.ones((32, 2)), "modes": [0, 1]}
+
+    plotter = PowerSpectrumPlotter(
+        plots=[
+            {"channels": [0, 1], "scale": "log", "filename": "log"},
+            {"channels": [7], "scale": "dB", "filename": "missing"},
+        ]
+    )
+    files = plotter.plot(data, tmp_path, "png")
+    _assert_files_generated(files, tmp_path)
+
+    log_ax, missing_ax = (fig.axes[0] for fig in figures)
+    assert log_ax.get_yscale() == "log"
+    assert len(log_ax.lines) == 2
+    assert missing_ax.get_ylabel() == "PSD [dB/Hz]"
+
+
+def test_power_spectrum_legend_is_a_declared_option(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    data = {"axis": np.linspace(-1.0, 1.0, 16), "psd": np.ones((16, 1))}
+    plotter = PowerSpectrumPlotter(
+        plots=[{"filename": "shown"}, {"legend": False, "filename": "hidden"}]
+    )
+    plotter.plot(data, tmp_path, "png")
+
+    shown, hidden = (fig.axes[0] for fig in figures)
+    assert shown.get_legend() is not None
+    assert hidden.get_legend() is None
+    assert "legend" in type(plotter.config.plots[1]).model_fields
+
+
+def test_plot_specs_reject_empty_axis_limits(tmp_path, monkeypatch):
+    import pytest
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError, match="must not be equal"):
+        TimeSeriesPlotter(plots=[{"xlim": (1.0, 1.0)}])
+    plotter = PhasePlanePlotter(plots=[{"ylim": (-1, 1)}])
+    assert plotter.config.plots[0].ylim == (-1.0, 1.0)
+
+    # Reversed limits invert the axis and window the same samples.
+    figures = _capture_figures(monkeypatch)
+    TimeSeriesPlotter(
+        plots=[
+            {"trajectories": 0, "xlim": (1.0, 3.0), "filename": "up"},
+            {"trajectories": 0, "xlim": (3.0, 1.0), "filename": "down"},
+        ]
+    ).plot(_trajectory(), tmp_path, "png")
+    up, down = (fig.axes[0] for fig in figures)
+    assert down.xaxis_inverted() and not up.xaxis_inverted()
+    drawn = down.lines[0].get_xdata()
+    assert len(drawn) < 64
+    assert np.array_equal(drawn, up.lines[0].get_xdata())
+
+
+def test_update_psd_lines_refreshes_artists_in_place():
+    import matplotlib.pyplot as plt
+    from qphase_viz.plotters.spectrum import update_psd_lines
+
+    fig, ax = plt.subplots()
+    f = np.linspace(-1.0, 1.0, 8)
+    lines = ax.plot(f, np.ones((8, 2)))
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+
+    new = np.arange(16.0).reshape(8, 2)
+    update_psd_lines(lines, new, background)
+    np.testing.assert_array_equal(lines[1].get_ydata(), new[:, 1])
+    update_psd_lines(lines, 2 * new)
+    np.testing.assert_array_equal(lines[0].get_ydata(), 2 * new[:, 0])
+
+
+def test_plotters_do_not_register_pyplot_figures(tmp_path):
+    import matplotlib.pyplot as plt
+
+    files = TimeSeriesPlotter(plots=[{"channels": [0, 1]}]).plot(
+        _trajectory(), tmp_path, "pdf"
+    )
+    _assert_files_generated(files, tmp_path)
+    assert plt.get_fignums() == []
+
+
+def test_png_compress_level_reaches_savefig(tmp_path, monkeypatch):
+    from matplotlib.figure import Figure
+
+    calls = []
+    monkeypatch.setattr(Figure, "savefig", lambda fig, *a, **kw: calls.append(kw))
+    plotter = TimeSeriesPlotter(plots=[{"png_compress_level": 1}])
+    plotter.plot(_trajectory(), tmp_path, "png")
+    plotter.plot(_trajectory(), tmp_path, "svg")
+
+    assert calls[0]["pil_kwargs"] == {"compress_level": 1}
+    assert "pil_kwargs" not in calls[1]
+
+
+def test_grid_layout_saves_all_specs_in_one_figure(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    plotter = PowerSpectrumPlotter(
+        plots=[
+            {"channels": [0], "scale": "log"},
+            {"channels": [1], "scale": "dB"},
+            {"channels": [0, 1], "scale": "linear"},
+        ],
+        grid=(2, 2),
+        grid_filename="psd_grid",
+    )
+    data = {"axis": np.linspace(-1.0, 1.0, 32), "psd": np.ones((32, 2))}
+    files = plotter.plot(data, tmp_path, "png")
+
+    assert files == [tmp_path / "psd_grid.png"]
+    _assert_files_generated(files, tmp_path)
+    (fig,) = figures
+    visible = [ax for ax in fig.axes if ax.axison]
+    assert [len(ax.lines) for ax in visible] == [1, 1, 2]
+    assert visible[0].get_yscale() == "log"
+
+
+def test_grid_layout_must_fit_every_spec():
+    import pytest
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError, match="2 axes for 3 plots"):
+        TimeSeriesPlotter(plots=[{}, {}, {}], grid=(1, 2))
+    with pytest.raises(ValidationError, match="positive"):
+        PhasePlanePlotter(plots=[{}], grid=(0, 1))
+
+
+def test_fixed_margins_skip_tight_bbox(tmp_path, monkeypatch):
+    from matplotlib.figure import Figure
+
+    calls = []
+    monkeypatch.setattr(
+        Figure, "savefig", lambda fig, *a, **kw: calls.append((fig, kw))
+    )
+    margins = (0.1, 0.95, 0.9, 0.15)
+    TimeSeriesPlotter(plots=[{}, {"margins": margins}]).plot(
+        _trajectory(), tmp_path, "png"
+    )
+
+    (_, tight_kw), (fig, fixed_kw) = calls
+    assert tight_kw["bbox_inches"] == "tight"
+    assert "bbox_inches" not in fixed_kw
+    params = fig.subplotpars
+    assert (params.left, params.right, params.top, params.bottom) == margins
+
+
+def test_reuse_figure_redraws_into_one_cached_figure(tmp_path, monkeypatch):
+    figures = _capture_figures(monkeypatch)
+    traj = _trajectory()
+    plotter = TimeSeriesPlotter(
+        plots=[
+            {"channels": [0], "reuse_figure": True, "filename": "a"},
+            {"channels": [1], "reuse_figure": True, "filename": "b"},
+            {"channels": [1], "reuse_figure": True, "dpi": 50, "filename": "c"},
+            {"channels": [1], "filename": "d"},
+        ]
+    )
+    files = plotter.plot(traj, tmp_path, "png")
+    _assert_files_generated(files, tmp_path)
+
+    a, b, c, d = figures
+    assert a is b
+    assert len(b.axes) == 1 and len(b.axes[0].lines) == 1
+    assert c is not a and d is not a and d is not c
+
+
+def test_background_save_failures_surface_on_wait(tmp_path):
+    import pytest
+    from pydantic import ValidationError
+    from qphase_viz.plotters.base import wait_for_saves
+
+    plotter = TimeSeriesPlotter(plots=[{"channels": [0], "background_save": True}])
+    plotter.plot(_trajectory(), tmp_path / "missing", "png")
+    with pytest.raises(FileNotFoundError):
+        wait_for_saves()
+    wait_for_saves()  # failures are reported once
+
+    with pytest.raises(ValidationError, match="reuse_figure"):
+        TimeSeriesPlotter(
+            plots=[{"channels": [0], "background_save": True, "reuse_figure": True}]
+        )
+
+
+def test_margins_must_be_ordered_fractions():
+    import pytest
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError, match="margins"):
+        TimeSeriesPlotter(plots=[{"margins": (0.9, 0.1, 0.9, 0.1)}])
+
+
+def test_invalid_channel_fails_before_creating_a_figure(tmp_path):
+    import matplotlib.pyplot as plt
+    import pytest
+
+    plotter = TimeSeriesPlotter(plots=[{"channels": [5]}])
+    with pytest.raises(IndexError):
+        plotter.plot(_trajectory(n_modes=2), tmp_path, "png")
+    assert plt.get_fignums() == []
+
+
+def test_psd_analyzer_import_is_resolved_once():
+    from qphase_sde.analyser import PsdAnalyzer
+    from qphase_viz.plotters import parameter, spectrum
+
+    for module in (parameter, spectrum):
+        classes = module._get_psd_analyzer_classes()
+        assert classes[0] is PsdAnalyzer
+        assert module._get_psd_analyzer_classes() is classes
+
+
+def test_output_paths_are_planned_once_and_collisions_logged(tmp_path, caplog):
+    specs = [
+        {"channels": [0]},
+        {"channels": [1]},
+        {"channels": [0], "transform": "abs"},
+    ]
+    with caplog.at_level("WARNING", logger="qphase_viz.plotters.base"):
+        files = TimeSeriesPlotter(plots=specs).plot(_trajectory(), tmp_path, "png")
+
+    assert files == [
+        tmp_path / "time_series_real.png",
+        tmp_path / "time_series_real.png",
+        tmp_path / "time_series_abs.png",
+    ]
+    messages = [
+        r.getMessage() for r in caplog.records if r.name == "qphase_viz.plotters.base"
+    ]
+    assert messages == [
+        f"2 plots are saved to {tmp_path / 'time_series_real.png'}; "
+        "set 'filename' to keep them apart"
+    ]